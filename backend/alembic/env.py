@@ -14,7 +14,10 @@ load_dotenv()
 
 # Import models
 from app.database import Base
-from app.models import User, Event, Registration, Announcement, PageContent
+from app.models import (
+    User, Event, EventSeries, EventSeriesException, Registration, Announcement,
+    AnnouncementBroadcast, PageContent, RefreshToken, ReminderDispatch, EmailOutbox, SearchDocument
+)
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,41 @@
+"""Add reminder dispatch progress and scheduling indexes
+
+Revision ID: a7c9e1f3b568
+Revises: f6b8d0e2a457
+Create Date: 2026-10-19 19:22:47.118350
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c9e1f3b568'
+down_revision: Union[str, None] = 'f6b8d0e2a457'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('reminder_dispatches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('last_registration_id', sa.Integer(), nullable=False),
+    sa.Column('sent_count', sa.Integer(), nullable=False),
+    sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id', 'kind', name='uq_reminder_dispatch_event_kind')
+    )
+    op.create_index('ix_events_active_date', 'events', ['is_active', 'event_date'], unique=False)
+    op.create_index('ix_registrations_event_id_id', 'registrations', ['event_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_registrations_event_id_id', table_name='registrations')
+    op.drop_index('ix_events_active_date', table_name='events')
+    op.drop_table('reminder_dispatches')
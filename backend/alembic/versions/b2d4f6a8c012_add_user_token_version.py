@@ -0,0 +1,26 @@
+"""Add users.token_version
+
+Revision ID: b2d4f6a8c012
+Revises: a1c3e5f7b901
+Create Date: 2026-10-19 11:40:05.518273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d4f6a8c012'
+down_revision: Union[str, None] = 'a1c3e5f7b901'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
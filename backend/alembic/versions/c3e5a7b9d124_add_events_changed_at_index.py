@@ -0,0 +1,31 @@
+"""Add index for event delta sync
+
+Revision ID: c3e5a7b9d124
+Revises: b2d4f6a8c012
+Create Date: 2026-10-19 14:05:12.304118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d124'
+down_revision: Union[str, None] = 'b2d4f6a8c012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_events_changed_at',
+        'events',
+        [sa.text('coalesce(updated_at, created_at)'), 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_changed_at', table_name='events')
@@ -0,0 +1,26 @@
+"""Add registration check-in time
+
+Revision ID: d0f2b4c6e891
+Revises: c9e1a3b5d780
+Create Date: 2026-10-19 23:48:06.731542
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0f2b4c6e891'
+down_revision: Union[str, None] = 'c9e1a3b5d780'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('registrations', sa.Column('checked_in_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('registrations', 'checked_in_at')
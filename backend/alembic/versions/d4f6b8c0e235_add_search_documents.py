@@ -0,0 +1,77 @@
+"""Add search_documents full-text index
+
+Revision ID: d4f6b8c0e235
+Revises: c3e5a7b9d124
+Create Date: 2026-10-19 15:22:47.118403
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f6b8c0e235'
+down_revision: Union[str, None] = 'c3e5a7b9d124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PG_DOCUMENT_VECTOR = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(body, '')), 'B')"
+)
+
+SQLITE_FTS = (
+    "CREATE VIRTUAL TABLE search_documents_fts USING fts5("
+    "title, body, kind, content='search_documents', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents WHEN new.is_visible BEGIN "
+    "INSERT INTO search_documents_fts(rowid, title, body, kind) VALUES (new.id, new.title, new.body, new.kind); END",
+    "CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents WHEN old.is_visible BEGIN "
+    "INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body, kind) "
+    "VALUES ('delete', old.id, old.title, old.body, old.kind); END",
+    "CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body, kind) "
+    "SELECT 'delete', old.id, old.title, old.body, old.kind WHERE old.is_visible; "
+    "INSERT INTO search_documents_fts(rowid, title, body, kind) "
+    "SELECT new.id, new.title, new.body, new.kind WHERE new.is_visible; END",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'search_documents',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('ref_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('is_visible', sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('kind', 'ref_id', name='uq_search_documents_kind_ref')
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute(f"CREATE INDEX ix_search_documents_tsv ON search_documents USING gin (({PG_DOCUMENT_VECTOR}))")
+    elif dialect == 'sqlite':
+        for statement in SQLITE_FTS:
+            op.execute(statement)
+
+    # Backfill existing content
+    newline = "char(10)" if dialect == 'sqlite' else "chr(10)"
+    op.execute(
+        "INSERT INTO search_documents (kind, ref_id, title, body, is_visible) "
+        f"SELECT 'event', id, title, coalesce(description, '') || {newline} || coalesce(location, ''), is_active "
+        "FROM events"
+    )
+    op.execute(
+        "INSERT INTO search_documents (kind, ref_id, title, body, is_visible) "
+        "SELECT 'announcement', id, title, content, coalesce(is_published, true) FROM announcements"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS search_documents_fts")
+    op.drop_table('search_documents')
@@ -0,0 +1,30 @@
+"""Add broadcast attempts
+
+Revision ID: e1a3c5d7f902
+Revises: d0f2b4c6e891
+Create Date: 2026-10-20 10:12:43.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a3c5d7f902'
+down_revision: Union[str, None] = 'd0f2b4c6e891'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('announcement_broadcasts', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('announcement_broadcasts', sa.Column('last_error', sa.String(), nullable=True))
+    op.add_column('announcement_broadcasts', sa.Column('failed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('announcement_broadcasts', 'failed_at')
+    op.drop_column('announcement_broadcasts', 'last_error')
+    op.drop_column('announcement_broadcasts', 'attempts')
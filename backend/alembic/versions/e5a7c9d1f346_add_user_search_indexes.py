@@ -0,0 +1,40 @@
+"""Add indexes for admin user search
+
+Revision ID: e5a7c9d1f346
+Revises: d4f6b8c0e235
+Create Date: 2026-10-19 16:48:31.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9d1f346'
+down_revision: Union[str, None] = 'd4f6b8c0e235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_COLUMNS = ('email', 'full_name', 'student_id', 'national_id')
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=False)
+    op.create_index('ix_users_full_name_lower', 'users', [sa.text('lower(full_name)')], unique=False)
+    op.create_index('ix_users_national_id_lower', 'users', [sa.text('lower(national_id)')], unique=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in TRIGRAM_COLUMNS:
+            op.execute(f'CREATE INDEX ix_users_{column}_trgm ON users USING gin (lower({column}) gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in TRIGRAM_COLUMNS:
+            op.drop_index(f'ix_users_{column}_trgm', table_name='users')
+    op.drop_index('ix_users_national_id_lower', table_name='users')
+    op.drop_index('ix_users_full_name_lower', table_name='users')
+    op.drop_index('ix_users_email_lower', table_name='users')
@@ -0,0 +1,69 @@
+"""Add recurring event series
+
+Revision ID: f6b8d0e2a457
+Revises: e5a7c9d1f346
+Create Date: 2026-10-19 18:05:12.640391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b8d0e2a457'
+down_revision: Union[str, None] = 'e5a7c9d1f346'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('event_series',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=False),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('image_url', sa.String(length=255), nullable=True),
+    sa.Column('registration_closes_minutes', sa.Integer(), nullable=False),
+    sa.Column('starts_at', sa.DateTime(), nullable=False),
+    sa.Column('frequency', sa.String(length=10), nullable=False),
+    sa.Column('interval', sa.Integer(), nullable=False),
+    sa.Column('weekdays', sa.String(length=20), nullable=True),
+    sa.Column('until', sa.DateTime(), nullable=True),
+    sa.Column('count', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('creator_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['creator_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_event_series_id'), 'event_series', ['id'], unique=False)
+    op.create_table('event_series_exceptions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('series_id', sa.Integer(), nullable=False),
+    sa.Column('occurrence_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['series_id'], ['event_series.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('series_id', 'occurrence_at', name='uq_event_series_exception')
+    )
+    # Plain ADD COLUMN: batch mode would rebuild events on SQLite and lose the
+    # expression index ix_events_changed_at. SQLite does not enforce the FK anyway.
+    op.add_column('events', sa.Column('series_id', sa.Integer(), nullable=True))
+    op.add_column('events', sa.Column('occurrence_at', sa.DateTime(), nullable=True))
+    if op.get_bind().dialect.name != 'sqlite':
+        op.create_foreign_key('fk_events_series_id', 'events', 'event_series', ['series_id'], ['id'])
+    op.create_index('uq_events_series_occurrence', 'events', ['series_id', 'occurrence_at'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_events_series_occurrence', table_name='events')
+    if op.get_bind().dialect.name != 'sqlite':
+        op.drop_constraint('fk_events_series_id', 'events', type_='foreignkey')
+    op.drop_column('events', 'occurrence_at')
+    op.drop_column('events', 'series_id')
+    op.drop_table('event_series_exceptions')
+    op.drop_index(op.f('ix_event_series_id'), table_name='event_series')
+    op.drop_table('event_series')
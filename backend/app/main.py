@@ -1,8 +1,18 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, Base
+from app.database import engine, Base, SessionLocal
 from app.models import User, Event, Registration, Announcement, PageContent
-from app.routes import auth, events, registrations, admin_users, content, users, profile
+from app.routes import auth, events, registrations, admin_users, content, users, profile, metrics, bundle, search, series
+from app.utils.auth import configure_bcrypt
+from app.utils.email_templates import load_email_templates
+from app.services.token_service import purge_expired_refresh_tokens_periodically
+from app.utils.token_versions import sync_token_versions_periodically
+from app.services.reminder_service import send_event_reminders_periodically, REMINDERS_ENABLED
+from app.services.email import email_outbox_worker
+from app.services.email_outbox import flush_email_outbox_periodically
+from app.services.checkin_service import flush_check_ins_periodically
+from app.services.broadcast_service import send_announcement_broadcasts_periodically, BROADCASTS_ENABLED
 
 # --- New Imports for Static File Serving (make sure these are present)
 from fastapi.staticfiles import StaticFiles 
@@ -20,6 +30,39 @@ app = FastAPI(
 )
 
 
+@app.on_event("startup")
+def calibrate_password_hashing():
+    # Pick the bcrypt cost for this hardware before the first login arrives
+    rounds = configure_bcrypt()
+    print(f"[AUTH] bcrypt cost factor: {rounds}")
+
+
+@app.on_event("startup")
+def compile_email_templates():
+    # Compile once up front so the first mail of each kind is not slower
+    print(f"[EMAIL] Compiled {load_email_templates()} email templates")
+
+
+_background_tasks = []
+
+@app.on_event("startup")
+async def start_background_jobs():
+    _background_tasks.append(asyncio.create_task(purge_expired_refresh_tokens_periodically(SessionLocal)))
+    _background_tasks.append(asyncio.create_task(sync_token_versions_periodically(SessionLocal)))
+    _background_tasks.append(asyncio.create_task(flush_email_outbox_periodically(email_outbox_worker(SessionLocal))))
+    _background_tasks.append(asyncio.create_task(flush_check_ins_periodically(SessionLocal)))
+    if REMINDERS_ENABLED:
+        _background_tasks.append(asyncio.create_task(send_event_reminders_periodically(SessionLocal)))
+    if BROADCASTS_ENABLED:
+        _background_tasks.append(asyncio.create_task(send_announcement_broadcasts_periodically(SessionLocal)))
+
+@app.on_event("shutdown")
+async def stop_background_jobs():
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+
+
 # Read allowed origins from env for local testing / deployments
 # Example: ALLOW_ORIGINS=http://localhost:5173,http://127.0.0.1:5173,https://e-commerceclubada.xyz
 _raw_origins = os.getenv('ALLOW_ORIGINS', '').strip()
@@ -55,6 +98,11 @@ app.include_router(registrations.router, prefix="/api/registrations") # Recommen
 app.include_router(admin_users.router, prefix="/api/admin") # Recommended: Add prefixes for clarity/versioning
 app.include_router(content.router, prefix="/api/content") # Recommended: Add prefixes for clarity/versioning
 app.include_router(users.router, prefix="/api/users")
+app.include_router(profile.router) # prefix "/api/profile" is set on the router
+app.include_router(metrics.router, prefix="/api/admin/metrics")
+app.include_router(bundle.router, prefix="/api/bundle")
+app.include_router(search.router, prefix="/api/search")
+app.include_router(series.router, prefix="/api/series")
 
 # 1. Define the BASE_DIR (one level up from 'backend')
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
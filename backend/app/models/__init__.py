@@ -1,4 +1,9 @@
 from .user import User
 from .event import Event
+from .event_series import EventSeries, EventSeriesException
 from .registration import Registration
-from .content import Announcement, PageContent
\ No newline at end of file
+from .content import Announcement, AnnouncementBroadcast, PageContent
+from .refresh_token import RefreshToken
+from .reminder import ReminderDispatch
+from .email_outbox import EmailOutbox
+from .search_document import SearchDocument
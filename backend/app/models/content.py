@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -13,6 +13,28 @@ class Announcement(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+class AnnouncementBroadcast(Base):
+    """
+    Email of one announcement to every active member, sent in user id order.
+    `last_user_id` is saved after each provider batch so a restart resumes there;
+    `lease_expires_at` keeps two workers from sending it at the same time.
+    `attempts` counts rejections of the current batch; at the limit the
+    broadcast stops with `failed_at` set.
+    """
+    __tablename__ = "announcement_broadcasts"
+
+    id = Column(Integer, primary_key=True)
+    announcement_id = Column(Integer, ForeignKey("announcements.id", ondelete="CASCADE"), unique=True, nullable=False)
+    requested_by = Column(Integer, nullable=False)
+    last_user_id = Column(Integer, nullable=False, default=0)
+    sent_count = Column(Integer, nullable=False, default=0)
+    lease_expires_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=True)
+    failed_at = Column(DateTime, nullable=True)
+
 class PageContent(Base):
     __tablename__ = "page_content"
 
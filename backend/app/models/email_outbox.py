@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class EmailOutbox(Base):
+    """
+    A message that could not be handed to the email provider when it was sent
+    (provider down or circuit open). The outbox worker retries it with growing
+    delays; `sent_at` or `failed_at` is set once it is done either way.
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    html = Column(Text, nullable=False)
+    text = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime, nullable=True)
+    failed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Due messages: WHERE sent_at IS NULL AND failed_at IS NULL AND next_attempt_at <= now
+        Index("ix_email_outbox_pending", sent_at, failed_at, next_attempt_at),
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, Text, DateTime, Boolean, Integer, ForeignKey
+from sqlalchemy import String, Text, DateTime, Boolean, Integer, ForeignKey, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -34,3 +34,16 @@ class Event(Base):
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), onupdate=func.now()
     )
+
+    # Set on occurrences of a recurring series that were materialized; occurrence_at
+    # is the scheduled start and stays put even if the admin moves the event
+    series_id: Mapped[int | None] = mapped_column(ForeignKey("event_series.id"), nullable=True)
+    occurrence_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+# Delta sync (/api/events/changes) walks events in (last change, id) order
+Index("ix_events_changed_at", func.coalesce(Event.updated_at, Event.created_at), Event.id)
+# Upcoming active events by date (listings, reminder scheduling)
+Index("ix_events_active_date", Event.is_active, Event.event_date)
+# An occurrence is materialized at most once
+Index("uq_events_series_occurrence", Event.series_id, Event.occurrence_at, unique=True)
@@ -0,0 +1,63 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Text, DateTime, Boolean, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class EventSeries(Base):
+    """
+    A recurring event: a template plus a recurrence rule. Occurrences are computed
+    on the fly; an occurrence only becomes an `Event` row (series_id, occurrence_at)
+    once someone registers for it or an admin edits it.
+    """
+    __tablename__ = "event_series"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+
+    # Template for every occurrence
+    title: Mapped[str] = mapped_column(String(length=255), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    location: Mapped[str] = mapped_column(String(length=255), nullable=False)
+    capacity: Mapped[int] = mapped_column(Integer, nullable=False)
+    image_url: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
+    # Registration closes this many minutes before each occurrence starts
+    registration_closes_minutes: Mapped[int] = mapped_column(Integer, nullable=False, default=60)
+
+    # Rule: first occurrence, "daily" or "weekly" every `interval` days/weeks,
+    # optionally on several weekdays ("0,2" = Monday and Wednesday), ending
+    # after `until` or `count` occurrences (or never)
+    starts_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    frequency: Mapped[str] = mapped_column(String(length=10), nullable=False)
+    interval: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    weekdays: Mapped[str | None] = mapped_column(String(length=20), nullable=True)
+    until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    creator_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
+
+    exceptions: Mapped[list["EventSeriesException"]] = relationship(
+        back_populates="series", cascade="all, delete-orphan", order_by="EventSeriesException.occurrence_at"
+    )
+
+
+class EventSeriesException(Base):
+    """A cancelled occurrence of a series (identified by its scheduled start)."""
+    __tablename__ = "event_series_exceptions"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    series_id: Mapped[int] = mapped_column(ForeignKey("event_series.id", ondelete="CASCADE"), nullable=False)
+    occurrence_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    series: Mapped[EventSeries] = relationship(back_populates="exceptions")
+
+    __table_args__ = (
+        UniqueConstraint(series_id, occurrence_at, name="uq_event_series_exception"),
+    )
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from app.database import Base
+
+class RefreshToken(Base):
+    """
+    Long-lived credential used to mint new access tokens without a password check.
+    Only the SHA-256 of the token is stored; each token is single-use (rotated on refresh).
+    """
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String(length=64), unique=True, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
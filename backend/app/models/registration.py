@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.utils.tickets import sign_ticket
 
 class Registration(Base):
     __tablename__ = "registrations"
@@ -12,7 +13,18 @@ class Registration(Base):
     registered_at = Column(DateTime(timezone=True), server_default=func.now())
     is_cancelled = Column(Boolean, default=False)
     cancelled_at = Column(DateTime, nullable=True)
+    # Set by the check-in desk when the ticket is scanned at the door
+    checked_in_at = Column(DateTime, nullable=True)
     
     # Relationships
     user = relationship("User", backref="registrations")
-    event = relationship("Event", backref="registrations")
\ No newline at end of file
+    event = relationship("Event", backref="registrations")
+
+    @property
+    def ticket(self) -> str:
+        """Signed ticket to show at the door (as a QR code)"""
+        return sign_ticket(self.id, self.event_id, self.user_id)
+
+
+# Walking an event's registrants in id order (reminders, exports) is a range scan
+Index("ix_registrations_event_id_id", Registration.event_id, Registration.id)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from app.database import Base
+
+class ReminderDispatch(Base):
+    """
+    Progress of one reminder wave ("24h" or "1h") for one event.
+    Registrations are mailed in id order and `last_registration_id` is saved after
+    every message, so a restarted worker continues where the last one stopped.
+    `lease_expires_at` keeps two workers from sending the same wave at once.
+    """
+    __tablename__ = "reminder_dispatches"
+
+    id = Column(Integer, primary_key=True)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String(length=10), nullable=False)
+    last_registration_id = Column(Integer, nullable=False, default=0)
+    sent_count = Column(Integer, nullable=False, default=0)
+    lease_expires_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint(event_id, kind, name="uq_reminder_dispatch_event_kind"),
+    )
@@ -0,0 +1,56 @@
+from sqlalchemy import Column, Integer, String, Text, Boolean, DDL, UniqueConstraint, event
+from app.database import Base
+
+# Title is weighted above body. Shared by the index DDL and the search query so
+# Postgres can match the expression to the GIN index.
+PG_DOCUMENT_VECTOR = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(body, '')), 'B')"
+)
+
+
+# External-content FTS5 table mirroring the *visible* documents only, so searches
+# never have to join back to filter. `kind` is indexed to allow kind:event filters.
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE search_documents_fts USING fts5("
+    "title, body, kind, content='search_documents', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents WHEN new.is_visible BEGIN "
+    "INSERT INTO search_documents_fts(rowid, title, body, kind) VALUES (new.id, new.title, new.body, new.kind); END",
+    "CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents WHEN old.is_visible BEGIN "
+    "INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body, kind) "
+    "VALUES ('delete', old.id, old.title, old.body, old.kind); END",
+    "CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body, kind) "
+    "SELECT 'delete', old.id, old.title, old.body, old.kind WHERE old.is_visible; "
+    "INSERT INTO search_documents_fts(rowid, title, body, kind) "
+    "SELECT new.id, new.title, new.body, new.kind WHERE new.is_visible; END",
+)
+
+
+class SearchDocument(Base):
+    """
+    Denormalized searchable text for events and announcements, kept in sync by
+    EventService and ContentService writes. Indexed with a tsvector GIN index on
+    Postgres and mirrored into an FTS5 table on SQLite.
+    """
+    __tablename__ = "search_documents"
+    __table_args__ = (UniqueConstraint("kind", "ref_id", name="uq_search_documents_kind_ref"),)
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(length=20), nullable=False)  # "event" | "announcement"
+    ref_id = Column(Integer, nullable=False)
+    title = Column(String(length=255), nullable=False)
+    body = Column(Text, nullable=False, default="")
+    is_visible = Column(Boolean, nullable=False, default=True)
+
+
+_table = SearchDocument.__table__
+
+event.listen(_table, "after_create", DDL(
+    f"CREATE INDEX ix_search_documents_tsv ON search_documents USING gin (({PG_DOCUMENT_VECTOR}))"
+).execute_if(dialect="postgresql"))
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(_table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+event.listen(_table, "after_drop", DDL("DROP TABLE IF EXISTS search_documents_fts").execute_if(dialect="sqlite"))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, UniqueConstraint, Index, DDL, event
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -30,6 +30,8 @@ class User(Base):
 
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)
+    # Embedded in access tokens as "ver"; bumped to revoke every token issued so far
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -46,3 +48,19 @@ class User(Base):
         # Note: If your MySQL version supports functional indexes, a better approach might exist, 
         # but this is the most common cross-dialect solution.
     )
+
+
+# Admin user search (UserService.search_users). Normalized-prefix indexes work on
+# every backend: a prefix becomes a range scan on lower(column).
+Index("ix_users_email_lower", func.lower(User.email))
+Index("ix_users_full_name_lower", func.lower(User.full_name))
+Index("ix_users_national_id_lower", func.lower(User.national_id))
+
+# Postgres additionally gets trigram indexes, so substring matches stay indexed
+PG_TRIGRAM_COLUMNS = ("email", "full_name", "student_id", "national_id")
+
+event.listen(User.__table__, "after_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
+for _column in PG_TRIGRAM_COLUMNS:
+    event.listen(User.__table__, "after_create", DDL(
+        f"CREATE INDEX ix_users_{_column}_trgm ON users USING gin (lower({_column}) gin_trgm_ops)"
+    ).execute_if(dialect="postgresql"))
@@ -1,12 +1,21 @@
 # routes/admin_users.py
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import csv
+import io
+from fastapi import APIRouter, Depends, File, HTTPException, status, Query, Response, UploadFile
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.database import get_db
 from app.models.user import User
-from app.schemas.user import UserResponse
-from app.utils.dependencies import get_current_admin
-from pydantic import BaseModel, Field
+from app.schemas.user import UserResponse, UserSearchResponse, UserImportResponse
+from app.services.user_service import (
+    UserService, USER_EXPORT_COLUMNS, IMPORT_COLUMNS, IMPORT_REQUIRED_COLUMNS
+)
+from app.utils.export import export_response, parse_columns
+from app.utils.dependencies import get_current_admin, get_admin_principal, Principal
+from app.utils.token_versions import bump_token_versions
+from pydantic import BaseModel, Field, model_validator
+
+MAX_BULK_IDS = 1000
 
 # Define a Schema for the Admin actions
 class AdminRoleUpdate(BaseModel):
@@ -15,26 +24,183 @@ class AdminRoleUpdate(BaseModel):
 class AdminActiveUpdate(BaseModel):
     is_active: bool = Field(..., description="The new active status for the user.")
 
+class AdminUserFilter(BaseModel):
+    """Same criteria as GET /search; at least one is required."""
+    q: Optional[str] = Field(None, max_length=100)
+    is_active: Optional[bool] = None
+    is_admin: Optional[bool] = None
+
+    @model_validator(mode='after')
+    def require_criteria(self):
+        if not (self.q or "").strip() and self.is_active is None and self.is_admin is None:
+            raise ValueError("filter needs at least one criterion")
+        return self
+
+class AdminUserSelection(BaseModel):
+    """Target users either by id or by filter, not both."""
+    user_ids: Optional[List[int]] = Field(None, min_length=1, max_length=MAX_BULK_IDS)
+    filter: Optional[AdminUserFilter] = None
+
+    @model_validator(mode='after')
+    def require_one_target(self):
+        if (self.user_ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of user_ids or filter")
+        return self
+
+class AdminBulkRoleUpdate(AdminUserSelection):
+    is_admin: bool = Field(..., description="The new administrative status for the users.")
+
+class AdminBulkActiveUpdate(AdminUserSelection):
+    is_active: bool = Field(..., description="The new active status for the users.")
+
+class AdminBulkResult(BaseModel):
+    updated: int
+    user_ids: List[int]   # users whose value actually changed
+
 
 router = APIRouter(prefix="/users", tags=["Admin - Users"])
 
 @router.get("/", response_model=List[UserResponse])
 async def list_all_users(
+    response: Response,
+    after: Optional[int] = Query(None, ge=0, description="X-Next-Cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=100),
     # Only an admin can access this route
-    current_admin: User = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_admin_principal),
     db: Session = Depends(get_db)
 ):
     """
-    Retrieve a list of all users in the system. (Admin only)
+    Retrieve the users in the system one page at a time, ordered by id. (Admin only)
+    The X-Next-Cursor header, absent on the last page, is the `after` of the next one.
     """
-    users = db.query(User).all()
+    users, next_cursor = UserService.search_users(db, after=after, limit=limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
     # We use UserResponse for security to prevent sending sensitive data like hashed_password
     return users
 
+@router.get("/search", response_model=UserSearchResponse)
+async def search_users(
+    q: Optional[str] = Query(None, max_length=100, description="Start of an email, name, student ID or national ID"),
+    is_active: Optional[bool] = Query(None),
+    is_admin: Optional[bool] = Query(None),
+    after: Optional[int] = Query(None, ge=0, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=100),
+    current_admin: Principal = Depends(get_admin_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Search users server-side with keyset pagination. (Admin only)
+    """
+    users, next_cursor = UserService.search_users(
+        db, q=q, is_active=is_active, is_admin=is_admin, after=after, limit=limit
+    )
+    return {"users": users, "next_cursor": next_cursor}
+
+@router.get("/export")
+async def export_users(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    columns: Optional[str] = Query(None, description=f"Comma-separated subset of: {', '.join(USER_EXPORT_COLUMNS)}"),
+    is_active: Optional[bool] = Query(None),
+    is_admin: Optional[bool] = Query(None),
+    current_admin: Principal = Depends(get_admin_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream the member list as CSV or NDJSON, with constant memory use. (Admin only)
+    """
+    try:
+        selected = parse_columns(columns, list(USER_EXPORT_COLUMNS))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    rows = UserService.export_rows(db, selected, is_active=is_active, is_admin=is_admin)
+    return export_response(rows, selected, format, "members")
+
+@router.post("/import", response_model=UserImportResponse)
+def import_users(
+    file: UploadFile = File(..., description=f"UTF-8 CSV with a header row; columns: {', '.join(IMPORT_COLUMNS)}"),
+    dry_run: bool = Query(False, description="Validate and check duplicates without creating anyone"),
+    current_admin: Principal = Depends(get_admin_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Create many users from a CSV roster (up to IMPORT_MAX_ROWS rows). (Admin only)
+    Rows are validated like registration; invalid or duplicate rows are listed in
+    `errors` with their line number and the remaining rows are still created.
+    """
+    # A plain def: hashing a roster takes seconds, so keep it off the event loop
+    reader = csv.DictReader(io.TextIOWrapper(file.file, encoding="utf-8-sig", newline=""))
+    try:
+        missing = [name for name in IMPORT_REQUIRED_COLUMNS if name not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Missing CSV columns: {', '.join(missing)}")
+        return UserService.import_users(
+            db, ((reader.line_num, row) for row in reader), dry_run=dry_run
+        )
+    except (ValueError, csv.Error) as e:
+        # UnicodeDecodeError is a ValueError too
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+def _apply_bulk_update(db: Session, selection: AdminUserSelection, values: dict, current_admin: User, self_error: str) -> dict:
+    """Shared by the bulk endpoints: same self-protection as the single-user routes."""
+    # Only the "taking away" direction needs protecting
+    protect_self = not all(values.values())
+    if protect_self and selection.user_ids is not None and current_admin.id in selection.user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=self_error
+        )
+    criteria = selection.filter.model_dump() if selection.filter else {}
+    changed = UserService.bulk_update(
+        db,
+        values,
+        user_ids=selection.user_ids,
+        # A filter may match the calling admin; leave them out instead of failing
+        exclude_id=current_admin.id if protect_self else None,
+        **criteria
+    )
+    return {"updated": len(changed), "user_ids": changed}
+
+@router.patch("/bulk/role", response_model=AdminBulkResult)
+async def bulk_update_user_role(
+    role_update: AdminBulkRoleUpdate,
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Grant or revoke admin privileges for many users in one statement. (Admin only)
+    Changed users' tokens are revoked.
+    """
+    return _apply_bulk_update(
+        db, role_update, {"is_admin": role_update.is_admin}, current_admin,
+        "Cannot revoke your own admin privileges."
+    )
+
+@router.patch("/bulk/active", response_model=AdminBulkResult)
+async def bulk_update_user_active_status(
+    active_update: AdminBulkActiveUpdate,
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Activate or deactivate many users in one statement. (Admin only)
+    Changed users' tokens are revoked.
+    """
+    return _apply_bulk_update(
+        db, active_update, {"is_active": active_update.is_active}, current_admin,
+        "Cannot deactivate your own account."
+    )
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user_by_id(
     user_id: int,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_admin_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -72,6 +238,9 @@ async def update_user_role(
             detail="Cannot revoke your own admin privileges."
         )
 
+    # Role changes revoke existing tokens so the new role shows up in the claims
+    if user.is_admin != role_update.is_admin:
+        bump_token_versions(db, [user.id])
     user.is_admin = role_update.is_admin
     db.commit()
     db.refresh(user)
@@ -101,6 +270,9 @@ async def update_user_active_status(
             detail="Cannot deactivate your own account."
         )
 
+    # Deactivation (or reactivation) revokes existing tokens
+    if user.is_active != active_update.is_active:
+        bump_token_versions(db, [user.id])
     user.is_active = active_update.is_active
     db.commit()
     db.refresh(user)
@@ -2,44 +2,94 @@
 from fastapi import BackgroundTasks
 from app.services.email import send_registration_confirmation 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from typing import Optional
 from app.database import get_db
 # 1. UPDATED IMPORTS: Assuming UserCreate is now in app.schemas.auth
 # 2. Check if UserResponse, UserUpdate, PasswordChange are in app.schemas.auth or app.schemas.user
 # If they are in schemas.user, keep the import:
 from app.schemas.user import UserCreate, UserBase, UserResponse, UserUpdate, PasswordChange
-from app.schemas.auth import LoginRequest, LoginResponse
+from app.schemas.auth import LoginRequest, LoginResponse, RefreshRequest, TokenResponse
 from app.models.user import User
-from app.utils.auth import hash_password, verify_password, create_access_token
+from app.utils.auth import hash_password, verify_password, needs_rehash, create_access_token
 from app.utils.dependencies import get_current_user, get_current_admin
+from app.utils.rate_limit import login_rate_limit, register_rate_limit
+from app.services.token_service import TokenService
 from datetime import timedelta, datetime
 
 router = APIRouter(tags=["Authentication"])
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
-    """Register a new user with student_id and national_id validation."""
+# (column, error message) in the order conflicts are reported
+_UNIQUE_FIELDS = (
+    ("email", "Email already registered"),
+    ("student_id", "Student ID already registered"),
+    ("national_id", "National ID already registered"),
+)
+
+# Fragments of database error messages identifying each unique constraint
+# (SQLite reports "users.<column>", Postgres the constraint/index name or "Key (<column>)")
+_CONSTRAINT_MARKERS = {
+    "email": ("users.email", "ix_users_email", "(email)"),
+    "student_id": ("users.student_id", "uq_student_id_conditional", "(student_id"),
+    "national_id": ("users.national_id", "uq_national_id_conditional", "(national_id"),
+}
+
+def _find_registration_conflict(db: Session, user_data: UserCreate) -> Optional[str]:
+    """Return the error message for the first unique field already taken, if any."""
+    conditions = [User.email == user_data.email]
+    # NULL ids must not match other users' NULL ids
+    if user_data.student_id:
+        conditions.append(User.student_id == user_data.student_id)
+    if user_data.national_id:
+        conditions.append(User.national_id == user_data.national_id)
     
-    # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+    rows = db.execute(
+        select(User.email, User.student_id, User.national_id)
+        .where(or_(*conditions))
+        .limit(3)
+    ).all()
     
-    # Check for existing student_id
-    if db.query(User).filter(User.student_id == user_data.student_id).first():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Student ID already registered"
-        )
+    for field, message in _UNIQUE_FIELDS:
+        value = getattr(user_data, field)
+        if value and any(getattr(row, field) == value for row in rows):
+            return message
+    return None
 
-    # Check for existing national_id
-    if db.query(User).filter(User.national_id == user_data.national_id).first():
+def _integrity_error_message(error: IntegrityError) -> str:
+    """Map a unique-constraint violation on users to the matching error message."""
+    text = str(error.orig)
+    for field, message in _UNIQUE_FIELDS:
+        if any(marker in text for marker in _CONSTRAINT_MARKERS[field]):
+            return message
+    return "User already registered"
+
+def _access_token_for(user: User) -> str:
+    return create_access_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "is_admin": user.is_admin, # Ensure is_admin is included for protected routes
+            "ver": user.token_version # Lets claims-based routes detect revoked tokens
+        }
+    )
+
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(register_rate_limit)],
+)
+async def register(user_data: UserCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Register a new user with student_id and national_id validation."""
+    
+    # Check email, student_id and national_id in a single round-trip
+    conflict = _find_registration_conflict(db, user_data)
+    if conflict:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="National ID already registered"
+            detail=conflict
         )
         
     # Create new user
@@ -57,7 +107,15 @@ async def register(user_data: UserCreate, background_tasks: BackgroundTasks, db:
     )
     
     db.add(new_user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError as e:
+        # A concurrent signup won the race between the check and the insert
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_integrity_error_message(e)
+        )
     db.refresh(new_user)
     
     #  EMAIL CONFIRMATION
@@ -69,32 +127,60 @@ async def register(user_data: UserCreate, background_tasks: BackgroundTasks, db:
 
     return new_user # Changed return type to simply return the ORM object
 
-@router.post("/login", response_model=LoginResponse)
+@router.post("/login", response_model=LoginResponse, dependencies=[Depends(login_rate_limit)])
 async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     """Login user and return JWT token"""
     
     # Get user by email
     user = db.query(User).filter(User.email == login_data.email).first()
-    # ... (Login logic is omitted for brevity, it remains the same)
     
-    # Verify password (omitted for brevity)
-    # ...
+    # Verify password
+    if not user or not verify_password(login_data.password, user.hashed_password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
     
-    # Reset failed attempts on successful login (omitted for brevity)
-    # ...
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive"
+        )
     
-    # Create JWT token
-    access_token = create_access_token(
-        data={"sub": str(user.id), "email": user.email, "is_admin": user.is_admin} # Ensure is_admin is included for protected routes
-    )
+    # Upgrade hashes made with a lower bcrypt cost while we have the plain password
+    if needs_rehash(user.hashed_password):
+        user.hashed_password = hash_password(login_data.password)
+        db.commit()
+    
+    # Create a short-lived JWT plus a refresh token for renewing it without a password
+    access_token = _access_token_for(user)
+    refresh_token = TokenService.issue_refresh_token(db, user.id)
     
     return {
         "access_token": access_token,
+        "refresh_token": refresh_token,
         "token_type": "bearer",
         # Use the UserBase schema for a clean, consistent response
         "user": UserBase.model_validate(user).model_dump() 
     }
 
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_access_token(refresh_data: RefreshRequest, db: Session = Depends(get_db)):
+    """Exchange a refresh token for a new access token (the refresh token is rotated)"""
+    user, refresh_token = TokenService.rotate_refresh_token(db, refresh_data.refresh_token)
+    return {
+        "access_token": _access_token_for(user),
+        "refresh_token": refresh_token,
+        "token_type": "bearer"
+    }
+
+@router.post("/logout")
+async def logout(refresh_data: RefreshRequest, db: Session = Depends(get_db)):
+    """Revoke a refresh token"""
+    TokenService.revoke_refresh_token(db, refresh_data.refresh_token)
+    return {"message": "Logged out successfully"}
+
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(current_user: User = Depends(get_current_user)):
     """Get current user's profile"""
@@ -160,8 +246,9 @@ async def change_password(
             detail="Current password is incorrect"
         )
     
-    # Update password
+    # Update password and sign out everywhere, as /api/profile/change-password does
     current_user.hashed_password = hash_password(password_data.new_password)
+    TokenService.revoke_user_tokens(db, current_user.id)
     db.commit()
     
     return {"message": "Password changed successfully"}
@@ -0,0 +1,43 @@
+# routes/bundle.py
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.bundle import HomeBundleResponse
+from app.services.bundle_service import BundleService
+from app.services.event_cache import home_bundle_cache
+from app.utils.http_cache import conditional_json
+
+router = APIRouter(tags=["Bundles"])
+
+MAX_BUNDLE_PAGES = 10
+
+@router.get("/home", response_model=HomeBundleResponse)
+async def home_bundle(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    pages: Optional[str] = Query(None, description="Comma-separated page block names, e.g. 'about_us,contact'"),
+    db: Session = Depends(get_db)
+):
+    """
+    Everything the home page needs in one request: upcoming events, published
+    announcements and the named page blocks. Cached as a whole and revalidated
+    with a combined ETag.
+    """
+    page_names = tuple(sorted({name.strip() for name in (pages or "").split(",") if name.strip()}))
+    if len(page_names) > MAX_BUNDLE_PAGES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BUNDLE_PAGES} page blocks can be bundled"
+        )
+
+    cached = home_bundle_cache.get_or_load(
+        page_names,
+        lambda: BundleService.load_home(db, page_names),
+        ttl=lambda cached: cached.ttl,
+        stale_ttl=lambda cached: cached.stale_ttl,
+        schedule=background_tasks.add_task
+    )
+    return conditional_json(request, cached.payload, cached.etag, cached.last_modified)
@@ -1,33 +1,44 @@
 # routes/content.py
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
 from app.models.user import User
 # Assuming your schemas are defined here:
 from app.schemas.content import (
-    AnnouncementCreate, AnnouncementUpdate, AnnouncementResponse,
+    AnnouncementCreate, AnnouncementUpdate, AnnouncementResponse, BroadcastStatus,
     PageContentResponse, PageContentUpdate
 )
 # Assuming your service layer is defined here:
 from app.services.content_service import ContentService
-from app.utils.dependencies import get_current_user, get_current_admin
+from app.services.broadcast_service import BroadcastService
+from app.utils.dependencies import get_current_user, get_current_admin, get_admin_principal, Principal
+from app.utils.http_cache import weak_etag, not_modified, conditional_json
 
 router = APIRouter(prefix="/api/content", tags=["Content & Announcements"])
 
 # --- PUBLIC ROUTES (Read Access) ---
 
 @router.get("/announcements", response_model=List[AnnouncementResponse])
-async def list_published_announcements(db: Session = Depends(get_db)):
+async def list_published_announcements(request: Request, db: Session = Depends(get_db)):
     """
     Retrieve a list of all CURRENTLY PUBLISHED announcements for public display.
+    Revalidation only costs one aggregate query: 304 is answered before any row is loaded.
+    ETag only: a delete or unpublish makes the list older, so no Last-Modified is sent.
     """
+    count, max_id, last_change = ContentService.announcements_version(db)
+    etag = weak_etag("announcements", count, max_id, last_change)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     announcements = ContentService.get_announcements(db, include_unpublished=False)
-    return announcements
+    payload = [AnnouncementResponse.model_validate(a).model_dump(mode="json") for a in announcements]
+    return conditional_json(request, payload, etag)
 
 @router.get("/pages/{page_name}", response_model=PageContentResponse)
-async def get_page_content_by_name(page_name: str, db: Session = Depends(get_db)):
+async def get_page_content_by_name(page_name: str, request: Request, db: Session = Depends(get_db)):
     """
     Retrieve the content block for a specific named page (e.g., 'about_us').
     """
@@ -37,7 +48,12 @@ async def get_page_content_by_name(page_name: str, db: Session = Depends(get_db)
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Content for page '{page_name}' not found."
         )
-    return page_content
+    etag = weak_etag("page", page_content.id, page_content.updated_at)
+    cached = not_modified(request, etag, page_content.updated_at)
+    if cached is not None:
+        return cached
+    payload = PageContentResponse.model_validate(page_content).model_dump(mode="json")
+    return conditional_json(request, payload, etag, page_content.updated_at)
 
 # --- ADMIN ROUTES (Write Access) ---
 # All routes below use 'get_current_admin'
@@ -48,18 +64,26 @@ async def create_announcement(
     current_admin: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
-    """Create a new announcement. (Admin only)"""
+    """Create a new announcement, optionally emailing it to all members. (Admin only)"""
+    if announcement_data.broadcast and not announcement_data.is_published:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only published announcements can be emailed"
+        )
     new_announcement = ContentService.create_announcement(
         db, 
         announcement_data, 
         current_admin.id
     )
+    if announcement_data.broadcast:
+        # Only queued here; the background sender mails it in batches
+        BroadcastService.start_broadcast(db, new_announcement.id, current_admin.id)
     return new_announcement
 
 @router.get("/admin/announcements", response_model=List[AnnouncementResponse])
 async def list_all_announcements(
     include_unpublished: bool = Query(True), # Admin can see all, including drafts
-    current_admin: User = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_admin_principal),
     db: Session = Depends(get_db)
 ):
     """List ALL announcements, including unpublished drafts. (Admin only)"""
@@ -96,6 +120,37 @@ async def delete_announcement(
         )
     return None
 
+@router.post(
+    "/announcements/{announcement_id}/broadcast",
+    response_model=BroadcastStatus,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def broadcast_announcement(
+    announcement_id: int,
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Email a published announcement to every active member. Sent in the
+    background; calling it again returns the existing broadcast. (Admin only)
+    """
+    return BroadcastService.start_broadcast(db, announcement_id, current_admin.id)
+
+@router.get("/announcements/{announcement_id}/broadcast", response_model=BroadcastStatus)
+async def get_broadcast_status(
+    announcement_id: int,
+    current_admin: Principal = Depends(get_admin_principal),
+    db: Session = Depends(get_db)
+):
+    """Progress of an announcement's email broadcast. (Admin only)"""
+    broadcast = BroadcastService.get_broadcast(db, announcement_id)
+    if not broadcast:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Announcement has not been emailed"
+        )
+    return broadcast
+
 @router.put("/pages/{page_name}", response_model=PageContentResponse)
 async def update_page_content(
     page_name: str,
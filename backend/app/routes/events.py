@@ -1,19 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import date
 from app.database import get_db
 from app.models.user import User
 from app.schemas.event import (
-    EventCreate, EventUpdate, EventResponse, EventListResponse
+    EventCreate, EventUpdate, EventResponse, EventListResponse, EventChangesResponse,
+    EventBatchResponse, EventBulkCreate
 )
+from app.schemas.event_series import EventCalendarResponse
 from app.schemas.registration import RegistrationResponse
-from app.services.event_service import EventService
-from app.utils.dependencies import get_current_user, get_current_admin
+from app.services.event_service import (
+    EventService, AVAILABILITY_CACHE_TTL, encode_sync_token, decode_sync_token,
+    resolve_event_fields, project_event
+)
+from app.services.event_series_service import EventSeriesService, CALENDAR_MAX_DAYS
+from app.services.availability_hub import availability_hub
+from app.services.event_cache import (
+    event_list_cache, event_detail_cache, list_cache_key, list_lifetime,
+    CachedResponse, EVENT_DETAIL_TTL, EVENT_STALE_TTL
+)
+from app.utils.http_cache import weak_etag, collection_etag, latest, conditional_json
+from app.utils.dependencies import get_current_user, get_current_admin, get_admin_principal, Principal
+import json
 import math
 from pydantic import BaseModel, field_validator, ConfigDict
 
 router = APIRouter(tags=["Events"])
 
+SSE_HEARTBEAT_SECONDS = 15
+MAX_BATCH_IDS = 100
+
+
+def _detail_response(event) -> CachedResponse:
+    """Cache entry for GET /{event_id}, shared with the batch endpoint"""
+    return CachedResponse(
+        EventResponse.model_validate(event).model_dump(mode="json"),
+        weak_etag("event", event.id, event.created_at, event.updated_at),
+        latest(event.updated_at, event.created_at)
+    )
+
 @router.post("/", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(
     event_data: EventCreate,
@@ -24,48 +51,208 @@ async def create_event(
     event = EventService.create_event(db, event_data, current_admin.id)
     return event
 
+@router.post("/bulk", response_model=List[EventResponse], status_code=status.HTTP_201_CREATED)
+async def create_events_bulk(
+    bulk_data: EventBulkCreate,
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create many events in one transaction: all of them or none (Admin only)"""
+    return EventService.create_events(db, bulk_data.events, current_admin.id)
+
 @router.get("/", response_model=EventListResponse)
 async def list_events(
+    request: Request,
+    background_tasks: BackgroundTasks,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     include_past: bool = Query(False),
     include_inactive: bool = Query(False),
+    fields: Optional[str] = Query(None, description="Comma-separated event fields to return, e.g. 'id,title,event_date'"),
+    view: Optional[str] = Query(None, description="'summary' for card fields only (no description), or 'full'"),
+    include_total: bool = Query(True, description="Set to false to skip counting"),
+    approximate_total: bool = Query(False, description="Allow a planner estimate for large listings (Postgres)"),
     db: Session = Depends(get_db)
 ):
-    """List all events with pagination"""
-    skip = (page - 1) * page_size
+    """
+    List all events with pagination.
+    Served from the response cache; stale pages are returned while a refresh runs in the background.
+    Supports conditional requests (ETag).
+    `fields` / `view=summary` return sparse events; unrequested columns are not even fetched.
+    Totals are cached per filter; `include_total=false` skips them and
+    `approximate_total=true` may return an estimate flagged with `approximate: true`.
+    """
+    try:
+        selected = resolve_event_fields(fields, view)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
-    events, total = EventService.get_events(
-        db, 
-        skip=skip, 
-        limit=page_size,
-        include_past=include_past,
-        include_inactive=include_inactive
-    )
+    total_mode = ("approximate" if approximate_total else "exact") if include_total else None
     
-    total_pages = math.ceil(total / page_size)
+    def load():
+        skip = (page - 1) * page_size
+        
+        events, _ = EventService.get_events(
+            db, 
+            skip=skip, 
+            limit=page_size,
+            include_past=include_past,
+            include_inactive=include_inactive,
+            fields=selected,
+            count=False
+        )
+        
+        count = None
+        if include_total:
+            count = EventService.count_events(db, include_past, include_inactive, approximate=approximate_total)
+        
+        payload = EventListResponse.model_validate({
+            "events": [] if selected else events,
+            "total": count.total if count else None,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": math.ceil(count.total / page_size) if count else None,
+            "approximate": count.approximate if count else False
+        }).model_dump(mode="json")
+        if selected:
+            payload["events"] = [project_event(event, selected) for event in events]
+        
+        versions = [(e.id, e.created_at, e.updated_at) for e in events]
+        next_start = None if include_past else EventService.next_event_start(db, include_inactive)
+        return CachedResponse(
+            payload,
+            collection_etag("events", [(page, page_size, include_past, include_inactive, selected, count), *versions]),
+            None,  # ETag only: deleting or hiding an event does not advance any timestamp
+            *list_lifetime(next_start)
+        )
+    
+    cached = event_list_cache.get_or_load(
+        list_cache_key(page, page_size, include_past, include_inactive, selected, total_mode),
+        load,
+        ttl=lambda cached: cached.ttl,
+        stale_ttl=lambda cached: cached.stale_ttl,
+        schedule=background_tasks.add_task
+    )
+    # Already validated when cached
+    return conditional_json(request, cached.payload, cached.etag, cached.last_modified)
+
+@router.get("/changes", response_model=EventChangesResponse)
+async def list_event_changes(
+    since: Optional[str] = Query(None, description="next_token from the previous call; omit for a full sync"),
+    limit: int = Query(200, ge=1, le=1000),
+    db: Session = Depends(get_db)
+):
+    """
+    Delta sync: events created, updated or deactivated since the token.
+    Deactivated (soft-deleted) events are returned as tombstones in `deleted`.
+    Keep calling with `next_token` while `has_more` is true. Changes become
+    visible a couple of seconds after they are written.
+    """
+    cursor = None
+    if since:
+        try:
+            cursor = decode_sync_token(since)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid sync token"
+            )
     
+    events, cursor, has_more = EventService.get_changes(db, since=cursor, limit=limit)
     return {
-        "events": events,
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": total_pages
+        "changes": [event for event in events if event.is_active],
+        "deleted": [event.id for event in events if not event.is_active],
+        "next_token": encode_sync_token(cursor) if cursor else None,
+        "has_more": has_more
     }
 
+@router.get("/calendar", response_model=EventCalendarResponse)
+async def get_calendar(
+    start: date = Query(..., description="First day (inclusive)"),
+    end: date = Query(..., description="Last day (exclusive)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Events on the days [start, end), including occurrences of recurring series.
+    Occurrences nobody has registered for yet have no `id`; register with
+    POST /api/registrations/series/{series_id}/occurrences/{occurrence_at}.
+    """
+    if not 0 < (end - start).days <= CALENDAR_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"end must be after start and at most {CALENDAR_MAX_DAYS} days later"
+        )
+    return {"start": start, "end": end, "events": EventSeriesService.calendar(db, start, end)}
+
+@router.get("/batch", response_model=EventBatchResponse)
+async def get_events_batch(
+    request: Request,
+    ids: str = Query(..., description=f"Comma-separated event ids (at most {MAX_BATCH_IDS})"),
+    db: Session = Depends(get_db)
+):
+    """
+    Several events at once, keyed by id. Ids already in the detail cache are served
+    from it; the rest are loaded with a single IN query and cached for GET /{event_id}.
+    """
+    try:
+        event_ids = list(dict.fromkeys(int(part) for part in ids.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers"
+        )
+    if not event_ids or len(event_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Between 1 and {MAX_BATCH_IDS} ids are allowed"
+        )
+    
+    def load(missing_ids):
+        loaded = {event.id: _detail_response(event) for event in EventService.get_events_by_ids(db, missing_ids)}
+        # Remember unknown ids too, like the detail endpoint does
+        return {event_id: loaded.get(event_id) for event_id in missing_ids}
+    
+    cached = event_detail_cache.get_many_or_load(
+        event_ids, load, ttl=EVENT_DETAIL_TTL, stale_ttl=EVENT_STALE_TTL
+    )
+    found = [event_id for event_id in event_ids if cached.get(event_id) is not None]
+    payload = {
+        "events": {str(event_id): cached[event_id].payload for event_id in found},
+        "missing": [event_id for event_id in event_ids if cached.get(event_id) is None]
+    }
+    etag = weak_etag("batch", *((event_id, cached[event_id].etag) for event_id in found))
+    return conditional_json(
+        request, payload, etag, latest(*(cached[event_id].last_modified for event_id in found))
+    )
+
 @router.get("/{event_id}", response_model=EventResponse)
 async def get_event(
     event_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
-    """Get a specific event by ID"""
-    event = EventService.get_event(db, event_id)
-    if not event:
+    """Get a specific event by ID (supports ETag / Last-Modified)"""
+    def load():
+        event = EventService.get_event(db, event_id)
+        return _detail_response(event) if event else None
+    
+    cached = event_detail_cache.get_or_load(
+        event_id,
+        load,
+        ttl=EVENT_DETAIL_TTL,
+        stale_ttl=EVENT_STALE_TTL,
+        schedule=background_tasks.add_task
+    )
+    if cached is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
-    return event
+    return conditional_json(request, cached.payload, cached.etag, cached.last_modified)
 
 @router.put("/{event_id}", response_model=EventResponse)
 async def update_event(
@@ -101,15 +288,60 @@ async def delete_event(
 @router.get("/{event_id}/availability")
 async def check_availability(
     event_id: int,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """Check event availability"""
-    return EventService.check_availability(db, event_id)
+    availability = EventService.check_availability(db, event_id)
+    # Let browsers and CDNs absorb polling for as long as we cache it ourselves
+    response.headers["Cache-Control"] = f"public, max-age={AVAILABILITY_CACHE_TTL}"
+    return availability
+
+@router.get("/{event_id}/availability/stream")
+async def stream_availability(
+    event_id: int,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """
+    Server-Sent Events stream of availability changes for one event.
+    Sends the current snapshot first, then an update whenever registrations change
+    (coalesced to a few per second) and a comment line every 15s to keep proxies open.
+    """
+    # Subscribe before reading the snapshot: a change landing in between is then
+    # delivered as an update instead of being lost
+    subscription = availability_hub.subscribe(event_id)
+    try:
+        initial = EventService.check_availability(db, event_id)
+    except Exception:
+        availability_hub.unsubscribe(subscription)
+        raise
+    finally:
+        # The stream may stay open for hours: give the connection back to the pool now
+        db.close()
+
+    async def event_stream():
+        try:
+            yield f"event: availability\ndata: {json.dumps(initial)}\n\n"
+            while not await request.is_disconnected():
+                snapshot = await subscription.next(timeout=SSE_HEARTBEAT_SECONDS)
+                if snapshot is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield f"event: availability\ndata: {json.dumps(snapshot)}\n\n"
+        finally:
+            availability_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @router.get("/{event_id}/participants", response_model=List[RegistrationResponse])
 async def get_event_participants(
     event_id: int,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: Principal = Depends(get_admin_principal),
     db: Session = Depends(get_db)
 ):
     """Get all participants for an event (Admin only)"""
@@ -0,0 +1,35 @@
+# routes/metrics.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.services.email import email_breaker
+from app.services.email_outbox import outbox_counts
+from app.utils.dependencies import get_admin_principal, Principal
+from app.utils.rate_limit import get_rejection_counts
+
+router = APIRouter(tags=["Admin - Metrics"])
+
+@router.get("/rate-limits")
+async def rate_limit_metrics(current_admin: Principal = Depends(get_admin_principal)):
+    """
+    Rejected calls per limiter scope and dimension since this worker started. (Admin only)
+    """
+    rejections = get_rejection_counts()
+    return {
+        "rejected": rejections,
+        "total_rejected": sum(rejections.values())
+    }
+
+@router.get("/email")
+async def email_metrics(
+    current_admin: Principal = Depends(get_admin_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Circuit breaker state around the email provider (this worker) and the size
+    of the deferred-email outbox. (Admin only)
+    """
+    return {
+        "breaker": email_breaker.snapshot(),
+        "outbox": outbox_counts(db)
+    }
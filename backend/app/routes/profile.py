@@ -11,6 +11,7 @@ from app.schemas.profile import (
 )
 from app.services.profile_service import ProfileService
 from app.utils.dependencies import get_current_user
+from app.utils.rate_limit import email_change_rate_limit
 from app.models.user import User
 
 
@@ -62,6 +63,7 @@ def delete_account(
     "/change-email",
     response_model=MessageResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(email_change_rate_limit)],
 )
 async def request_email_change(
     payload: EmailChangeRequest,
@@ -2,16 +2,21 @@ from fastapi import BackgroundTasks
 from app.models.event import Event
 from app.services.email import send_event_registration_confirmation
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 from app.database import get_db
 from app.models.user import User
 from app.schemas.registration import (
-    RegistrationCreate, RegistrationResponse, RegistrantListResponse
+    RegistrationCreate, RegistrationResponse, RegistrantListResponse,
+    CheckInRequest, CheckInResponse
 )
-from app.services.registration_service import RegistrationService
-from app.utils.dependencies import get_current_user, get_current_admin
+from app.services.checkin_service import check_in_desk
+from app.services.registration_service import RegistrationService, REGISTRANT_EXPORT_COLUMNS
+from app.services.event_series_service import EventSeriesService
+from app.utils.export import export_response, parse_columns
+from app.utils.dependencies import get_current_user, get_current_admin, get_current_principal, get_admin_principal, Principal
 
 router = APIRouter(tags=["Registrations"])
 
@@ -23,13 +28,39 @@ async def register_for_event(
     db: Session = Depends(get_db)
 ):
     """Register current user for an event"""
+    return _register(db, background_tasks, current_user, registration_data.event_id)
+
+
+@router.post(
+    "/series/{series_id}/occurrences/{occurrence_at}",
+    response_model=RegistrationResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def register_for_occurrence(
+    series_id: int,
+    occurrence_at: datetime,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Register current user for one occurrence of a recurring series"""
+    registration = EventSeriesService.register_for_occurrence(db, series_id, occurrence_at, current_user.id)
+    _send_confirmation(db, background_tasks, current_user, registration.event_id)
+    return registration
+
+
+def _register(db: Session, background_tasks: BackgroundTasks, current_user: User, event_id: int):
     registration = RegistrationService.register_for_event(
         db,
-        event_id=registration_data.event_id,
+        event_id=event_id,
         user_id=current_user.id
     )
+    _send_confirmation(db, background_tasks, current_user, event_id)
+    return registration
+
 
-    event = db.query(Event).filter(Event.id == registration_data.event_id).first()
+def _send_confirmation(db: Session, background_tasks: BackgroundTasks, current_user: User, event_id: int) -> None:
+    event = db.query(Event).filter(Event.id == event_id).first()
     if event:
         background_tasks.add_task(
             send_event_registration_confirmation,
@@ -41,13 +72,11 @@ async def register_for_event(
             event.location
         )
 
-    return registration
-
 
 @router.get("/my-registrations", response_model=List[RegistrationResponse])
 async def get_my_registrations(
     include_cancelled: bool = False,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get current user's registrations"""
@@ -79,17 +108,59 @@ async def cancel_registration(
 @router.get("/event/{event_id}/registrants", response_model=List[RegistrantListResponse]) 
 def get_registrants_for_event(
     event_id: int,
-    current_admin: User = Depends(get_current_admin), # 💥 ADDED: Requires admin status
+    current_admin: Principal = Depends(get_admin_principal), # 💥 ADDED: Requires admin status
     db: Session = Depends(get_db)
 ):
     registrations = RegistrationService.get_registrants_by_event_id(db, event_id=event_id)
     return registrations
 
 
+@router.get("/event/{event_id}/registrants/export")
+def export_registrants_for_event(
+    event_id: int,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    columns: Optional[str] = Query(None, description=f"Comma-separated subset of: {', '.join(REGISTRANT_EXPORT_COLUMNS)}"),
+    current_admin: Principal = Depends(get_admin_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream an event's active registrants as CSV or NDJSON, with constant memory use. (Admin only)
+    """
+    try:
+        selected = parse_columns(columns, list(REGISTRANT_EXPORT_COLUMNS))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if db.get(Event, event_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    rows = RegistrationService.registrant_export_rows(db, event_id, selected)
+    return export_response(rows, selected, format, f"event-{event_id}-registrants")
+
+
+@router.post("/event/{event_id}/check-in", response_model=CheckInResponse)
+def check_in_attendee(
+    event_id: int,
+    scan: CheckInRequest,
+    current_admin: Principal = Depends(get_admin_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Check in the holder of a scanned ticket. Verified from the signature and an
+    in-memory roster; attendance is written to the database in batches.
+    409 if the ticket was already scanned. (Admin only)
+    """
+    return check_in_desk.check_in(db, event_id, scan.ticket)._asdict()
+
+
 @router.get("/{registration_id}", response_model=RegistrationResponse)
 async def get_registration(
     registration_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get a specific registration"""
@@ -0,0 +1,37 @@
+# routes/search.py
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.search import SearchResponse
+from app.services.search_service import SearchService, SEARCH_KINDS
+
+router = APIRouter(tags=["Search"])
+
+@router.get("/", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Optional[str] = Query(None, pattern="^(event|announcement)$"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """
+    Full-text search over active events and published announcements, best match first.
+    Title matches rank above description matches.
+    """
+    hits, has_more = SearchService.search(
+        db,
+        q,
+        kinds=(kind,) if kind else SEARCH_KINDS,
+        limit=page_size,
+        offset=(page - 1) * page_size
+    )
+    return {
+        "results": hits,
+        "page": page,
+        "page_size": page_size,
+        "has_more": has_more
+    }
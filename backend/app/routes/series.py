@@ -0,0 +1,74 @@
+# routes/series.py
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models.user import User
+from app.schemas.event import EventResponse, EventUpdate
+from app.schemas.event_series import EventSeriesCreate, EventSeriesResponse
+from app.services.event_series_service import EventSeriesService
+from app.utils.dependencies import get_current_admin
+
+router = APIRouter(tags=["Event Series"])
+
+@router.post("/", response_model=EventSeriesResponse, status_code=status.HTTP_201_CREATED)
+async def create_series(
+    series_data: EventSeriesCreate,
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Create a recurring event (Admin only).
+    Occurrences show up in GET /api/events/calendar and only become events
+    once someone registers or an admin edits one.
+    """
+    return EventSeriesService.create_series(db, series_data, current_admin.id)
+
+@router.get("/{series_id}", response_model=EventSeriesResponse)
+async def get_series(series_id: int, db: Session = Depends(get_db)):
+    """Get a series: its rule and cancelled occurrences"""
+    series = EventSeriesService.get_series(db, series_id)
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Series not found"
+        )
+    return series
+
+@router.delete("/{series_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_series(
+    series_id: int,
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Stop a series (Admin only). Occurrences that are already events are kept."""
+    if not EventSeriesService.deactivate_series(db, series_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Series not found"
+        )
+    return None
+
+@router.put("/{series_id}/occurrences/{occurrence_at}", response_model=EventResponse)
+async def update_occurrence(
+    series_id: int,
+    occurrence_at: datetime,
+    event_data: EventUpdate,
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Edit a single occurrence, turning it into a regular event (Admin only)"""
+    return EventSeriesService.update_occurrence(db, series_id, occurrence_at, event_data)
+
+@router.delete("/{series_id}/occurrences/{occurrence_at}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_occurrence(
+    series_id: int,
+    occurrence_at: datetime,
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Cancel a single occurrence (Admin only)"""
+    EventSeriesService.cancel_occurrence(db, series_id, occurrence_at)
+    return None
@@ -1,5 +1,6 @@
 # app/schemas/auth.py (FINAL VERSION)
 
+from typing import Optional
 from pydantic import BaseModel, EmailStr
 # Import the definition from the correct file:
 from app.schemas.user import UserBase # <-- NEW IMPORT
@@ -10,9 +11,18 @@ class LoginRequest(BaseModel):
 
 class LoginResponse(BaseModel):
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str = "bearer"
     user: UserBase # <-- Use the imported UserBase
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class TokenResponse(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+
 class PasswordResetRequest(BaseModel):
     email: EmailStr
 
@@ -0,0 +1,12 @@
+# schemas/bundle.py
+from pydantic import BaseModel
+
+from app.schemas.content import AnnouncementResponse, PageContentResponse
+from app.schemas.event import EventResponse
+
+
+class HomeBundleResponse(BaseModel):
+    upcoming_events: list[EventResponse]
+    announcements: list[AnnouncementResponse]
+    # Requested page blocks by name; names without content are left out
+    pages: dict[str, PageContentResponse]
@@ -17,6 +17,7 @@ class AnnouncementCreate(BaseModel):
     title: str = Field(..., max_length=255)
     content: str
     is_published: bool = Field(True, description="Whether the announcement should be immediately visible.")
+    broadcast: bool = Field(False, description="Also email it to every active member (published announcements only).")
 
 # Schema for updating an existing announcement (Admin sends this data)
 class AnnouncementUpdate(BaseModel):
@@ -34,6 +35,16 @@ class AnnouncementResponse(BaseSchema):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+# Progress of emailing an announcement to the members
+class BroadcastStatus(BaseSchema):
+    announcement_id: int
+    requested_by: int
+    sent_count: int
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    failed_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
 
 # ====================================================================
 # 2. PAGE CONTENT SCHEMAS
@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Optional
 
 
@@ -25,6 +25,10 @@ class EventCreate(EventBase):
         return v
 
 
+class EventBulkCreate(BaseModel):
+    events: list[EventCreate] = Field(..., min_length=1, max_length=500)
+
+
 class EventUpdate(BaseModel):
     title: str | None = None
     description: str | None = None
@@ -43,11 +47,32 @@ class EventResponse(EventBase):
     is_active: bool
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    # Set when the event is a materialized occurrence of a recurring series
+    series_id: int | None = None
+    occurrence_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class EventChangesResponse(BaseModel):
+    changes: list[EventResponse]      # created or updated, still active
+    deleted: list[int]                # tombstones: ids of deactivated events
+    next_token: str | None = None     # pass back as ?since= on the next call
+    has_more: bool = False
+
+
+class EventBatchResponse(BaseModel):
+    events: dict[int, EventResponse]  # keyed by id
+    missing: list[int]                # requested ids that do not exist
+
+
 class EventListResponse(BaseModel):
     events: list[EventResponse]
+    page: int | None = None
+    page_size: int | None = None
+    # None when the client opted out with include_total=false
+    total: int | None = None
+    total_pages: int | None = None
+    approximate: bool = False         # total is a planner estimate
 
     model_config = ConfigDict(from_attributes=True)
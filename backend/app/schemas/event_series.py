@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+class EventSeriesCreate(BaseModel):
+    title: str
+    description: str
+    location: str
+    capacity: int = Field(..., ge=1)
+    image_url: str | None = None
+    registration_closes_minutes: int = Field(60, ge=1, description="Registration closes this long before each occurrence")
+
+    starts_at: datetime = Field(..., description="Start of the first occurrence")
+    frequency: str = Field(..., pattern="^(daily|weekly)$")
+    interval: int = Field(1, ge=1, le=52, description="Every N days/weeks")
+    weekdays: list[int] | None = Field(None, description="Weekly only: 0 = Monday ... 6 = Sunday")
+    until: datetime | None = None
+    count: int | None = Field(None, ge=1, le=1000)
+
+    @field_validator("starts_at", "until")
+    def naive_utc(cls, v):
+        # Stored as naive UTC; also lets validate_rule compare mixed offsets
+        if v is not None and v.tzinfo is not None:
+            v = v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
+    @field_validator("weekdays")
+    def validate_weekdays(cls, v):
+        if v is not None:
+            if not v or any(day < 0 or day > 6 for day in v):
+                raise ValueError("weekdays must be a non-empty list of 0 (Monday) to 6 (Sunday)")
+            v = sorted(set(v))
+        return v
+
+    @model_validator(mode="after")
+    def validate_rule(self):
+        if self.weekdays and self.frequency != "weekly":
+            raise ValueError("weekdays only apply to weekly series")
+        if self.until is not None and self.until < self.starts_at:
+            raise ValueError("until must not be before starts_at")
+        return self
+
+
+class EventSeriesResponse(BaseModel):
+    id: int
+    title: str
+    description: str
+    location: str
+    capacity: int
+    image_url: str | None = None
+    registration_closes_minutes: int
+    starts_at: datetime
+    frequency: str
+    interval: int
+    weekdays: list[int] | None = None
+    until: datetime | None = None
+    count: int | None = None
+    is_active: bool
+    exceptions: list[datetime] = []   # cancelled occurrences
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("weekdays", mode="before")
+    def split_weekdays(cls, v):
+        # Stored as "0,2"
+        if isinstance(v, str):
+            return [int(day) for day in v.split(",") if day]
+        return v
+
+    @field_validator("exceptions", mode="before")
+    def exception_starts(cls, v):
+        return [getattr(exception, "occurrence_at", exception) for exception in v]
+
+
+class EventOccurrence(BaseModel):
+    """
+    One calendar entry: a saved event (id set) or a not yet materialized
+    occurrence of a series (id None; address it by series_id + occurrence_at).
+    """
+    id: int | None = None
+    series_id: int | None = None
+    occurrence_at: datetime | None = None
+    title: str
+    description: str
+    event_date: datetime
+    event_time: str | None = None
+    location: str
+    capacity: int
+    current_registrations: int
+    registration_deadline: datetime
+    image_url: str | None = None
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EventCalendarResponse(BaseModel):
+    start: datetime
+    end: datetime
+    events: list[EventOccurrence]
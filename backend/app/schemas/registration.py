@@ -16,6 +16,9 @@ class RegistrationResponse(BaseModel):
     registered_at: datetime
     is_cancelled: bool
     cancelled_at: Optional[datetime]
+    checked_in_at: Optional[datetime] = None
+    # Signed check-in ticket; the frontend renders it as a QR code
+    ticket: Optional[str] = None
     
     # Include event details
     event_title: Optional[str] = None
@@ -53,3 +56,15 @@ class RegistrantListResponse(RegistrationResponse):
     # as they are not properties of the Registration model object being serialized.
     
     model_config = ConfigDict(from_attributes=True)
+
+
+class CheckInRequest(BaseModel):
+    """A scanned ticket"""
+    ticket: str
+
+
+class CheckInResponse(BaseModel):
+    registration_id: int
+    event_id: int
+    user_id: int
+    checked_in_at: datetime
@@ -0,0 +1,17 @@
+# schemas/search.py
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    kind: str       # "event" | "announcement"
+    id: int         # id of the event or announcement
+    title: str
+    excerpt: str
+    score: float    # higher is more relevant
+
+
+class SearchResponse(BaseModel):
+    results: list[SearchHit]
+    page: int
+    page_size: int
+    has_more: bool
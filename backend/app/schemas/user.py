@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 import re
 import uuid
@@ -105,6 +105,22 @@ class UserResponse(UserBase):
     # model_config inherited from UserBase, but kept here for clarity if needed:
     model_config = {"from_attributes": True}
 
+class UserSearchResponse(BaseModel):
+    users: List[UserResponse]
+    # Pass back as ?after= for the next page; None on the last page
+    next_cursor: Optional[int] = None
+
+class UserImportError(BaseModel):
+    row: int                          # line number in the uploaded file (header is line 1)
+    email: Optional[str] = None
+    errors: List[str]
+
+class UserImportResponse(BaseModel):
+    total_rows: int
+    created: int                      # 0 on a dry run
+    errors: List[UserImportError]
+    dry_run: bool = False
+
 # --- OTHER UTILITY MODELS ---
 class UserUpdate(BaseModel):
     email: Optional[EmailStr] = None
@@ -0,0 +1,117 @@
+# services/availability_hub.py
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Optional, Set
+
+# At most one broadcast per event every AVAILABILITY_MIN_INTERVAL seconds;
+# snapshots published in between are coalesced into the latest one.
+AVAILABILITY_MIN_INTERVAL = float(os.getenv("AVAILABILITY_MIN_INTERVAL", "0.3"))
+
+
+class Subscription:
+    """
+    One listener for one event. Holds only the latest snapshot and a flag, so an
+    idle subscriber costs a few hundred bytes and never builds up a backlog.
+    """
+
+    __slots__ = ("event_id", "latest", "_ready")
+
+    def __init__(self, event_id: int):
+        self.event_id = event_id
+        self.latest: Optional[dict] = None
+        self._ready = asyncio.Event()
+
+    def push(self, snapshot: dict) -> None:
+        self.latest = snapshot
+        self._ready.set()
+
+    async def next(self, timeout: float) -> Optional[dict]:
+        """Wait for a newer snapshot; returns None on timeout (caller sends a heartbeat)."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._ready.clear()
+        return self.latest
+
+
+class AvailabilityHub:
+    """In-process pub/sub of seat availability, fed by the registration service."""
+
+    def __init__(self, min_interval: float = AVAILABILITY_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._pending: Dict[int, dict] = {}
+        self._last_sent: Dict[int, float] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def is_watched(self, event_id: int) -> bool:
+        """Cheap check so publishers can skip building a snapshot nobody will see."""
+        return event_id in self._subscribers
+
+    def subscriber_count(self, event_id: Optional[int] = None) -> int:
+        if event_id is not None:
+            return len(self._subscribers.get(event_id, ()))
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    def subscribe(self, event_id: int) -> Subscription:
+        """Register a listener (must be called from the event loop)."""
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(event_id)
+        self._subscribers.setdefault(event_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subs = self._subscribers.get(subscription.event_id)
+        if subs is None:
+            return
+        subs.discard(subscription)
+        if not subs:
+            del self._subscribers[subscription.event_id]
+            self._last_sent.pop(subscription.event_id, None)
+
+    def publish(self, event_id: int, snapshot: dict) -> None:
+        """
+        Queue a new snapshot for an event. Safe to call from any thread; a no-op
+        when nobody is listening.
+        """
+        if event_id not in self._subscribers or self._loop is None or self._loop.is_closed():
+            return
+
+        with self._lock:
+            already_scheduled = event_id in self._pending
+            self._pending[event_id] = snapshot
+        if already_scheduled:
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._schedule_flush(event_id)
+        else:
+            self._loop.call_soon_threadsafe(self._schedule_flush, event_id)
+
+    def _schedule_flush(self, event_id: int) -> None:
+        last = self._last_sent.get(event_id, 0.0)
+        delay = max(0.0, last + self.min_interval - time.monotonic())
+        if delay:
+            self._loop.call_later(delay, self._flush, event_id)
+        else:
+            self._flush(event_id)
+
+    def _flush(self, event_id: int) -> None:
+        with self._lock:
+            snapshot = self._pending.pop(event_id, None)
+        if snapshot is None:
+            return
+        self._last_sent[event_id] = time.monotonic()
+        for subscription in tuple(self._subscribers.get(event_id, ())):
+            subscription.push(snapshot)
+
+
+availability_hub = AvailabilityHub()
@@ -0,0 +1,246 @@
+# services/broadcast_service.py
+import asyncio
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, update, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.content import Announcement, AnnouncementBroadcast
+from app.models.user import User
+from app.services.email import _send_batch, announcement_messages, email_breaker
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.utils.send_budget import SendBudget, email_send_budget
+
+BROADCASTS_ENABLED = os.getenv("BROADCASTS_ENABLED", "true").lower() == "true"
+BROADCAST_POLL_SECONDS = int(os.getenv("BROADCAST_POLL_SECONDS", "30"))
+# Recipients per provider call; Resend's batch endpoint takes at most 100
+BROADCAST_BATCH_SIZE = int(os.getenv("BROADCAST_BATCH_SIZE", "100"))
+# Users read per query; memory stays at one chunk however many members there are
+BROADCAST_CHUNK_SIZE = 1000
+BROADCAST_LEASE_SECONDS = 120
+# Times the provider may reject the same batch before the broadcast is marked failed
+BROADCAST_MAX_ATTEMPTS = int(os.getenv("BROADCAST_MAX_ATTEMPTS", "5"))
+
+# Receives a list of {"to", "subject", "html", "text"}. Raising leaves the batch unsent;
+# it is retried on the next run.
+BatchTransport = Callable[[List[Dict[str, str]]], object]
+
+
+class BroadcastService:
+
+    @staticmethod
+    def start_broadcast(db: Session, announcement_id: int, admin_id: int) -> AnnouncementBroadcast:
+        """
+        Queue the announcement for mailing. Starting it again returns the
+        existing broadcast, so members are never mailed the same announcement twice.
+        """
+        announcement = db.query(Announcement).filter(Announcement.id == announcement_id).first()
+        if not announcement:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Announcement not found"
+            )
+        existing = BroadcastService.get_broadcast(db, announcement_id)
+        if existing:
+            return existing
+        if not announcement.is_published:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only published announcements can be emailed"
+            )
+
+        db.add(AnnouncementBroadcast(announcement_id=announcement_id, requested_by=admin_id))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Started concurrently by another request
+            db.rollback()
+        return BroadcastService.get_broadcast(db, announcement_id)
+
+    @staticmethod
+    def get_broadcast(db: Session, announcement_id: int) -> Optional[AnnouncementBroadcast]:
+        return db.query(AnnouncementBroadcast).filter(
+            AnnouncementBroadcast.announcement_id == announcement_id
+        ).first()
+
+
+class BroadcastSender:
+    """
+    Mails every pending broadcast to the active members. `run_once` is meant to
+    be called periodically from a worker thread (see send_announcement_broadcasts_periodically).
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        transport: BatchTransport = _send_batch,
+        budget: SendBudget = email_send_budget,
+        batch_size: int = BROADCAST_BATCH_SIZE,
+        chunk_size: int = BROADCAST_CHUNK_SIZE,
+        lease_seconds: int = BROADCAST_LEASE_SECONDS,
+        breaker: CircuitBreaker = email_breaker,
+        max_attempts: int = BROADCAST_MAX_ATTEMPTS
+    ):
+        self.session_factory = session_factory
+        self.transport = transport
+        self.budget = budget
+        self.breaker = breaker
+        self.max_attempts = max_attempts
+        self.batch_size = batch_size
+        self.chunk_size = max(chunk_size, batch_size)
+        self.lease = timedelta(seconds=lease_seconds)
+        self._stopping = threading.Event()
+
+    def stop(self) -> None:
+        """Finish the current batch and return from run_once"""
+        self._stopping.set()
+
+    def run_once(self) -> int:
+        """Send every pending broadcast. Returns the number of messages sent."""
+        db = self.session_factory()
+        try:
+            pending = db.execute(
+                select(AnnouncementBroadcast.id)
+                .where(AnnouncementBroadcast.completed_at.is_(None), AnnouncementBroadcast.failed_at.is_(None))
+                .order_by(AnnouncementBroadcast.id)
+            ).scalars().all()
+            sent = 0
+            for broadcast_id in pending:
+                if self._stopping.is_set():
+                    break
+                sent += self._dispatch(db, broadcast_id)
+            return sent
+        finally:
+            db.close()
+
+    def _claim(self, db: Session, broadcast_id: int) -> bool:
+        """Take the lease of this broadcast, if no other worker holds it"""
+        now = datetime.utcnow()
+        claimed = db.execute(
+            update(AnnouncementBroadcast)
+            .where(
+                AnnouncementBroadcast.id == broadcast_id,
+                AnnouncementBroadcast.completed_at.is_(None),
+                AnnouncementBroadcast.failed_at.is_(None),
+                or_(
+                    AnnouncementBroadcast.lease_expires_at.is_(None),
+                    AnnouncementBroadcast.lease_expires_at < now
+                )
+            )
+            .values(lease_expires_at=now + self.lease)
+        ).rowcount
+        db.commit()
+        return bool(claimed)
+
+    def _dispatch(self, db: Session, broadcast_id: int) -> int:
+        """Mail one broadcast, resuming after the last user already handled"""
+        if not self._claim(db, broadcast_id):
+            return 0
+        sent = 0
+        try:
+            broadcast = db.execute(
+                select(AnnouncementBroadcast.last_user_id, Announcement.title, Announcement.content)
+                .join(Announcement, Announcement.id == AnnouncementBroadcast.announcement_id)
+                .where(AnnouncementBroadcast.id == broadcast_id)
+            ).first()
+            if broadcast is not None:
+                cursor, title, content = broadcast
+                while True:
+                    # Keyset over the primary key
+                    chunk = db.execute(
+                        select(User.id, User.email, User.full_name)
+                        .where(User.is_active == True, User.id > cursor)
+                        .order_by(User.id)
+                        .limit(self.chunk_size)
+                    ).all()
+                    if not chunk:
+                        break
+                    for start in range(0, len(chunk), self.batch_size):
+                        batch = chunk[start:start + self.batch_size]
+                        if not self.budget.acquire(len(batch), self._stopping) or self._stopping.is_set():
+                            return sent
+                        messages = announcement_messages(title, content, (row.full_name for row in batch))
+                        self.transport([
+                            {"to": row.email, **message._asdict()}
+                            for row, message in zip(batch, messages)
+                        ])
+                        cursor = batch[-1][0]
+                        sent += len(batch)
+                        # Checkpoint every batch: a restart never mails anyone twice
+                        db.execute(
+                            update(AnnouncementBroadcast)
+                            .where(AnnouncementBroadcast.id == broadcast_id)
+                            .values(
+                                last_user_id=cursor,
+                                sent_count=AnnouncementBroadcast.sent_count + len(batch),
+                                attempts=0,
+                                lease_expires_at=datetime.utcnow() + self.lease
+                            )
+                        )
+                        db.commit()
+
+            # Also reached when the announcement was deleted meanwhile
+            db.execute(
+                update(AnnouncementBroadcast)
+                .where(AnnouncementBroadcast.id == broadcast_id)
+                .values(completed_at=datetime.utcnow(), lease_expires_at=None)
+            )
+            db.commit()
+            return sent
+        except Exception as e:
+            # Leave the cursor at the last delivered batch; retried on the next run
+            db.rollback()
+            print(f"[BROADCAST] Broadcast {broadcast_id} stopped after {sent} messages: {e}")
+            if not isinstance(e, CircuitOpenError) and not self.breaker.is_failure(e):
+                # The provider is up but refuses this batch: retrying only helps so often
+                self._record_rejection(db, broadcast_id, e)
+            return sent
+        finally:
+            self._release(db, broadcast_id)
+
+    def _record_rejection(self, db: Session, broadcast_id: int, error: Exception) -> None:
+        """Count a rejected batch; the broadcast fails once it reaches max_attempts"""
+        db.execute(
+            update(AnnouncementBroadcast)
+            .where(AnnouncementBroadcast.id == broadcast_id)
+            .values(attempts=AnnouncementBroadcast.attempts + 1, last_error=str(error)[:500])
+        )
+        failed = db.execute(
+            update(AnnouncementBroadcast)
+            .where(AnnouncementBroadcast.id == broadcast_id, AnnouncementBroadcast.attempts >= self.max_attempts)
+            .values(failed_at=datetime.utcnow())
+        ).rowcount
+        db.commit()
+        if failed:
+            print(f"[BROADCAST] Broadcast {broadcast_id} failed after {self.max_attempts} rejected attempts")
+
+    def _release(self, db: Session, broadcast_id: int) -> None:
+        """Let the next run (any worker) pick up an unfinished broadcast right away"""
+        db.execute(
+            update(AnnouncementBroadcast)
+            .where(AnnouncementBroadcast.id == broadcast_id, AnnouncementBroadcast.completed_at.is_(None))
+            .values(lease_expires_at=None)
+        )
+        db.commit()
+
+async def send_announcement_broadcasts_periodically(session_factory, interval: int = BROADCAST_POLL_SECONDS):
+    """Background loop started by the app: send pending broadcasts every `interval` seconds."""
+    sender = BroadcastSender(session_factory)
+    try:
+        while True:
+            try:
+                sent = await run_in_threadpool(sender.run_once)
+                if sent:
+                    print(f"[BROADCAST] Sent {sent} announcement emails")
+            except Exception as e:
+                print(f"[BROADCAST] Broadcast run failed: {e}")
+            await asyncio.sleep(interval)
+    finally:
+        # Cancelling the task does not stop the worker thread; this does
+        sender.stop()
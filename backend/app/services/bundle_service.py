@@ -0,0 +1,87 @@
+# services/bundle_service.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.models.content import PageContent
+from app.schemas.content import AnnouncementResponse, PageContentResponse
+from app.schemas.event import EventResponse
+from app.services.content_service import ContentService
+from app.services.event_cache import CachedResponse, list_lifetime
+from app.services.event_service import EventService
+from app.utils.http_cache import weak_etag
+
+# Upcoming events included in the home bundle (the first page of the event list)
+HOME_EVENT_COUNT = int(os.getenv("HOME_EVENT_COUNT", "10"))
+BUNDLE_MAX_WORKERS = int(os.getenv("BUNDLE_MAX_WORKERS", "3"))
+
+_bundle_pool = ThreadPoolExecutor(max_workers=BUNDLE_MAX_WORKERS, thread_name_prefix="bundle")
+
+
+def _in_own_session(bind, loader: Callable[[Session], tuple]) -> tuple:
+    with Session(bind=bind) as session:
+        return loader(session)
+
+
+def _run_concurrently(db: Session, loaders: List[Callable[[Session], tuple]]) -> List[tuple]:
+    """
+    Run independent read-only loaders. SQLite serializes access to the file anyway,
+    so there they run one after another in the request's session; on a server
+    database each gets its own pooled connection and they run in parallel.
+    """
+    bind = db.get_bind()
+    if bind.dialect.name == "sqlite" or len(loaders) < 2:
+        return [loader(db) for loader in loaders]
+    futures = [_bundle_pool.submit(_in_own_session, bind, loader) for loader in loaders]
+    return [future.result() for future in futures]
+
+
+class BundleService:
+    """Composite payloads that replace several SPA round-trips with one"""
+
+    @staticmethod
+    def _upcoming_events(db: Session) -> tuple:
+        events, _ = EventService.get_events(db, limit=HOME_EVENT_COUNT, count=False)
+        payload = [EventResponse.model_validate(e).model_dump(mode="json") for e in events]
+        # Ordered by date, so the first one is also when the listing next changes by itself
+        next_start = events[0].event_date if events else None
+        return payload, [(e.id, e.created_at, e.updated_at) for e in events], next_start
+
+    @staticmethod
+    def _announcements(db: Session) -> tuple:
+        announcements = ContentService.get_announcements(db, include_unpublished=False)
+        payload = [AnnouncementResponse.model_validate(a).model_dump(mode="json") for a in announcements]
+        return payload, [(a.id, a.created_at, a.updated_at) for a in announcements]
+
+    @staticmethod
+    def _pages(db: Session, page_names: Sequence[str]) -> tuple:
+        if not page_names:
+            return {}, []
+        blocks = db.query(PageContent).filter(PageContent.page_name.in_(page_names)).all()
+        payload = {b.page_name: PageContentResponse.model_validate(b).model_dump(mode="json") for b in blocks}
+        return payload, sorted((b.id, b.updated_at) for b in blocks)
+
+    @staticmethod
+    def load_home(db: Session, page_names: Sequence[str]) -> CachedResponse:
+        """Upcoming events, published announcements and the requested page blocks."""
+        events, announcements, pages = _run_concurrently(db, [
+            BundleService._upcoming_events,
+            BundleService._announcements,
+            lambda session: BundleService._pages(session, page_names),
+        ])
+        (event_payload, event_versions, next_start) = events
+        (announcement_payload, announcement_versions) = announcements
+        (page_payload, page_versions) = pages
+
+        return CachedResponse(
+            {
+                "upcoming_events": event_payload,
+                "announcements": announcement_payload,
+                "pages": page_payload,
+            },
+            weak_etag("home", tuple(page_names), event_versions, announcement_versions, page_versions),
+            None,  # ETag only: removing an event or announcement moves no timestamp forward
+            *list_lifetime(next_start)
+        )
@@ -0,0 +1,198 @@
+# services/checkin_service.py
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from app.models.registration import Registration
+from app.utils.bitmap import Bitmap
+from app.utils.tickets import verify_ticket
+
+# Scans are buffered in memory and written in one statement this often
+CHECKIN_FLUSH_SECONDS = float(os.getenv("CHECKIN_FLUSH_SECONDS", "1"))
+# Re-read an event's cancellations (and other workers' check-ins) this often
+CHECKIN_ROSTER_TTL = int(os.getenv("CHECKIN_ROSTER_TTL", "60"))
+
+
+class CheckIn(NamedTuple):
+    registration_id: int
+    event_id: int
+    user_id: int
+    checked_in_at: datetime
+
+
+class _Roster:
+    """What the door needs to know about one event, kept in memory"""
+
+    def __init__(self):
+        self.checked_in = Bitmap()
+        self.cancelled: Set[int] = set()
+        self.loaded_at: Optional[float] = None  # None until a load succeeded
+        self.retry_at = 0.0
+
+
+class CheckInDesk:
+    """
+    Checks tickets in without touching the database on the hot path: the
+    signature is verified in memory, duplicates are caught by a per-event
+    bitmap of registration ids, and attendance is buffered and written in
+    batches by flush(). If the database is briefly unavailable scans keep
+    working; the buffer is written once it is back.
+
+    Each worker process has its own desk. A ticket scanned at two workers
+    within one roster TTL is accepted by both (attendance is recorded once).
+    """
+
+    def __init__(self, roster_ttl: float = CHECKIN_ROSTER_TTL, clock=time.monotonic):
+        self.roster_ttl = roster_ttl
+        self.clock = clock
+        self._rosters: Dict[int, _Roster] = {}
+        self._pending: List[Tuple[int, datetime]] = []
+        self._lock = threading.Lock()
+
+    def check_in(self, db: Session, event_id: int, ticket: str) -> CheckIn:
+        """
+        Admit the holder of `ticket` to `event_id`. `db` is only used to (re)load
+        the event's roster, at most once per roster TTL.
+        """
+        contents = verify_ticket(ticket.strip())
+        if contents is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid ticket"
+            )
+        if contents.event_id != event_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Ticket is for another event"
+            )
+
+        roster = self._roster(db, event_id)
+        checked_in_at = datetime.utcnow()
+        with self._lock:
+            if contents.registration_id in roster.cancelled:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Registration was cancelled"
+                )
+            if not roster.checked_in.add(contents.registration_id):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Ticket already checked in"
+                )
+            self._pending.append((contents.registration_id, checked_in_at))
+        return CheckIn(contents.registration_id, event_id, contents.user_id, checked_in_at)
+
+    def note_cancelled(self, event_id: int, registration_id: int) -> None:
+        """Reject this registration's ticket from now on (called when it is cancelled)"""
+        with self._lock:
+            roster = self._rosters.get(event_id)
+            if roster is not None:
+                roster.cancelled.add(registration_id)
+
+    def checked_in_count(self, event_id: int) -> int:
+        roster = self._rosters.get(event_id)
+        return len(roster.checked_in) if roster else 0
+
+    def pending_writes(self) -> int:
+        return len(self._pending)
+
+    def flush(self, db: Session) -> int:
+        """
+        Write buffered check-ins in one batched UPDATE. On failure they go back to the
+        buffer for the next flush. Returns how many were written.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        registrations = Registration.__table__
+        try:
+            # Core executemany: no per-row match check, and the first recorded
+            # check-in wins when several workers scanned the same ticket
+            db.execute(
+                update(registrations)
+                .where(registrations.c.id == bindparam("registration_id"), registrations.c.checked_in_at.is_(None))
+                .values(checked_in_at=bindparam("at")),
+                [{"registration_id": registration_id, "at": at} for registration_id, at in batch]
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._pending[0:0] = batch
+            raise
+        return len(batch)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rosters.clear()
+            self._pending = []
+
+    def _roster(self, db: Session, event_id: int) -> _Roster:
+        now = self.clock()
+        roster = self._rosters.get(event_id)
+        if roster is None:
+            with self._lock:
+                roster = self._rosters.setdefault(event_id, _Roster())
+        stale = roster.loaded_at is None or now - roster.loaded_at >= self.roster_ttl
+        if stale and now >= roster.retry_at:
+            self._load(db, event_id, roster, now)
+        return roster
+
+    def _load(self, db: Session, event_id: int, roster: _Roster, now: float) -> None:
+        """Merge in cancellations and recorded check-ins; keep the old roster if the DB is down"""
+        try:
+            rows = db.execute(
+                select(Registration.id, Registration.is_cancelled, Registration.checked_in_at)
+                .where(Registration.event_id == event_id)
+                .where((Registration.is_cancelled == True) | Registration.checked_in_at.is_not(None))
+            ).all()
+        except Exception as e:
+            db.rollback()
+            # Try again in a few seconds, scanning on what we already know meanwhile
+            roster.retry_at = now + 5
+            print(f"[CHECK-IN] Could not load roster of event {event_id}: {e}")
+            return
+        with self._lock:
+            for registration_id, is_cancelled, checked_in_at in rows:
+                if is_cancelled:
+                    roster.cancelled.add(registration_id)
+                if checked_in_at is not None:
+                    roster.checked_in.add(registration_id)
+            roster.loaded_at = now
+
+
+check_in_desk = CheckInDesk()
+
+
+async def flush_check_ins_periodically(session_factory, interval: float = CHECKIN_FLUSH_SECONDS):
+    """Background loop started by the app: write buffered check-ins every `interval` seconds."""
+
+    def flush() -> int:
+        db = session_factory()
+        try:
+            return check_in_desk.flush(db)
+        finally:
+            db.close()
+
+    try:
+        while True:
+            try:
+                await run_in_threadpool(flush)
+            except Exception as e:
+                print(f"[CHECK-IN] Writing check-ins failed, will retry: {e}")
+            await asyncio.sleep(interval)
+    finally:
+        # Shutting down: write what is left
+        try:
+            flush()
+        except Exception as e:
+            print(f"[CHECK-IN] {check_in_desk.pending_writes()} check-ins were not written: {e}")
@@ -1,9 +1,12 @@
 # services/content_service.py
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.models.content import Announcement, PageContent
 from app.schemas.content import AnnouncementCreate, AnnouncementUpdate, PageContentUpdate
-from typing import List, Optional
+from app.services.event_cache import invalidate_content_responses
+from app.services.search_service import SearchService
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 class ContentService:
@@ -20,7 +23,10 @@ class ContentService:
             is_published=announcement_data.is_published
         )
         db.add(db_announcement)
+        db.flush()
+        SearchService.index_announcement(db, db_announcement)
         db.commit()
+        invalidate_content_responses()
         db.refresh(db_announcement)
         return db_announcement
 
@@ -35,6 +41,19 @@ class ContentService:
         # Order by creation date to show newest first
         return query.order_by(Announcement.created_at.desc()).all()
 
+    @staticmethod
+    def announcements_version(db: Session) -> Tuple[int, Optional[int], Optional[datetime]]:
+        """
+        (count, max id, last change) of the published announcements, from a single
+        aggregate query. Any create, edit, publish toggle or delete changes it.
+        """
+        count, max_id, last_modified = db.query(
+            func.count(Announcement.id),
+            func.max(Announcement.id),
+            func.max(func.coalesce(Announcement.updated_at, Announcement.created_at))
+        ).filter(Announcement.is_published == True).one()
+        return count, max_id, last_modified
+
     @staticmethod
     def get_announcement_by_id(db: Session, announcement_id: int) -> Optional[Announcement]:
         """Retrieves a single announcement by ID."""
@@ -55,8 +74,10 @@ class ContentService:
             setattr(db_announcement, key, value)
         
         # Manually update 'updated_at' if needed, though your model handles it with onupdate=func.now()
+        SearchService.index_announcement(db, db_announcement)
         
         db.commit()
+        invalidate_content_responses()
         db.refresh(db_announcement)
         return db_announcement
 
@@ -68,7 +89,9 @@ class ContentService:
             return False # Not found
         
         db.delete(db_announcement)
+        SearchService.remove(db, "announcement", announcement_id)
         db.commit()
+        invalidate_content_responses()
         return True
 
     # --- PAGECONTENT LOGIC (Read/Create/Update) ---
@@ -100,5 +123,6 @@ class ContentService:
             db.add(db_content)
 
         db.commit()
+        invalidate_content_responses()
         db.refresh(db_content)
         return db_content
\ No newline at end of file
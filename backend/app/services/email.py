@@ -1,7 +1,14 @@
 import os
 from datetime import datetime
+from typing import Iterable, Iterator
 
 import resend
+from resend.exceptions import ResendError
+
+from app.database import SessionLocal
+from app.services.email_outbox import EmailOutboxWorker, defer_email
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.utils.email_templates import RenderedEmail, get_email_template
 
 # REQUIRED in Railway variables
 resend.api_key = os.environ["RESEND_API_KEY"]
@@ -11,31 +18,112 @@ EMAIL_FROM = os.getenv("EMAIL_FROM", "E-Commerce Club <no-reply@e-commerceclubad
 FRONTEND_URL = os.getenv("FRONTEND_URL", "https://www.e-commerceclubada.xyz")
 
 
-def _send(to_email: str, subject: str, html: str):
+def _provider_failure(e: Exception) -> bool:
+    """
+    True if `e` means Resend is unhealthy (network error, 5xx, rate limit)
+    rather than that this particular message was rejected (other 4xx).
+    """
+    if isinstance(e, ResendError):
+        try:
+            code = int(e.code)
+        except (TypeError, ValueError):
+            return True
+        return code >= 500 or code == 429
+    return True
+
+
+# One breaker per worker process around every call to Resend
+email_breaker = CircuitBreaker(
+    "resend",
+    failure_rate=float(os.getenv("EMAIL_BREAKER_FAILURE_RATE", "0.5")),
+    min_calls=int(os.getenv("EMAIL_BREAKER_MIN_CALLS", "5")),
+    window_seconds=int(os.getenv("EMAIL_BREAKER_WINDOW_SECONDS", "60")),
+    open_seconds=int(os.getenv("EMAIL_BREAKER_OPEN_SECONDS", "30")),
+    max_open_seconds=int(os.getenv("EMAIL_BREAKER_MAX_OPEN_SECONDS", "600")),
+    is_failure=_provider_failure
+)
+
+
+def deliver_email(message: dict):
+    """Hand one Resend message to the provider through the breaker; raises on failure."""
+    return email_breaker.call(resend.Emails.send, message)
+
+
+def email_outbox_worker(session_factory) -> EmailOutboxWorker:
+    return EmailOutboxWorker(session_factory, deliver_email, email_breaker, EMAIL_FROM)
+
+
+def _send(to_email: str, subject: str, html: str, text: str | None = None):
     # Don’t crash your endpoint if Resend has an issue
+    message = {
+        "from": EMAIL_FROM,
+        "to": [to_email],
+        "subject": subject,
+        "html": html,
+    }
+    if text:
+        message["text"] = text
     try:
-        return resend.Emails.send(
-            {
-                "from": EMAIL_FROM,
-                "to": [to_email],
-                "subject": subject,
-                "html": html,
-            }
-        )
+        return deliver_email(message)
     except Exception as e:
         print(f"[EMAIL] Resend error: {e}")
+        if isinstance(e, CircuitOpenError) or _provider_failure(e):
+            # Not the message's fault: keep it and retry from the outbox
+            _defer(message, str(e))
         return None
 
 
-def send_registration_confirmation(email: str, full_name: str):
-    login_link = f"{FRONTEND_URL}/login"
-    html = f"""
-        <h2>Welcome to E-Commerce Club 🎉</h2>
-        <p>Hello {full_name},</p>
-        <p>Your account has been created successfully.</p>
-        <p><a href="{login_link}">Log in</a></p>
+def _defer(message: dict, error: str) -> None:
+    db = SessionLocal()
+    try:
+        defer_email(db, message, error)
+    except Exception as e:
+        print(f"[EMAIL] Could not store deferred email to {message['to'][0]}: {e}")
+    finally:
+        db.close()
+
+
+def _send_batch(messages: list[dict]):
     """
-    return _send(email, "Welcome to E-Commerce Club!", html)
+    Several messages in one Resend call (at most 100). Each message has "to",
+    "subject", "html" and optionally "text". Unlike _send, failures raise so the
+    caller can retry; CircuitOpenError means the provider is known to be down.
+    """
+    return email_breaker.call(resend.Batch.send, [
+        {"from": EMAIL_FROM, "to": [message["to"]], **{key: value for key, value in message.items() if key != "to"}}
+        for message in messages
+    ])
+
+
+def _send_rendered(to_email: str, message: RenderedEmail):
+    return _send(to_email, message.subject, message.html, message.text)
+
+
+def _event_details(event_date: datetime, event_time: str | None) -> dict:
+    return {
+        "date_str": event_date.strftime("%Y-%m-%d %H:%M"),
+        "time_str": event_time if event_time else "TBA",
+    }
+
+
+def send_registration_confirmation(email: str, full_name: str):
+    message = get_email_template("welcome").render(
+        full_name=full_name, login_link=f"{FRONTEND_URL}/login"
+    )
+    return _send_rendered(email, message)
+
+
+def event_registration_message(
+    full_name: str,
+    event_title: str,
+    event_date: datetime,
+    event_time: str | None,
+    location: str,
+) -> RenderedEmail:
+    return get_email_template("event_registration").render(
+        full_name=full_name, event_title=event_title, location=location,
+        **_event_details(event_date, event_time)
+    )
 
 
 def send_event_registration_confirmation(
@@ -46,22 +134,29 @@ def send_event_registration_confirmation(
     event_time: str | None,
     location: str,
 ):
-    date_str = event_date.strftime("%Y-%m-%d %H:%M")
-    time_str = event_time if event_time else "TBA"
-
-    html = f"""
-        <h2>Registration confirmed ✅</h2>
-        <p>Hello {full_name},</p>
-        <p>You have registered for:</p>
-        <ul>
-          <li><b>Event:</b> {event_title}</li>
-          <li><b>Date:</b> {date_str}</li>
-          <li><b>Time:</b> {time_str}</li>
-          <li><b>Location:</b> {location}</li>
-        </ul>
-        <p>See you there!</p>
-    """
-    return _send(email, f"You're registered: {event_title}", html)
+    message = event_registration_message(full_name, event_title, event_date, event_time, location)
+    return _send_rendered(email, message)
+
+def event_reminder_message(
+    full_name: str,
+    event_title: str,
+    event_date: datetime,
+    event_time: str | None,
+    location: str,
+    lead: str,
+) -> RenderedEmail:
+    """A reminder; `lead` is how far off the event is, e.g. "24 hours"."""
+    return get_email_template("event_reminder").render(
+        full_name=full_name, event_title=event_title, location=location, lead=lead,
+        **_event_details(event_date, event_time)
+    )
+
+def announcement_messages(title: str, content: str, full_names: Iterable[str]) -> Iterator[RenderedEmail]:
+    """One message per name in `full_names`, for mailing an announcement."""
+    return get_email_template("announcement").render_many(
+        ({"full_name": full_name} for full_name in full_names),
+        title=title, content=content, link=f"{FRONTEND_URL}/announcements"
+    )
 
 async def send_verification_email(
     email: str,
@@ -69,18 +164,9 @@ async def send_verification_email(
     user_name: str
 ):
     verification_link = f"{FRONTEND_URL}/verify-email?token={verification_token}"
-
-    html = f"""
-        <h2>Email Verification</h2>
-        <p>Hello {user_name},</p>
-        <p>Please confirm your new email address by clicking the link below:</p>
-        <p>
-            <a href="{verification_link}">
-                Verify Email
-            </a>
-        </p>
-        <p>If you did not request this change, please ignore this email.</p>
-    """
+    message = get_email_template("email_verification").render(
+        user_name=user_name, verification_link=verification_link
+    )
 
     # call sync sender inside async function (this is OK)
-    _send(email, "Verify your email address", html)
+    _send_rendered(email, message)
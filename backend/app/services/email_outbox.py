@@ -0,0 +1,154 @@
+# services/email_outbox.py
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.email_outbox import EmailOutbox
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+EMAIL_OUTBOX_POLL_SECONDS = int(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "60"))
+# Give up on a message after this many failed retries
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "8"))
+# Retry delays double from the first to the last: 30s, 1m, 2m, ... 1h
+EMAIL_OUTBOX_FIRST_DELAY = 30
+EMAIL_OUTBOX_MAX_DELAY = 3600
+EMAIL_OUTBOX_BATCH_SIZE = 100
+# How long a worker may hold a message it is sending
+EMAIL_OUTBOX_LEASE_SECONDS = 120
+
+# Takes {"from", "to", "subject", "html", "text"?}; raises when the message was not sent
+Deliver = Callable[[Dict], object]
+
+
+def defer_email(db: Session, message: Dict, error: str) -> EmailOutbox:
+    """Keep a message the provider could not take now; the outbox worker retries it."""
+    entry = EmailOutbox(
+        to_email=message["to"][0],
+        subject=message["subject"],
+        html=message["html"],
+        text=message.get("text"),
+        next_attempt_at=datetime.utcnow(),
+        last_error=error[:500]
+    )
+    db.add(entry)
+    db.commit()
+    return entry
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Wait before retry number `attempts` + 1"""
+    return timedelta(seconds=min(EMAIL_OUTBOX_MAX_DELAY, EMAIL_OUTBOX_FIRST_DELAY * 2 ** max(0, attempts - 1)))
+
+
+def outbox_counts(db: Session) -> Dict[str, int]:
+    """Messages waiting for a retry and messages given up on"""
+    pending, failed = db.execute(
+        select(
+            func.count(EmailOutbox.id).filter(EmailOutbox.sent_at.is_(None), EmailOutbox.failed_at.is_(None)),
+            func.count(EmailOutbox.id).filter(EmailOutbox.failed_at.is_not(None))
+        )
+    ).one()
+    return {"pending": pending, "failed": failed}
+
+
+class EmailOutboxWorker:
+    """
+    Retries deferred messages. Nothing is attempted while the breaker is open,
+    so an outage costs one cheap query per run rather than a timeout per message.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        deliver: Deliver,
+        breaker: CircuitBreaker,
+        from_email: str,
+        batch_size: int = EMAIL_OUTBOX_BATCH_SIZE,
+        max_attempts: int = EMAIL_OUTBOX_MAX_ATTEMPTS
+    ):
+        self.session_factory = session_factory
+        self.deliver = deliver
+        self.breaker = breaker
+        self.from_email = from_email
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+
+    def run_once(self, now: Optional[datetime] = None) -> int:
+        """Retry the messages that are due. Returns how many were sent."""
+        now = now or datetime.utcnow()
+        if self.breaker.state == CircuitBreaker.OPEN:
+            return 0
+        db = self.session_factory()
+        try:
+            due = db.execute(
+                select(EmailOutbox.id)
+                .where(
+                    EmailOutbox.sent_at.is_(None),
+                    EmailOutbox.failed_at.is_(None),
+                    EmailOutbox.next_attempt_at <= now
+                )
+                .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+                .limit(self.batch_size)
+            ).scalars().all()
+            sent = 0
+            for entry_id in due:
+                outcome = self._retry(db, entry_id, now)
+                if outcome is None:
+                    # Circuit opened again: leave the rest for a later run
+                    break
+                sent += outcome
+            return sent
+        finally:
+            db.close()
+
+    def _retry(self, db: Session, entry_id: int, now: datetime) -> Optional[int]:
+        """1 if sent, 0 if it failed, None if the breaker refused the call"""
+        claimed = db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id == entry_id, EmailOutbox.sent_at.is_(None), EmailOutbox.next_attempt_at <= now)
+            .values(next_attempt_at=now + timedelta(seconds=EMAIL_OUTBOX_LEASE_SECONDS))
+        ).rowcount
+        db.commit()
+        if not claimed:
+            return 0
+        entry = db.get(EmailOutbox, entry_id)
+        message = {"from": self.from_email, "to": [entry.to_email], "subject": entry.subject, "html": entry.html}
+        if entry.text:
+            message["text"] = entry.text
+
+        try:
+            self.deliver(message)
+        except CircuitOpenError:
+            entry.next_attempt_at = now
+            db.commit()
+            return None
+        except Exception as e:
+            entry.attempts += 1
+            entry.last_error = str(e)[:500]
+            if not self.breaker.is_failure(e) or entry.attempts >= self.max_attempts:
+                # Rejected by the provider, or out of retries
+                entry.failed_at = datetime.utcnow()
+            else:
+                entry.next_attempt_at = now + retry_delay(entry.attempts)
+            db.commit()
+            return 0
+        entry.attempts += 1
+        entry.sent_at = datetime.utcnow()
+        db.commit()
+        return 1
+
+async def flush_email_outbox_periodically(worker: EmailOutboxWorker, interval: int = EMAIL_OUTBOX_POLL_SECONDS):
+    """Background loop started by the app: retry deferred emails every `interval` seconds."""
+    while True:
+        try:
+            sent = await run_in_threadpool(worker.run_once)
+            if sent:
+                print(f"[EMAIL] Sent {sent} deferred emails from the outbox")
+        except Exception as e:
+            print(f"[EMAIL] Outbox run failed: {e}")
+        await asyncio.sleep(interval)
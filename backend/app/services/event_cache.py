@@ -0,0 +1,69 @@
+# services/event_cache.py
+import os
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Tuple
+
+from app.utils.cache import TTLCache
+
+# Public event responses are identical for every anonymous visitor, so they are
+# cached as ready-to-send JSON payloads. Writes in EventService invalidate them.
+EVENT_LIST_TTL = int(os.getenv("EVENT_LIST_TTL", "30"))
+EVENT_DETAIL_TTL = int(os.getenv("EVENT_DETAIL_TTL", "60"))
+EVENT_STALE_TTL = int(os.getenv("EVENT_STALE_TTL", "60"))
+HOME_BUNDLE_TTL = int(os.getenv("HOME_BUNDLE_TTL", "30"))
+
+
+class CachedResponse(NamedTuple):
+    """A serialized response together with its validators and cache lifetime."""
+    payload: Any
+    etag: str
+    last_modified: Optional[datetime]
+    ttl: float = EVENT_LIST_TTL
+    stale_ttl: float = EVENT_STALE_TTL
+
+
+# list key -> CachedResponse
+event_list_cache = TTLCache(ttl=EVENT_LIST_TTL, max_entries=1000)
+# event_id -> CachedResponse, or None for unknown ids
+event_detail_cache = TTLCache(ttl=EVENT_DETAIL_TTL, max_entries=5000)
+# requested page names -> CachedResponse for /api/bundle/home, which embeds
+# upcoming events, announcements and page blocks
+home_bundle_cache = TTLCache(ttl=HOME_BUNDLE_TTL, max_entries=100)
+
+
+def list_cache_key(
+    page: int,
+    page_size: int,
+    include_past: bool,
+    include_inactive: bool,
+    fields: Optional[Tuple[str, ...]] = None,
+    total_mode: Optional[str] = "exact"
+) -> Tuple:
+    """Normalized key: same filters in any order/spelling map to the same entry."""
+    return (int(page), int(page_size), bool(include_past), bool(include_inactive), fields, total_mode)
+
+
+def list_lifetime(next_start: Optional[datetime], now: Optional[datetime] = None) -> Tuple[float, float]:
+    """
+    (ttl, stale_ttl) for a listing of upcoming events. The listing changes by
+    itself when the next event starts, so neither window may extend past that.
+    """
+    if next_start is None:
+        return EVENT_LIST_TTL, EVENT_STALE_TTL
+    seconds_left = (next_start - (now or datetime.utcnow())).total_seconds()
+    ttl = max(1.0, min(EVENT_LIST_TTL, seconds_left))
+    stale_ttl = max(0.0, min(EVENT_STALE_TTL, seconds_left - ttl))
+    return ttl, stale_ttl
+
+
+def invalidate_event_responses(event_id: Optional[int] = None) -> None:
+    """Drop cached listings (and the detail of `event_id`) after an event write."""
+    event_list_cache.clear()
+    home_bundle_cache.clear()
+    if event_id is not None:
+        event_detail_cache.invalidate(event_id)
+
+
+def invalidate_content_responses() -> None:
+    """Drop composite responses that embed announcements or page blocks."""
+    home_bundle_cache.clear()
@@ -0,0 +1,253 @@
+# services/event_series_service.py
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterator, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.event import Event
+from app.models.event_series import EventSeries, EventSeriesException
+from app.models.registration import Registration
+from app.schemas.event import EventCreate, EventUpdate
+from app.schemas.event_series import EventSeriesCreate
+from app.services.event_service import EventService, event_count_cache
+from app.services.registration_service import RegistrationService
+from app.services.search_service import SearchService
+
+# Longest calendar window expanded in one request (a term, with room to spare)
+CALENDAR_MAX_DAYS = int(os.getenv("CALENDAR_MAX_DAYS", "200"))
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Event timestamps are stored as naive UTC"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def iter_occurrences(series: EventSeries, start: Optional[datetime] = None, end: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Scheduled starts of `series` within [start, end), in order, cancelled ones
+    included. Without a count limit the walk jumps straight to the window, so
+    the cost depends on the window, not on how old the series is.
+    Callers must bound the walk with `end` unless the series has until/count.
+    """
+    step = timedelta(days=series.interval) if series.frequency == "daily" else timedelta(weeks=series.interval)
+    first = series.starts_at
+    if series.frequency == "weekly" and series.weekdays:
+        # Every offset stays within one step, so occurrences come out in order
+        offsets = sorted(timedelta(days=(int(day) - first.weekday()) % 7) for day in series.weekdays.split(","))
+    else:
+        offsets = [timedelta(0)]
+
+    period = 0
+    if series.count is None and start is not None and start > first:
+        period = max(0, (start - first) // step - 1)
+    emitted = 0
+    while True:
+        base = first + period * step
+        for offset in offsets:
+            occurrence = base + offset
+            if series.until is not None and occurrence > series.until:
+                return
+            if end is not None and occurrence >= end:
+                return
+            emitted += 1
+            if series.count is not None and emitted > series.count:
+                return
+            if start is None or occurrence >= start:
+                yield occurrence
+        period += 1
+
+
+class EventSeriesService:
+    """Recurring events: rules are expanded on read, occurrences saved on first use"""
+
+    @staticmethod
+    def create_series(db: Session, series_data: EventSeriesCreate, admin_id: int) -> EventSeries:
+        """Create a series. No events are inserted until an occurrence is used."""
+        data = series_data.model_dump(exclude={"starts_at", "until", "weekdays"})
+        series = EventSeries(
+            **data,
+            starts_at=_naive_utc(series_data.starts_at),
+            until=_naive_utc(series_data.until) if series_data.until else None,
+            weekdays=",".join(map(str, series_data.weekdays)) if series_data.weekdays else None,
+            creator_id=admin_id,
+        )
+        db.add(series)
+        db.commit()
+        db.refresh(series)
+        return series
+
+    @staticmethod
+    def get_series(db: Session, series_id: int) -> Optional[EventSeries]:
+        return db.query(EventSeries).options(selectinload(EventSeries.exceptions)).filter(
+            EventSeries.id == series_id
+        ).first()
+
+    @staticmethod
+    def is_occurrence(series: EventSeries, occurrence_at: datetime) -> bool:
+        """True when the rule schedules `occurrence_at` and it was not cancelled"""
+        if any(exception.occurrence_at == occurrence_at for exception in series.exceptions):
+            return False
+        return next(iter_occurrences(series, occurrence_at, occurrence_at + timedelta(microseconds=1)), None) is not None
+
+    @staticmethod
+    def occurrence_event(series: EventSeries, occurrence_at: datetime) -> Event:
+        """Unsaved Event for one occurrence, shaped exactly like a created event"""
+        # The rule was validated when the series was created
+        event_data = EventCreate.model_construct(
+            title=series.title,
+            description=series.description,
+            event_date=occurrence_at,
+            location=series.location,
+            capacity=series.capacity,
+            registration_deadline=occurrence_at - timedelta(minutes=series.registration_closes_minutes),
+            image_url=series.image_url,
+        )
+        event = EventService.build_event(
+            event_data, series.creator_id, series_id=series.id, occurrence_at=occurrence_at
+        )
+        # build_event keeps only the date; the column reads back as midnight
+        event.event_date = datetime.combine(occurrence_at.date(), time.min)
+        return event
+
+    @staticmethod
+    def calendar(db: Session, start: date, end: date) -> List[Event]:
+        """
+        Everything scheduled on the days [start, end): saved events plus the
+        occurrences of active series that have not been materialized (unsaved).
+        Four queries however many series and occurrences the window holds.
+        """
+        window_start = datetime.combine(start, time.min)
+        window_end = datetime.combine(end, time.min)
+
+        events = db.query(Event).filter(
+            Event.is_active == True,
+            Event.event_date >= window_start,
+            Event.event_date < window_end
+        ).all()
+
+        series_list = db.query(EventSeries).options(selectinload(EventSeries.exceptions)).filter(
+            EventSeries.is_active == True,
+            EventSeries.starts_at < window_end,
+            or_(EventSeries.until.is_(None), EventSeries.until >= window_start)
+        ).all()
+
+        occurrences: List[Event] = []
+        if series_list:
+            # Saved occurrences, even if they were moved out of the window or cancelled
+            materialized = set(db.execute(
+                select(Event.series_id, Event.occurrence_at).where(
+                    Event.series_id.in_([series.id for series in series_list]),
+                    Event.occurrence_at >= window_start,
+                    Event.occurrence_at < window_end
+                )
+            ).all())
+            for series in series_list:
+                cancelled = {exception.occurrence_at for exception in series.exceptions}
+                for occurrence_at in iter_occurrences(series, window_start, window_end):
+                    if occurrence_at not in cancelled and (series.id, occurrence_at) not in materialized:
+                        occurrences.append(EventSeriesService.occurrence_event(series, occurrence_at))
+
+        return sorted(
+            events + occurrences,
+            key=lambda event: (event.event_date, event.event_time or "", event.id or 0, event.series_id or 0)
+        )
+
+    @staticmethod
+    def materialize(db: Session, series_id: int, occurrence_at: datetime) -> Event:
+        """
+        The Event row for an occurrence, inserted the first time it is needed.
+        A new row is only flushed: the caller commits it together with whatever
+        needed it, or rolls both back.
+        """
+        occurrence_at = _naive_utc(occurrence_at)
+        existing = db.query(Event).filter(
+            Event.series_id == series_id, Event.occurrence_at == occurrence_at
+        ).first()
+        if existing:
+            return existing
+
+        series = EventSeriesService.get_series(db, series_id)
+        if not series or not series.is_active or not EventSeriesService.is_occurrence(series, occurrence_at):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Occurrence not found"
+            )
+
+        event = EventSeriesService.occurrence_event(series, occurrence_at)
+        db.add(event)
+        try:
+            db.flush()
+        except IntegrityError:
+            # Another request materialized it first (uq_events_series_occurrence)
+            db.rollback()
+            return db.query(Event).filter(
+                Event.series_id == series_id, Event.occurrence_at == occurrence_at
+            ).one()
+        SearchService.index_event(db, event)
+        # Flushed so later upserts in this transaction (e.g. an edit) find the document
+        db.flush()
+        return event
+
+    @staticmethod
+    def update_occurrence(db: Session, series_id: int, occurrence_at: datetime, event_data: EventUpdate) -> Event:
+        """Edit one occurrence (materializing it); the rest of the series is unchanged"""
+        event = EventSeriesService.materialize(db, series_id, occurrence_at)
+        try:
+            event = EventService.update_event(db, event.id, event_data)
+        except Exception:
+            db.rollback()
+            raise
+        event_count_cache.clear()
+        return event
+
+    @staticmethod
+    def register_for_occurrence(db: Session, series_id: int, occurrence_at: datetime, user_id: int) -> Registration:
+        """
+        Register for one occurrence, materializing it in the same transaction:
+        a refused registration (duplicate, full, closed) leaves no Event behind.
+        """
+        event = EventSeriesService.materialize(db, series_id, occurrence_at)
+        try:
+            registration = RegistrationService.register_for_event(db, event_id=event.id, user_id=user_id)
+        except Exception:
+            db.rollback()
+            raise
+        event_count_cache.clear()
+        return registration
+
+    @staticmethod
+    def cancel_occurrence(db: Session, series_id: int, occurrence_at: datetime) -> None:
+        """
+        Drop one occurrence from the series. A materialized occurrence is soft
+        deleted like any event (so not while it has registrations).
+        """
+        occurrence_at = _naive_utc(occurrence_at)
+        series = EventSeriesService.get_series(db, series_id)
+        if not series or not EventSeriesService.is_occurrence(series, occurrence_at):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Occurrence not found"
+            )
+        event = db.query(Event).filter(
+            Event.series_id == series_id, Event.occurrence_at == occurrence_at
+        ).first()
+        if event and event.is_active:
+            EventService.delete_event(db, event.id)
+        db.add(EventSeriesException(series_id=series_id, occurrence_at=occurrence_at))
+        db.commit()
+
+    @staticmethod
+    def deactivate_series(db: Session, series_id: int) -> bool:
+        """Stop scheduling further occurrences; materialized events are kept"""
+        series = db.get(EventSeries, series_id)
+        if not series:
+            return False
+        series.is_active = False
+        db.commit()
+        return True
@@ -1,25 +1,127 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, or_, desc, select, func, literal, String
 from app.models.event import Event
 from app.models.registration import Registration
-from app.schemas.event import EventCreate, EventUpdate
-from datetime import datetime, timedelta
+from app.schemas.event import EventCreate, EventUpdate, EventResponse
+from app.services.availability_hub import availability_hub
+from app.services.event_cache import invalidate_event_responses
+from app.services.search_service import SearchService
+from app.utils.cache import TTLCache
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
-from typing import Optional, List
+from typing import Optional, List, NamedTuple, Sequence, Tuple
+from pydantic import TypeAdapter
+import base64
+import json
+import os
+
+# Seconds an availability snapshot may be served from memory (also the Cache-Control max-age)
+AVAILABILITY_CACHE_TTL = int(os.getenv("AVAILABILITY_CACHE_TTL", "5"))
+
+
+class AvailabilityCounters(NamedTuple):
+    capacity: int
+    current_registrations: int
+    registration_deadline: datetime
+
+
+# event_id -> AvailabilityCounters (or None for unknown events)
+availability_cache = TTLCache(ttl=AVAILABILITY_CACHE_TTL)
+
+# Listing totals are cached per filter combination and dropped on event writes.
+# The TTL bounds drift from events starting (which leave the upcoming listing).
+EVENT_COUNT_TTL = int(os.getenv("EVENT_COUNT_TTL", "60"))
+# Planner estimates are only used above this many rows; smaller tables are counted exactly
+APPROXIMATE_COUNT_MIN = int(os.getenv("APPROXIMATE_COUNT_MIN", "10000"))
+
+
+class EventCount(NamedTuple):
+    total: int
+    approximate: bool
+
+
+# (include_past, include_inactive, approximate) -> EventCount
+event_count_cache = TTLCache(ttl=EVENT_COUNT_TTL, max_entries=100)
+
+# Changes younger than this are held back from delta sync, so a cursor is never
+# handed out inside a second that can still receive writes (SQLite timestamps
+# have one-second resolution) or behind a transaction that has not committed yet.
+CHANGES_SETTLE_SECONDS = float(os.getenv("CHANGES_SETTLE_SECONDS", "2"))
+
+# Fields an event card needs; leaves out the large description column
+EVENT_SUMMARY_FIELDS = ("id", "title", "event_date", "event_time", "location", "image_url", "is_active")
+
+# Per-field serializers, so a projected event is dumped exactly like EventResponse
+_event_field_adapters = {
+    name: TypeAdapter(info.annotation) for name, info in EventResponse.model_fields.items()
+}
+
+
+def resolve_event_fields(fields: Optional[str] = None, view: Optional[str] = None) -> Optional[Tuple[str, ...]]:
+    """
+    Normalize ?fields= / ?view= into a sorted tuple of EventResponse fields, or
+    None for the full representation. Raises ValueError for unknown names.
+    """
+    if fields:
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - _event_field_adapters.keys()
+        if unknown:
+            raise ValueError(f"Unknown event fields: {', '.join(sorted(unknown))}")
+        return tuple(sorted(requested | {"id"}))
+    if view == "summary":
+        return tuple(sorted(EVENT_SUMMARY_FIELDS))
+    if view in (None, "full"):
+        return None
+    raise ValueError(f"Unknown view '{view}'")
+
+
+def project_event(event: Event, fields: Sequence[str]) -> dict:
+    """JSON-ready dict with only `fields`, without touching any other attribute."""
+    return {name: _event_field_adapters[name].dump_python(getattr(event, name), mode="json") for name in fields}
+
+
+# (last change, event id) of the last event a client has seen
+SyncCursor = Tuple[datetime, int]
+
+
+def encode_sync_token(cursor: SyncCursor) -> str:
+    changed_at, event_id = cursor
+    raw = f"{changed_at.isoformat()}|{event_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token: str) -> SyncCursor:
+    """Inverse of encode_sync_token; raises ValueError for anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+        changed_at, event_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(changed_at), int(event_id)
+    except (UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid sync token") from e
+
+
+def _timestamp_param(db: Session, value: datetime):
+    """Bind a timestamp for comparison with stored event timestamps."""
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite compares the stored text; CURRENT_TIMESTAMP has no fraction, so
+        # match its form instead of SQLAlchemy's zero-padded microseconds
+        return literal(value.replace(tzinfo=None).isoformat(sep=" "), String)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
 
 class EventService:
     """Service layer for event operations"""
     
     @staticmethod
-    def create_event(db: Session, event_data: EventCreate, admin_id: int) -> Event:
-        """Create a new event"""
+    def build_event(event_data: EventCreate, admin_id: int, **extra) -> Event:
+        """New Event from a create payload, not yet added to the session"""
         
         # 💥 NEW LOGIC: Extract date and time from the single datetime object 💥
         full_event_datetime: datetime = event_data.event_date
         event_date_only = full_event_datetime.date() # Get date object for event_date column
         event_time_only = full_event_datetime.strftime("%H:%M:%S") # Get time string for event_time column
 
-        event = Event(
+        return Event(
             title=event_data.title,
             description=event_data.description,
             
@@ -32,48 +134,175 @@ class EventService:
             registration_deadline=event_data.registration_deadline,
             image_url=event_data.image_url,
             creator_id=admin_id,
+            # Set explicitly so unsaved events (series occurrences) serialize like saved ones
+            current_registrations=0,
+            is_active=True,
+            **extra
         )
+    
+    @staticmethod
+    def create_event(db: Session, event_data: EventCreate, admin_id: int) -> Event:
+        """Create a new event"""
+        event = EventService.build_event(event_data, admin_id)
         
         db.add(event)
+        db.flush()  # assigns event.id for the search document
+        SearchService.index_event(db, event)
         # The hang should resolve here as all model requirements are met
         db.commit() 
         db.refresh(event)
+        # Also drops a cached 404 for this id
+        event_count_cache.clear()
+        invalidate_event_responses(event.id)
         return event
     
+    @staticmethod
+    def create_events(db: Session, events_data: Sequence[EventCreate], admin_id: int) -> List[Event]:
+        """Create many events in a single transaction: one batched INSERT, one commit"""
+        events = [EventService.build_event(event_data, admin_id) for event_data in events_data]
+        db.add_all(events)
+        db.flush()
+        SearchService.index_new_events(db, events)
+        event_ids = [event.id for event in events]
+        db.commit()
+        
+        event_count_cache.clear()
+        for event_id in event_ids:
+            invalidate_event_responses(event_id)
+        # Reload the expired instances with one query instead of one refresh each
+        loaded = {event.id: event for event in EventService.get_events_by_ids(db, event_ids)}
+        return [loaded[event_id] for event_id in event_ids]
+    
     @staticmethod
     def get_event(db: Session, event_id: int) -> Optional[Event]:
         """Get event by ID"""
         return db.query(Event).filter(Event.id == event_id).first()
     
+    @staticmethod
+    def get_events_by_ids(db: Session, event_ids: Sequence[int]) -> List[Event]:
+        """Events for the given ids in one IN query (unknown ids are simply absent)"""
+        if not event_ids:
+            return []
+        return db.query(Event).filter(Event.id.in_(event_ids)).all()
+    
     @staticmethod
     def get_events(
         db: Session,
         skip: int = 0,
         limit: int = 10,
         include_past: bool = False,
-        include_inactive: bool = False
-    ) -> tuple[List[Event], int]:
-        """Get list of events with pagination"""
+        include_inactive: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        count: bool = True
+    ) -> tuple[List[Event], Optional[int]]:
+        """
+        Get list of events with pagination.
+        With `fields`, only those columns (plus the timestamps the response
+        validators need) are fetched; everything else stays deferred.
+        The total comes from the count cache, or is None with count=False.
+        """
         query = db.query(Event)
+        if fields is not None:
+            columns = set(fields) | {"id", "created_at", "updated_at"}
+            query = query.options(load_only(*(getattr(Event, name) for name in sorted(columns))))
         
-        # Filter conditions
-        filters = []
-        if not include_past:
-            filters.append(Event.event_date >= datetime.utcnow())
-        if not include_inactive:
-            filters.append(Event.is_active == True)
-        
+        filters = EventService._listing_filters(include_past, include_inactive)
         if filters:
             query = query.filter(and_(*filters))
         
-        # Get total count
-        total = query.count()
+        total = EventService.count_events(db, include_past, include_inactive).total if count else None
         
         # Apply pagination and sorting
         events = query.order_by(Event.event_date.asc()).offset(skip).limit(limit).all()
         
         return events, total
     
+    @staticmethod
+    def _listing_filters(include_past: bool, include_inactive: bool) -> list:
+        filters = []
+        if not include_past:
+            filters.append(Event.event_date >= datetime.utcnow())
+        if not include_inactive:
+            filters.append(Event.is_active == True)
+        return filters
+    
+    @staticmethod
+    def count_events(
+        db: Session,
+        include_past: bool = False,
+        include_inactive: bool = False,
+        approximate: bool = False
+    ) -> EventCount:
+        """
+        Number of events in a listing, cached per filter combination.
+        With approximate=True on Postgres, large listings use the planner's row
+        estimate instead of counting; elsewhere the count is always exact.
+        """
+        def load():
+            filters = EventService._listing_filters(include_past, include_inactive)
+            if approximate:
+                estimate = EventService._estimate_rows(db, select(Event.id).where(*filters))
+                if estimate is not None and estimate >= APPROXIMATE_COUNT_MIN:
+                    return EventCount(estimate, True)
+            return EventCount(db.scalar(select(func.count(Event.id)).where(*filters)), False)
+        
+        return event_count_cache.get_or_load(
+            (bool(include_past), bool(include_inactive), bool(approximate)), load
+        )
+    
+    @staticmethod
+    def _estimate_rows(db: Session, statement) -> Optional[int]:
+        """Planner row estimate for a select; None where EXPLAIN estimates are unavailable"""
+        dialect = db.get_bind().dialect
+        if dialect.name != "postgresql":
+            return None
+        compiled = statement.compile(dialect=dialect)
+        plan = db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    
+    @staticmethod
+    def next_event_start(db: Session, include_inactive: bool = False) -> Optional[datetime]:
+        """Start of the earliest upcoming event (when the upcoming listing next changes by itself)"""
+        query = select(func.min(Event.event_date)).where(Event.event_date >= datetime.utcnow())
+        if not include_inactive:
+            query = query.where(Event.is_active == True)
+        return db.scalar(query)
+    
+    @staticmethod
+    def get_changes(
+        db: Session,
+        since: Optional[SyncCursor] = None,
+        limit: int = 200
+    ) -> Tuple[List[Event], Optional[SyncCursor], bool]:
+        """
+        Events created, updated or deactivated after `since`, oldest change first.
+        Returns (events, cursor of the last one, whether more are waiting).
+        Uses ix_events_changed_at; the cursor is keyset-based so paging never skips
+        or repeats a row.
+        """
+        changed_at = func.coalesce(Event.updated_at, Event.created_at)
+        cutoff = datetime.utcnow() - timedelta(seconds=CHANGES_SETTLE_SECONDS)
+        query = select(Event, changed_at).where(changed_at < _timestamp_param(db, cutoff))
+        if since is not None:
+            since_at, since_id = since
+            since_param = _timestamp_param(db, since_at)
+            query = query.where(or_(
+                changed_at > since_param,
+                and_(changed_at == since_param, Event.id > since_id)
+            ))
+        
+        rows = db.execute(query.order_by(changed_at, Event.id).limit(limit + 1)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if not rows:
+            return [], since, False
+        last_event, last_changed_at = rows[-1]
+        return [event for event, _ in rows], (last_changed_at, last_event.id), has_more
+    
     @staticmethod
     def update_event(
         db: Session,
@@ -89,9 +318,17 @@ class EventService:
         update_data = event_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(event, field, value)
+        SearchService.index_event(db, event)
         
         db.commit()
         db.refresh(event)
+        availability_cache.invalidate(event_id)
+        event_count_cache.clear()
+        invalidate_event_responses(event_id)
+        
+        # Capacity or deadline may have changed
+        if availability_hub.is_watched(event.id):
+            availability_hub.publish(event.id, EventService.availability_snapshot(event))
         return event
     
     @staticmethod
@@ -115,7 +352,11 @@ class EventService:
         
         # Soft delete
         event.is_active = False
+        SearchService.index_event(db, event)
         db.commit()
+        availability_cache.invalidate(event_id)
+        event_count_cache.clear()
+        invalidate_event_responses(event_id)
         return True
     
     @staticmethod
@@ -128,18 +369,38 @@ class EventService:
     
     @staticmethod
     def check_availability(db: Session, event_id: int) -> dict:
-        """Check event availability"""
-        event = db.query(Event).filter(Event.id == event_id).first()
-        if not event:
+        """
+        Check event availability.
+        Served from the in-memory counter snapshot; on a miss only one caller queries.
+        """
+        counters = availability_cache.get_or_load(
+            event_id, lambda: EventService._load_availability_counters(db, event_id)
+        )
+        if counters is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Event not found"
             )
         
+        return EventService.availability_snapshot(counters)
+    
+    @staticmethod
+    def _load_availability_counters(db: Session, event_id: int) -> Optional[AvailabilityCounters]:
+        """Read only the columns availability depends on"""
+        row = db.execute(
+            select(Event.capacity, Event.current_registrations, Event.registration_deadline)
+            .where(Event.id == event_id)
+        ).first()
+        return AvailabilityCounters(*row) if row else None
+    
+    @staticmethod
+    def availability_snapshot(event) -> dict:
+        """Availability payload for an event or its AvailabilityCounters"""
+        current = event.current_registrations or 0
         return {
             "capacity": event.capacity,
-            "current_registrations": event.current_registrations,
-            "available_spots": event.capacity - event.current_registrations,
-            "is_full": event.current_registrations >= event.capacity,
+            "current_registrations": current,
+            "available_spots": event.capacity - current,
+            "is_full": current >= event.capacity,
             "registration_open": datetime.utcnow() < event.registration_deadline
         }
@@ -4,6 +4,7 @@ from app.models.user import User
 from app.schemas.profile import ProfileUpdate
 from app.utils.auth import verify_password, hash_password
 from app.services.email import send_verification_email
+from app.services.token_service import TokenService
 from app.utils.tokens import create_email_verification_token, verify_email_verification_token
 from jose import JWTError
 
@@ -23,10 +24,10 @@ class ProfileService:
             user.email = str(data.email) # type: ignore
 
         if data.phone:
-            user.phone = data.phone # type: ignore
+            user.phone_number = data.phone # type: ignore
 
         if data.full_name:
-            user.name = data.full_name # type: ignore
+            user.full_name = data.full_name # type: ignore
 
 
         db.commit()
@@ -50,6 +51,8 @@ class ProfileService:
             )
 
         user.hashed_password = hash_password(new_password) #type: ignore
+        # Sign out everywhere: refresh tokens issued for the old password stop working
+        TokenService.revoke_user_tokens(db, user.id)
         db.commit()
 
     @staticmethod
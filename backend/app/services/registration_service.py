@@ -1,12 +1,30 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from sqlalchemy.orm import selectinload
 from app.models.event import Event
 from app.models.registration import Registration
 from app.models.user import User
+from app.services.availability_hub import availability_hub
+from app.services.checkin_service import check_in_desk
+from app.services.event_service import EventService, availability_cache
+from app.services.event_cache import invalidate_event_responses
 from datetime import datetime
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
+from app.utils.export import EXPORT_YIELD_PER
+
+# Export column name -> column of the registration or its user
+REGISTRANT_EXPORT_COLUMNS = {
+    "registration_id": Registration.id,
+    "registered_at": Registration.registered_at,
+    "user_id": User.id,
+    "email": User.email,
+    "full_name": User.full_name,
+    "phone_number": User.phone_number,
+    "is_university_student": User.is_university_student,
+    "student_id": User.student_id,
+    "national_id": User.national_id,
+}
 
 class RegistrationService:
     """Service layer for registration operations"""
@@ -75,6 +93,12 @@ class RegistrationService:
         db.add(registration)
         db.commit()
         db.refresh(registration)
+        availability_cache.invalidate(event_id)
+        invalidate_event_responses(event_id)
+        
+        # Notify live availability listeners
+        if availability_hub.is_watched(event_id):
+            availability_hub.publish(event_id, EventService.availability_snapshot(event))
         
         return registration
     
@@ -131,6 +155,13 @@ class RegistrationService:
         
         db.commit()
         db.refresh(registration)
+        availability_cache.invalidate(event.id)
+        invalidate_event_responses(event.id)
+        check_in_desk.note_cancelled(event.id, registration.id)
+        
+        # Notify live availability listeners
+        if availability_hub.is_watched(event.id):
+            availability_hub.publish(event.id, EventService.availability_snapshot(event))
         
         return registration
     
@@ -156,6 +187,18 @@ class RegistrationService:
             )
         ).all()
     
+    @staticmethod
+    def registrant_export_rows(db: Session, event_id: int, columns: Sequence[str]) -> Iterator[tuple]:
+        """Active registrants of an event as plain tuples, streamed in registration order"""
+        query = select(*(REGISTRANT_EXPORT_COLUMNS[name] for name in columns)).select_from(Registration).join(
+            User, User.id == Registration.user_id
+        ).where(
+            Registration.event_id == event_id,
+            Registration.is_cancelled.is_(False)
+        ).order_by(Registration.id)
+        for row in db.execute(query.execution_options(yield_per=EXPORT_YIELD_PER)):
+            yield tuple(row)
+    
     @staticmethod
     def get_user_registrations(
         db: Session,
@@ -0,0 +1,259 @@
+# services/reminder_service.py
+import asyncio
+import os
+import threading
+from datetime import datetime, time, timedelta
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, update, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.models.registration import Registration
+from app.models.reminder import ReminderDispatch
+from app.models.user import User
+from app.services.email import _send, event_reminder_message
+from app.utils.send_budget import SendBudget, email_send_budget
+
+# Reminder waves: kind -> (how long before the start it goes out, wording in the mail)
+REMINDER_WAVES: Dict[str, Tuple[timedelta, str]] = {
+    "24h": (timedelta(hours=24), "24 hours"),
+    "1h": (timedelta(hours=1), "1 hour"),
+}
+REMINDERS_ENABLED = os.getenv("REMINDERS_ENABLED", "true").lower() == "true"
+REMINDER_POLL_SECONDS = int(os.getenv("REMINDER_POLL_SECONDS", "60"))
+# Registrants read per query; memory stays at one chunk however large the event
+REMINDER_CHUNK_SIZE = int(os.getenv("REMINDER_CHUNK_SIZE", "500"))
+# A worker that stops renewing its lease (crash) is taken over after this long
+REMINDER_LEASE_SECONDS = int(os.getenv("REMINDER_LEASE_SECONDS", "120"))
+
+# (to_email, subject, html, text). Raising stops the wave until the next run; the
+# default Resend sender logs failures and carries on, like confirmation mails
+Transport = Callable[[str, str, str, str], object]
+
+
+def event_start(event: Event) -> datetime:
+    """
+    When the event begins. Created events keep the date in event_date and the
+    clock time in event_time; older rows may have it all in event_date.
+    """
+    try:
+        return datetime.combine(event.event_date.date(), time.fromisoformat(event.event_time))
+    except (TypeError, ValueError):
+        return event.event_date
+
+
+class ReminderScheduler:
+    """
+    Sends the reminder waves of every upcoming event. `run_once` is meant to be
+    called periodically from a worker thread (see send_event_reminders_periodically).
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        transport: Transport = _send,
+        budget: SendBudget = email_send_budget,
+        chunk_size: int = REMINDER_CHUNK_SIZE,
+        lease_seconds: int = REMINDER_LEASE_SECONDS
+    ):
+        self.session_factory = session_factory
+        self.transport = transport
+        self.budget = budget
+        self.chunk_size = chunk_size
+        self.lease = timedelta(seconds=lease_seconds)
+        self._stopping = threading.Event()
+
+    def stop(self) -> None:
+        """Finish the current message and return from run_once"""
+        self._stopping.set()
+
+    def run_once(self, now: Optional[datetime] = None) -> int:
+        """Send every reminder that is due. Returns the number of messages sent."""
+        now = now or datetime.utcnow()
+        db = self.session_factory()
+        try:
+            sent = 0
+            for event, kind in self.due_reminders(db, now):
+                if self._stopping.is_set():
+                    break
+                sent += self._dispatch(db, event, kind)
+            return sent
+        finally:
+            db.close()
+
+    def due_reminders(self, db: Session, now: datetime) -> List[Tuple[Event, str]]:
+        """
+        (event, kind) pairs to send now. Only the latest wave that is due goes
+        out: an event created 30 minutes before it starts gets the 1-hour
+        reminder, not both.
+        """
+        horizon = max(offset for offset, _ in REMINDER_WAVES.values())
+        # ix_events_active_date; event_date may be midnight of the start day
+        events = db.query(Event).filter(
+            Event.is_active == True,
+            Event.event_date >= datetime.combine(now.date(), time.min),
+            Event.event_date <= now + horizon
+        ).all()
+        events = [event for event in events if now < event_start(event) <= now + horizon]
+        if not events:
+            return []
+
+        completed = set(db.execute(
+            select(ReminderDispatch.event_id, ReminderDispatch.kind).where(
+                ReminderDispatch.event_id.in_([event.id for event in events]),
+                ReminderDispatch.completed_at.is_not(None)
+            )
+        ).all())
+        due = []
+        for event in events:
+            waves = sorted(
+                (offset, kind) for kind, (offset, _) in REMINDER_WAVES.items()
+                if event_start(event) - offset <= now
+            )
+            if waves and (event.id, waves[0][1]) not in completed:
+                due.append((event, waves[0][1]))
+        return due
+
+    def _claim(self, db: Session, event_id: int, kind: str) -> Optional[ReminderDispatch]:
+        """The progress row of this wave, if no other worker holds it"""
+        progress = db.query(ReminderDispatch).filter(
+            ReminderDispatch.event_id == event_id, ReminderDispatch.kind == kind
+        ).first()
+        if progress is None:
+            db.add(ReminderDispatch(event_id=event_id, kind=kind))
+            try:
+                db.commit()
+            except IntegrityError:
+                # Another worker created it first
+                db.rollback()
+            progress = db.query(ReminderDispatch).filter(
+                ReminderDispatch.event_id == event_id, ReminderDispatch.kind == kind
+            ).one()
+
+        now = datetime.utcnow()
+        claimed = db.execute(
+            update(ReminderDispatch)
+            .where(
+                ReminderDispatch.id == progress.id,
+                ReminderDispatch.completed_at.is_(None),
+                or_(ReminderDispatch.lease_expires_at.is_(None), ReminderDispatch.lease_expires_at < now)
+            )
+            .values(lease_expires_at=now + self.lease)
+        ).rowcount
+        db.commit()
+        if not claimed:
+            return None
+        db.refresh(progress)
+        return progress
+
+    def _dispatch(self, db: Session, event: Event, kind: str) -> int:
+        """Mail one wave, resuming after the last registration already handled"""
+        progress = self._claim(db, event.id, kind)
+        if progress is None:
+            return 0
+        lead = REMINDER_WAVES[kind][1]
+        # Plain values: every checkpoint commit expires the ORM instance
+        event_id, title, event_time, location = event.id, event.title, event.event_time, event.location
+        starts_at = event_start(event)
+        progress_id, cursor = progress.id, progress.last_registration_id
+        sent = unsaved = 0
+
+        def checkpoint() -> None:
+            # One commit per chunk rather than per message. A crash re-sends at most
+            # the unsaved part of one chunk; delivered messages are always saved on errors
+            nonlocal unsaved
+            db.execute(
+                update(ReminderDispatch)
+                .where(ReminderDispatch.id == progress_id)
+                .values(
+                    last_registration_id=cursor,
+                    sent_count=ReminderDispatch.sent_count + unsaved,
+                    lease_expires_at=datetime.utcnow() + self.lease
+                )
+            )
+            db.commit()
+            unsaved = 0
+
+        try:
+            while True:
+                # Keyset over ix_registrations_event_id_id; stops early if the event is cancelled
+                chunk = db.execute(
+                    select(Registration.id, User.email, User.full_name)
+                    .join(User, User.id == Registration.user_id)
+                    .join(Event, Event.id == Registration.event_id)
+                    .where(
+                        Registration.event_id == event_id,
+                        Registration.id > cursor,
+                        Registration.is_cancelled == False,
+                        Event.is_active == True
+                    )
+                    .order_by(Registration.id)
+                    .limit(self.chunk_size)
+                ).all()
+                if not chunk:
+                    break
+                renew_at = monotonic() + self.lease.total_seconds() / 2
+                for registration_id, email, full_name in chunk:
+                    if not self.budget.acquire(1, self._stopping) or self._stopping.is_set():
+                        if unsaved:
+                            checkpoint()
+                        return sent
+                    message = event_reminder_message(
+                        full_name, title, starts_at, event_time, location, lead
+                    )
+                    self.transport(email, message.subject, message.html, message.text)
+                    cursor = registration_id
+                    sent += 1
+                    unsaved += 1
+                    if monotonic() >= renew_at:
+                        # A throttled chunk can outlast the lease: renew it on the way
+                        checkpoint()
+                        renew_at = monotonic() + self.lease.total_seconds() / 2
+                if unsaved:
+                    checkpoint()
+
+            db.execute(
+                update(ReminderDispatch)
+                .where(ReminderDispatch.id == progress_id)
+                .values(completed_at=datetime.utcnow(), lease_expires_at=None)
+            )
+            db.commit()
+            return sent
+        except Exception as e:
+            # Save what was delivered; the rest is retried on the next run
+            db.rollback()
+            print(f"[REMINDERS] Event {event_id} ({kind}) stopped after {sent} messages: {e}")
+            if unsaved:
+                checkpoint()
+            return sent
+        finally:
+            self._release(db, progress_id)
+
+    def _release(self, db: Session, progress_id: int) -> None:
+        """Let the next run (any worker) pick up an unfinished wave right away"""
+        db.execute(
+            update(ReminderDispatch)
+            .where(ReminderDispatch.id == progress_id, ReminderDispatch.completed_at.is_(None))
+            .values(lease_expires_at=None)
+        )
+        db.commit()
+
+async def send_event_reminders_periodically(session_factory, interval: int = REMINDER_POLL_SECONDS):
+    """Background loop started by the app: send due reminders every `interval` seconds."""
+    scheduler = ReminderScheduler(session_factory)
+    try:
+        while True:
+            try:
+                sent = await run_in_threadpool(scheduler.run_once)
+                if sent:
+                    print(f"[REMINDERS] Sent {sent} event reminders")
+            except Exception as e:
+                print(f"[REMINDERS] Reminder run failed: {e}")
+            await asyncio.sleep(interval)
+    finally:
+        # Cancelling the task does not stop the worker thread; this does
+        scheduler.stop()
@@ -0,0 +1,193 @@
+# services/search_service.py
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, bindparam, case, func, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.models.content import Announcement
+from app.models.event import Event
+from app.models.search_document import SearchDocument, PG_DOCUMENT_VECTOR
+
+SEARCH_KINDS = ("event", "announcement")
+EXCERPT_CHARS = 200
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Rank and page inside the FTS index (which only holds visible documents),
+# then join just the page rows for display
+_SQLITE_SEARCH = """
+    SELECT d.kind, d.ref_id, d.title, substr(d.body, 1, :excerpt) AS excerpt, -hits.rank AS score
+    FROM (
+        SELECT rowid, bm25(search_documents_fts, 10.0, 1.0, 0.0) AS rank
+        FROM search_documents_fts
+        WHERE search_documents_fts MATCH :query
+        ORDER BY rank
+        LIMIT :limit OFFSET :offset
+    ) AS hits
+    JOIN search_documents AS d ON d.id = hits.rowid
+    ORDER BY hits.rank, d.id
+"""
+
+_PG_SEARCH = f"""
+    SELECT d.kind, d.ref_id, d.title, left(d.body, :excerpt) AS excerpt,
+           ts_rank({PG_DOCUMENT_VECTOR}, query) AS score
+    FROM search_documents AS d, websearch_to_tsquery('english'::regconfig, :query) AS query
+    WHERE ({PG_DOCUMENT_VECTOR}) @@ query AND d.is_visible AND d.kind IN :kinds
+    ORDER BY score DESC, d.id
+    LIMIT :limit OFFSET :offset
+"""
+
+
+def _fts5_query(q: str, kinds: Sequence[str]) -> Optional[str]:
+    """
+    Plain words to an FTS5 query: every word required in title or body, the last
+    one as a prefix, optionally restricted to some kinds.
+    """
+    words = _WORD.findall(q)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    query = "{title body} : (" + " ".join(terms) + ")"
+    if set(kinds) != set(SEARCH_KINDS):
+        query += " AND kind : (" + " OR ".join(f'"{kind}"' for kind in kinds) + ")"
+    return query
+
+
+class SearchService:
+    """Maintains the search_documents index and queries it"""
+
+    @staticmethod
+    def _upsert(db: Session, kind: str, ref_id: int, title: str, body: str, visible: bool) -> None:
+        """Stage the document in the caller's transaction (the caller commits)."""
+        document = db.query(SearchDocument).filter(
+            SearchDocument.kind == kind, SearchDocument.ref_id == ref_id
+        ).first()
+        if document is None:
+            db.add(SearchDocument(kind=kind, ref_id=ref_id, title=title, body=body, is_visible=visible))
+            return
+        if (document.title, document.body, document.is_visible) != (title, body, visible):
+            document.title, document.body, document.is_visible = title, body, visible
+
+    @staticmethod
+    def index_event(db: Session, event: Event) -> None:
+        body = f"{event.description or ''}\n{event.location or ''}"
+        SearchService._upsert(db, "event", event.id, event.title, body, bool(event.is_active))
+
+    @staticmethod
+    def index_new_events(db: Session, events: Sequence[Event]) -> None:
+        """Bulk variant of index_event for freshly inserted events (no lookup needed)."""
+        db.add_all([
+            SearchDocument(
+                kind="event", ref_id=event.id, title=event.title,
+                body=f"{event.description or ''}\n{event.location or ''}", is_visible=bool(event.is_active)
+            )
+            for event in events
+        ])
+
+    @staticmethod
+    def index_announcement(db: Session, announcement: Announcement) -> None:
+        SearchService._upsert(
+            db, "announcement", announcement.id, announcement.title,
+            announcement.content or "", bool(announcement.is_published)
+        )
+
+    @staticmethod
+    def remove(db: Session, kind: str, ref_id: int) -> None:
+        db.query(SearchDocument).filter(
+            SearchDocument.kind == kind, SearchDocument.ref_id == ref_id
+        ).delete(synchronize_session=False)
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """Re-create every document from the source tables. Returns the number indexed."""
+        db.query(SearchDocument).delete(synchronize_session=False)
+        count = 0
+        for event in db.query(Event).yield_per(500):
+            SearchService.index_event(db, event)
+            count += 1
+        for announcement in db.query(Announcement).yield_per(500):
+            SearchService.index_announcement(db, announcement)
+            count += 1
+        db.commit()
+        return count
+
+    @staticmethod
+    def search(
+        db: Session,
+        q: str,
+        kinds: Sequence[str] = SEARCH_KINDS,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Tuple[List[dict], bool]:
+        """
+        Ranked hits (best first) and whether another page exists. Title matches
+        weigh more than body matches. Only visible documents are returned.
+        """
+        dialect = db.get_bind().dialect.name
+        params = {"excerpt": EXCERPT_CHARS, "limit": limit + 1, "offset": offset}
+        if dialect == "sqlite":
+            params["query"] = _fts5_query(q, kinds)
+            statement = text(_SQLITE_SEARCH)
+        elif dialect == "postgresql":
+            params["query"] = q.strip()
+            params["kinds"] = list(kinds)
+            statement = text(_PG_SEARCH).bindparams(bindparam("kinds", expanding=True))
+        else:
+            return SearchService._like_search(db, q, kinds, limit, offset)
+        if not params["query"]:
+            return [], False
+
+        rows = db.execute(statement, params).mappings().all()
+        hits = [
+            {"kind": row["kind"], "id": row["ref_id"], "title": row["title"],
+             "excerpt": row["excerpt"], "score": float(row["score"])}
+            for row in rows[:limit]
+        ]
+        return hits, len(rows) > limit
+
+    @staticmethod
+    def _like_search(
+        db: Session,
+        q: str,
+        kinds: Sequence[str],
+        limit: int,
+        offset: int
+    ) -> Tuple[List[dict], bool]:
+        """
+        Fallback for databases without a full-text index: every word must occur
+        in the title or body (case-insensitive substring). Documents matching
+        all words in the title come first; no stemming, and it scans the table.
+        """
+        words = _WORD.findall(q)
+        if not words:
+            return [], False
+
+        def contains(column, word):
+            escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return func.lower(column).like(f"%{escaped.lower()}%", escape="\\")
+
+        in_title = and_(*(contains(SearchDocument.title, word) for word in words))
+        score = case((in_title, 2.0), else_=1.0)
+        rows = db.execute(
+            select(
+                SearchDocument.kind, SearchDocument.ref_id, SearchDocument.title,
+                func.substr(SearchDocument.body, 1, EXCERPT_CHARS).label("excerpt"),
+                score.label("score")
+            )
+            .where(
+                SearchDocument.is_visible == True,
+                SearchDocument.kind.in_(list(kinds)),
+                *(or_(contains(SearchDocument.title, word), contains(SearchDocument.body, word)) for word in words)
+            )
+            .order_by(score.desc(), SearchDocument.id)
+            .limit(limit + 1)
+            .offset(offset)
+        ).mappings().all()
+        hits = [
+            {"kind": row["kind"], "id": row["ref_id"], "title": row["title"],
+             "excerpt": row["excerpt"], "score": float(row["score"])}
+            for row in rows[:limit]
+        ]
+        return hits, len(rows) > limit
@@ -0,0 +1,139 @@
+# services/token_service.py
+import asyncio
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.utils.auth import REFRESH_TOKEN_EXPIRE_DAYS
+
+REFRESH_TOKEN_CLEANUP_INTERVAL_SECONDS = 3600
+
+
+def _hash_token(raw_token: str) -> str:
+    return hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+
+
+class TokenService:
+    """Service layer for refresh tokens"""
+
+    @staticmethod
+    def issue_refresh_token(db: Session, user_id: int) -> str:
+        """Create a refresh token for a user and return the raw value (shown once)."""
+        raw_token = secrets.token_urlsafe(32)
+        db.add(RefreshToken(
+            user_id=user_id,
+            token_hash=_hash_token(raw_token),
+            expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        ))
+        db.commit()
+        return raw_token
+
+    @staticmethod
+    def rotate_refresh_token(db: Session, raw_token: str) -> Tuple[User, str]:
+        """
+        Exchange a refresh token for a new one. The old token is deleted in the
+        same transaction, so every token can be used exactly once, even by
+        concurrent requests.
+        """
+        row = db.execute(
+            select(RefreshToken, User)
+            .join(User, User.id == RefreshToken.user_id)
+            .where(RefreshToken.token_hash == _hash_token(raw_token))
+        ).first()
+
+        if row is None or row.RefreshToken.expires_at <= datetime.utcnow():
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired refresh token",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+
+        token, user = row.RefreshToken, row.User
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="User account is inactive"
+            )
+
+        # Delete by hash in one statement: of two concurrent refreshes with the
+        # same token only one removes the row, the other gets a 401
+        result = db.execute(
+            delete(RefreshToken).where(RefreshToken.token_hash == token.token_hash)
+        )
+        if result.rowcount != 1:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired refresh token",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+
+        new_raw_token = secrets.token_urlsafe(32)
+        db.add(RefreshToken(
+            user_id=user.id,
+            token_hash=_hash_token(new_raw_token),
+            expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        ))
+        db.commit()
+        return user, new_raw_token
+
+    @staticmethod
+    def revoke_refresh_token(db: Session, raw_token: str) -> bool:
+        """Delete a single refresh token (logout)."""
+        result = db.execute(
+            delete(RefreshToken).where(RefreshToken.token_hash == _hash_token(raw_token))
+        )
+        db.commit()
+        return result.rowcount > 0
+
+    @staticmethod
+    def revoke_user_tokens(db: Session, user_id: int) -> None:
+        """Delete every refresh token of a user, ending all their sessions (caller commits)."""
+        db.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+
+    @staticmethod
+    def purge_expired(db: Session, batch_size: int = 1000, now: Optional[datetime] = None) -> int:
+        """
+        Delete expired tokens in batches of `batch_size`, committing after each
+        batch so the table is never locked for long. Returns the number deleted.
+        """
+        now = now or datetime.utcnow()
+        deleted = 0
+        while True:
+            ids = db.scalars(
+                select(RefreshToken.id)
+                .where(RefreshToken.expires_at <= now)
+                .limit(batch_size)
+            ).all()
+            if not ids:
+                return deleted
+            db.execute(delete(RefreshToken).where(RefreshToken.id.in_(ids)))
+            db.commit()
+            deleted += len(ids)
+
+
+async def purge_expired_refresh_tokens_periodically(session_factory, interval: int = REFRESH_TOKEN_CLEANUP_INTERVAL_SECONDS):
+    """Background loop started by the app: purge expired refresh tokens every `interval` seconds."""
+    def purge_once() -> int:
+        db = session_factory()
+        try:
+            return TokenService.purge_expired(db)
+        finally:
+            db.close()
+
+    while True:
+        try:
+            deleted = await run_in_threadpool(purge_once)
+            if deleted:
+                print(f"[AUTH] Purged {deleted} expired refresh tokens")
+        except Exception as e:
+            print(f"[AUTH] Refresh token cleanup failed: {e}")
+        await asyncio.sleep(interval)
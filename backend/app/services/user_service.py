@@ -0,0 +1,274 @@
+# services/user_service.py
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import and_, func, insert, or_, select, union, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.schemas.user import UserCreate
+from app.utils.auth import hash_passwords
+from app.utils.export import EXPORT_YIELD_PER
+from app.utils.token_versions import note_token_version_bumps
+
+# Below this length trigrams cannot narrow anything down, so Postgres falls back to prefixes too
+TRIGRAM_MIN_LENGTH = 3
+
+
+# Export column name -> column; hashed_password and token_version are never exported
+USER_EXPORT_COLUMNS = {
+    "id": User.id,
+    "email": User.email,
+    "full_name": User.full_name,
+    "phone_number": User.phone_number,
+    "is_university_student": User.is_university_student,
+    "student_id": User.student_id,
+    "national_id": User.national_id,
+    "is_active": User.is_active,
+    "is_admin": User.is_admin,
+    "created_at": User.created_at,
+}
+
+# Member import: accepted CSV columns, the most rows per upload, and rows per
+# INSERT (also the size of each IN list in the duplicate lookup)
+IMPORT_COLUMNS = ("email", "full_name", "phone_number", "is_university_student", "student_id", "national_id", "password")
+IMPORT_REQUIRED_COLUMNS = ("email", "full_name", "password")
+IMPORT_MAX_ROWS = int(os.getenv("IMPORT_MAX_ROWS", "10000"))
+IMPORT_BATCH_SIZE = 500
+
+# Unique fields in the order conflicts are reported, as worded by /api/auth/register
+_UNIQUE_LABELS = {"email": "Email", "student_id": "Student ID", "national_id": "National ID"}
+
+
+def _unique_values(user: UserCreate) -> List[Tuple[str, str]]:
+    """The (field, value) pairs that must be new. The placeholder id UserCreate fills in is not checked."""
+    return [
+        ("email", user.email),
+        ("student_id", user.student_id) if user.is_university_student else ("national_id", user.national_id),
+    ]
+
+
+def _chunks(items: Sequence, size: int) -> Iterator[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _row_error(line: int, email: Optional[str], errors: List[str]) -> dict:
+    return {"row": line, "email": email, "errors": errors}
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _prefix_range(expression, prefix: str):
+    """`expression` starts with `prefix`, written as a range so a btree index can serve it."""
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return and_(expression >= prefix, expression < upper)
+
+
+class UserService:
+    """Admin-side user lookups"""
+
+    @staticmethod
+    def _match(db: Session, q: str):
+        """Condition matching `q` against email, full name, student id and national id."""
+        if db.get_bind().dialect.name == "postgresql" and len(q) >= TRIGRAM_MIN_LENGTH:
+            # Substring match, served by the gin_trgm_ops indexes
+            pattern = f"%{_escape_like(q)}%"
+            return or_(*(func.lower(column).like(pattern, escape="\\") for column in (
+                User.email, User.full_name, User.student_id, User.national_id
+            )))
+        # One index range per column, unioned. Written as an OR, SQLite (with bound
+        # parameters) prefers walking the whole table in id order instead.
+        columns = (
+            func.lower(User.email),
+            func.lower(User.full_name),
+            User.student_id,
+            func.lower(User.national_id),
+        )
+        return User.id.in_(union(*(select(User.id).where(_prefix_range(column, q)) for column in columns)))
+
+    @staticmethod
+    def _filters(db: Session, q: Optional[str], is_active: Optional[bool], is_admin: Optional[bool]) -> list:
+        """WHERE conditions shared by search and bulk updates"""
+        conditions = []
+        q = (q or "").strip().lower()
+        if q:
+            conditions.append(UserService._match(db, q))
+        if is_active is not None:
+            conditions.append(User.is_active == is_active)
+        if is_admin is not None:
+            conditions.append(User.is_admin == is_admin)
+        return conditions
+
+    @staticmethod
+    def search_users(
+        db: Session,
+        q: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        is_admin: Optional[bool] = None,
+        after: Optional[int] = None,
+        limit: int = 50
+    ) -> Tuple[List[User], Optional[int]]:
+        """
+        One page of users ordered by id, plus the cursor for the next page (None on
+        the last one). `q` matches a prefix of email, full name, student id or
+        national id (any substring on Postgres), case-insensitively.
+        """
+        query = db.query(User).filter(*UserService._filters(db, q, is_active, is_admin))
+        if after is not None:
+            query = query.filter(User.id > after)
+
+        users = query.order_by(User.id).limit(limit + 1).all()
+        if len(users) > limit:
+            return users[:limit], users[limit - 1].id
+        return users, None
+
+    @staticmethod
+    def bulk_update(
+        db: Session,
+        values: Dict[str, bool],
+        user_ids: Optional[Sequence[int]] = None,
+        q: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        is_admin: Optional[bool] = None,
+        exclude_id: Optional[int] = None
+    ) -> List[int]:
+        """
+        Set `values` (is_active / is_admin) on the users in `user_ids`, or on those
+        matching the search filters, with a single UPDATE that also revokes their
+        tokens. Users already in the target state are left alone. Commits, and
+        returns the ids that changed.
+        """
+        if user_ids is not None:
+            conditions = [User.id.in_(user_ids)]
+        else:
+            conditions = UserService._filters(db, q, is_active, is_admin)
+        conditions.append(or_(*(getattr(User, field).is_distinct_from(value) for field, value in values.items())))
+        if exclude_id is not None:
+            conditions.append(User.id != exclude_id)
+
+        statement = (
+            update(User)
+            .where(*conditions)
+            .values(**values, token_version=User.token_version + 1, updated_at=func.now())
+            .returning(User.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        changed = sorted(db.execute(statement).scalars())
+        note_token_version_bumps(db, changed)
+        db.commit()
+        return changed
+
+    @staticmethod
+    def export_rows(
+        db: Session,
+        columns: Sequence[str],
+        is_active: Optional[bool] = None,
+        is_admin: Optional[bool] = None
+    ) -> Iterator[tuple]:
+        """Selected user columns as plain tuples, streamed in id order"""
+        query = select(*(USER_EXPORT_COLUMNS[name] for name in columns)).order_by(User.id)
+        if is_active is not None:
+            query = query.where(User.is_active == is_active)
+        if is_admin is not None:
+            query = query.where(User.is_admin == is_admin)
+        for row in db.execute(query.execution_options(yield_per=EXPORT_YIELD_PER)):
+            yield tuple(row)
+
+    @staticmethod
+    def import_users(db: Session, rows: Iterable[Tuple[int, Dict[str, Optional[str]]]], dry_run: bool = False) -> dict:
+        """
+        Create users from (line number, CSV row) pairs, validated like /api/auth/register.
+        Bad rows are reported and skipped; the rest are created. Duplicates against
+        existing users are found with a few IN lookups for the whole file, passwords
+        are hashed across worker processes, and users are inserted in batches.
+        Raises ValueError when the file has more than IMPORT_MAX_ROWS rows.
+        """
+        errors = []
+        accepted: List[Tuple[int, UserCreate]] = []
+        total = 0
+        for line, raw in rows:
+            total += 1
+            if total > IMPORT_MAX_ROWS:
+                raise ValueError(f"At most {IMPORT_MAX_ROWS} rows can be imported at once")
+            # Blank cells mean "not given", so defaults and optional fields behave as in the form
+            data = {
+                key: value.strip() for key, value in raw.items()
+                if key in IMPORT_COLUMNS and value is not None and value.strip()
+            }
+            try:
+                accepted.append((line, UserCreate(**data)))
+            except ValidationError as e:
+                errors.append(_row_error(line, data.get("email"), [
+                    f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+                    for err in e.errors()
+                ]))
+
+        # Values already taken, fetched per field with one IN query per chunk
+        wanted: Dict[str, set] = {field: set() for field in _UNIQUE_LABELS}
+        for _, user in accepted:
+            for field, value in _unique_values(user):
+                wanted[field].add(value)
+        taken: Dict[str, set] = {field: set() for field in _UNIQUE_LABELS}
+        for field, values in wanted.items():
+            column = getattr(User, field)
+            for chunk in _chunks(sorted(values), IMPORT_BATCH_SIZE):
+                taken[field].update(db.execute(select(column).where(column.in_(chunk))).scalars())
+
+        # Then a single pass in file order: the first occurrence of a value wins
+        seen: Dict[str, Dict[str, int]] = {field: {} for field in _UNIQUE_LABELS}
+        new_users: List[Tuple[int, UserCreate]] = []
+        for line, user in accepted:
+            problems = []
+            for field, value in _unique_values(user):
+                if value in taken[field]:
+                    problems.append(f"{_UNIQUE_LABELS[field]} already registered")
+                elif value in seen[field]:
+                    problems.append(f"{_UNIQUE_LABELS[field]} duplicates row {seen[field][value]}")
+            if problems:
+                errors.append(_row_error(line, user.email, problems))
+                continue
+            for field, value in _unique_values(user):
+                seen[field][value] = line
+            new_users.append((line, user))
+
+        created = 0
+        if not dry_run and new_users:
+            hashes = hash_passwords([user.password for _, user in new_users])
+            values = [
+                (line, {
+                    "email": user.email,
+                    "full_name": user.full_name,
+                    "hashed_password": hashed,
+                    "phone_number": user.phone_number,
+                    "is_university_student": user.is_university_student,
+                    "student_id": user.student_id,
+                    "national_id": user.national_id,
+                })
+                for (line, user), hashed in zip(new_users, hashes)
+            ]
+            # Each batch commits on its own so one conflict cannot undo the rest
+            for batch in _chunks(values, IMPORT_BATCH_SIZE):
+                try:
+                    db.execute(insert(User), [row for _, row in batch])
+                    db.commit()
+                    created += len(batch)
+                    continue
+                except IntegrityError:
+                    db.rollback()
+                # A concurrent signup took one of the values: retry this batch row by row
+                for line, row in batch:
+                    try:
+                        db.execute(insert(User), [row])
+                        db.commit()
+                        created += 1
+                    except IntegrityError:
+                        db.rollback()
+                        errors.append(_row_error(line, row["email"], ["User already registered"]))
+
+        errors.sort(key=lambda error: error["row"])
+        return {"total_rows": total, "created": created, "errors": errors, "dry_run": dry_run}
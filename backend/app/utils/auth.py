@@ -1,8 +1,10 @@
 # app/utils/auth.py
 import bcrypt
+import time
+from concurrent.futures import ProcessPoolExecutor
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence
 import os
 from dotenv import load_dotenv
 
@@ -11,25 +13,115 @@ load_dotenv()
 # JWT configuration
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+
+# bcrypt work factor. BCRYPT_ROUNDS pins it; otherwise it is calibrated at startup
+# so that one hash takes about BCRYPT_TARGET_MS on this hardware. Pin it when
+# running several workers or hosts, since each one calibrates on its own.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "0"))
+BCRYPT_TARGET_MS = float(os.getenv("BCRYPT_TARGET_MS", "250"))
+BCRYPT_MIN_ROUNDS = int(os.getenv("BCRYPT_MIN_ROUNDS", "10"))
+BCRYPT_MAX_ROUNDS = int(os.getenv("BCRYPT_MAX_ROUNDS", "15"))
+
+# Bulk hashing (member import): worker processes, and the batch size below which
+# starting them costs more than it saves
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", "0")) or (os.cpu_count() or 1)
+HASH_PARALLEL_MIN = int(os.getenv("HASH_PARALLEL_MIN", "8"))
+
+_bcrypt_rounds = BCRYPT_ROUNDS or 12
+_bcrypt_calibrated = bool(BCRYPT_ROUNDS)
+
+def _time_hash(rounds: int) -> float:
+    """Milliseconds needed for one hash at the given cost."""
+    salt = bcrypt.gensalt(rounds=rounds)
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration-password", salt)
+    return (time.perf_counter() - start) * 1000
+
+def calibrate_bcrypt_rounds(
+    target_ms: float = BCRYPT_TARGET_MS,
+    min_rounds: int = BCRYPT_MIN_ROUNDS,
+    max_rounds: int = BCRYPT_MAX_ROUNDS
+) -> int:
+    """
+    Pick the highest cost whose hash time stays within target_ms.
+
+    Each extra round doubles the work, so a single measurement at min_rounds
+    is enough to extrapolate; the result is never below min_rounds.
+    """
+    base_ms = min(_time_hash(min_rounds) for _ in range(3))
+    rounds = min_rounds
+    while rounds < max_rounds and base_ms * 2 ** (rounds + 1 - min_rounds) <= target_ms:
+        rounds += 1
+    return rounds
+
+def configure_bcrypt() -> int:
+    """Calibrate the work factor once per process (no-op when BCRYPT_ROUNDS is set)."""
+    global _bcrypt_calibrated
+    if not _bcrypt_calibrated:
+        set_bcrypt_rounds(calibrate_bcrypt_rounds())
+        _bcrypt_calibrated = True
+    return _bcrypt_rounds
+
+def set_bcrypt_rounds(rounds: int) -> None:
+    global _bcrypt_rounds
+    _bcrypt_rounds = rounds
+
+def get_bcrypt_rounds() -> int:
+    return _bcrypt_rounds
+
+def get_hash_rounds(hashed_password: str) -> Optional[int]:
+    """Read the cost from a "$2b$12$..." hash, or None if it is not a bcrypt hash."""
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    True when the stored hash was made with a lower cost than the current target.
+    Never downgrades: a worker that calibrated lower leaves stronger hashes alone.
+    """
+    rounds = get_hash_rounds(hashed_password)
+    return rounds is None or rounds < _bcrypt_rounds
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
     # Convert password to bytes
     password_bytes = password.encode('utf-8')
-    # Generate salt and hash
-    salt = bcrypt.gensalt()
+    # Generate salt (at the calibrated cost) and hash
+    salt = bcrypt.gensalt(rounds=_bcrypt_rounds)
     hashed = bcrypt.hashpw(password_bytes, salt)
     # Return as string
     return hashed.decode('utf-8')
 
+def _hash_at(password: str, rounds: int) -> str:
+    """Process-pool worker: the cost is passed in, workers may not share our globals"""
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+def hash_passwords(passwords: Sequence[str], workers: Optional[int] = None) -> List[str]:
+    """
+    Hash many passwords at the current cost, spread across worker processes.
+    Results are in input order. Small batches are hashed in-process.
+    """
+    workers = min(workers or HASH_WORKERS, len(passwords))
+    if workers <= 1 or len(passwords) < HASH_PARALLEL_MIN:
+        return [_hash_at(password, _bcrypt_rounds) for password in passwords]
+    rounds = [_bcrypt_rounds] * len(passwords)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_hash_at, passwords, rounds, chunksize=max(1, len(passwords) // (workers * 4))))
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     # Convert to bytes
     password_bytes = plain_password.encode('utf-8')
     hashed_bytes = hashed_password.encode('utf-8')
-    # Verify
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    # Verify (a malformed stored hash simply does not match)
+    try:
+        return bcrypt.checkpw(password_bytes, hashed_bytes)
+    except ValueError:
+        return False
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
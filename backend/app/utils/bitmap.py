@@ -0,0 +1,53 @@
+# app/utils/bitmap.py
+from typing import Iterable
+
+
+class Bitmap:
+    """
+    Set of non-negative integers stored one bit each over the range seen so
+    far. Meant for dense-ish ids such as the registrations of one event.
+    """
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._base = None  # value of bit 0, a multiple of 8
+        self._bits = bytearray()
+        self._count = 0
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, value: int) -> bool:
+        if self._base is None or value < self._base:
+            return False
+        index = value - self._base
+        byte = index >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (index & 7)))
+
+    def add(self, value: int) -> bool:
+        """Set `value`; False if it was already set."""
+        if self._base is None:
+            self._base = value & ~7
+        elif value < self._base:
+            # Grow downwards: prepend whole bytes
+            base = value & ~7
+            self._bits[0:0] = bytes((self._base - base) >> 3)
+            self._base = base
+        index = value - self._base
+        byte = index >> 3
+        if byte >= len(self._bits):
+            # Grow upwards geometrically so a run of new ids stays O(1) amortized
+            self._bits.extend(bytes(max(byte + 1 - len(self._bits), len(self._bits))))
+        mask = 1 << (index & 7)
+        if self._bits[byte] & mask:
+            return False
+        self._bits[byte] |= mask
+        self._count += 1
+        return True
+
+    def discard(self, value: int) -> None:
+        if value in self:
+            index = value - self._base
+            self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+            self._count -= 1
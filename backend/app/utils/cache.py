@@ -0,0 +1,174 @@
+# app/utils/cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple, Union
+
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Small in-process cache with per-entry expiry, LRU eviction and single-flight
+    loading: when several callers miss the same key at once, only the first one
+    runs the loader and the others wait for its result.
+
+    Entries can also carry a stale window (stale-while-revalidate): once the TTL
+    has passed but the stale window has not, the old value is still returned and
+    a single refresh is handed to the `schedule` callable (e.g. BackgroundTasks).
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        # key -> (value, fresh_until, stale_until)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, threading.Lock] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._generation = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> Tuple[Any, bool]:
+        """(value, is_fresh); value is MISSING when absent or past the stale window."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING, False
+            value, fresh_until, stale_until = entry
+            now = self._clock()
+            if stale_until <= now:
+                del self._entries[key]
+                return MISSING, False
+            self._entries.move_to_end(key)
+            return value, fresh_until > now
+
+    def get(self, key: Hashable) -> Any:
+        """Fresh cached value, or MISSING."""
+        value, fresh = self._lookup(key)
+        return value if fresh else MISSING
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, stale_ttl: float = 0) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            now = self._clock()
+            self._entries[key] = (value, now + ttl, now + ttl + stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _store(self, key, value, generation, ttl, stale_ttl) -> None:
+        # Don't store a value that was invalidated while it was being loaded
+        if generation != self._generation:
+            return
+        ttl = ttl(value) if callable(ttl) else ttl
+        stale_ttl = stale_ttl(value) if callable(stale_ttl) else stale_ttl
+        self.set(key, value, ttl, stale_ttl or 0)
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: Union[float, Callable[[Any], float], None] = None,
+        stale_ttl: Union[float, Callable[[Any], float]] = 0,
+        schedule: Optional[Callable[[Callable[[], None]], Any]] = None
+    ) -> Any:
+        """
+        Return the cached value, loading it (once across concurrent callers) on a miss.
+        `ttl` and `stale_ttl` may be callables computing the lifetime from the loaded value.
+        """
+        value, fresh = self._lookup(key)
+        if value is not MISSING and fresh:
+            self.hits += 1
+            return value
+        if value is not MISSING and schedule is not None:
+            self.stale_hits += 1
+            self._schedule_refresh(key, loader, ttl, stale_ttl, schedule)
+            return value
+
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another caller may have loaded it while we waited
+            value = self.get(key)
+            if value is not MISSING:
+                self.hits += 1
+                return value
+
+            self.misses += 1
+            generation = self._generation
+            try:
+                value = loader()
+                self._store(key, value, generation, ttl, stale_ttl)
+                return value
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+
+    def get_many_or_load(
+        self,
+        keys: Iterable[Hashable],
+        loader: Callable[[list], Dict[Hashable, Any]],
+        ttl: Union[float, Callable[[Any], float], None] = None,
+        stale_ttl: Union[float, Callable[[Any], float]] = 0
+    ) -> Dict[Hashable, Any]:
+        """
+        Batch variant of get_or_load: fresh entries come from the cache and all
+        misses are handed to `loader` in one call, which returns {key: value}.
+        Keys the loader leaves out are not cached.
+        """
+        found: Dict[Hashable, Any] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            value = self.get(key)
+            if value is MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        self.hits += len(found)
+        if not missing:
+            return found
+
+        self.misses += len(missing)
+        generation = self._generation
+        loaded = loader(missing)
+        for key, value in loaded.items():
+            self._store(key, value, generation, ttl, stale_ttl)
+        found.update(loaded)
+        return found
+
+    def _schedule_refresh(self, key, loader, ttl, stale_ttl, schedule) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        generation = self._generation
+
+        def refresh() -> None:
+            try:
+                self._store(key, loader(), generation, ttl, stale_ttl)
+            except Exception as e:
+                # Keep serving the stale value; the next miss retries
+                print(f"[CACHE] Refresh of {key!r} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        schedule(refresh)
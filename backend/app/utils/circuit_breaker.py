@@ -0,0 +1,160 @@
+# app/utils/circuit_breaker.py
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency that is known to be down."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} circuit is open; retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing dependency so callers fail fast instead of each
+    waiting on it.
+
+    closed:    calls go through; once at least `min_calls` were made in the last
+               `window_seconds` and `failure_rate` of them failed, it opens.
+    open:      calls raise CircuitOpenError for `open_seconds`.
+    half_open: a single probe call is let through. Success closes the circuit;
+               failure opens it again for twice as long (up to `max_open_seconds`).
+
+    `is_failure` decides which exceptions count against the dependency; the
+    others (e.g. a rejected message) are re-raised but count as a healthy reply.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window_seconds: float = 60,
+        open_seconds: float = 30,
+        max_open_seconds: float = 600,
+        is_failure: Callable[[Exception], bool] = lambda e: True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.base_open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.is_failure = is_failure
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._calls = deque()  # (timestamp, failed)
+        self._state = self.CLOSED
+        self._open_seconds = open_seconds
+        self._opened_at = 0.0
+        self._probing = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self.clock() - self._opened_at >= self._open_seconds:
+            return self.HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may be made now."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._probing:
+                self._state = self.HALF_OPEN
+                self._probing = True
+                return
+            self.rejected += 1
+            retry_after = max(0.0, self._opened_at + self._open_seconds - self.clock())
+        raise CircuitOpenError(self.name, retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._probing = False
+                self._open_seconds = self.base_open_seconds
+                self._calls.clear()
+                return
+            self._record(False)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                # The probe failed: back off further before the next one
+                self._open(min(self._open_seconds * 2, self.max_open_seconds))
+                return
+            self._record(True)
+            failures = sum(1 for _, failed in self._calls if failed)
+            if len(self._calls) >= self.min_calls and failures >= self.failure_rate * len(self._calls):
+                self._open(self.base_open_seconds)
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        """fn(*args, **kwargs) through the breaker"""
+        self.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if self.is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State and counters for the metrics endpoint"""
+        with self._lock:
+            self._trim()
+            state = self._current_state()
+            return {
+                "state": state,
+                "calls_in_window": len(self._calls),
+                "failures_in_window": sum(1 for _, failed in self._calls if failed),
+                "open_seconds": self._open_seconds,
+                "retry_after": (
+                    round(max(0.0, self._opened_at + self._open_seconds - self.clock()), 1)
+                    if state == self.OPEN else 0.0
+                ),
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._state = self.CLOSED
+            self._open_seconds = self.base_open_seconds
+            self._probing = False
+
+    def _record(self, failed: bool) -> None:
+        self._calls.append((self.clock(), failed))
+        self._trim()
+
+    def _trim(self) -> None:
+        horizon = self.clock() - self.window_seconds
+        while self._calls and self._calls[0][0] < horizon:
+            self._calls.popleft()
+
+    def _open(self, seconds: float) -> None:
+        self._state = self.OPEN
+        self._open_seconds = seconds
+        self._opened_at = self.clock()
+        self._probing = False
+        self._calls.clear()
+        self.times_opened += 1
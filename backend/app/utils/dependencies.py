@@ -1,4 +1,6 @@
 # app/utils/dependencies.py
+import os
+from dataclasses import dataclass
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -6,21 +8,24 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
 from app.utils.auth import verify_token
+from app.utils.token_versions import token_versions
 
 security = HTTPBearer()
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """
-    Get current authenticated user from JWT token.
-    
-    Raises:
-        HTTPException: If token is invalid or user not found
-    """
-    token = credentials.credentials
-    payload = verify_token(token)
+# When enabled, routes using get_current_principal / get_admin_principal trust the
+# signed token claims and only check the token version against the in-memory map.
+STATELESS_AUTH = os.getenv("STATELESS_AUTH", "true").lower() != "false"
+
+@dataclass(frozen=True)
+class Principal:
+    """Identity and role taken from a verified access token."""
+    id: int
+    email: Optional[str]
+    is_admin: bool
+
+def _decode_credentials(credentials: HTTPAuthorizationCredentials) -> dict:
+    """Verify the JWT and return its payload, or raise 401."""
+    payload = verify_token(credentials.credentials)
     
     # Validate token payload
     if payload is None:
@@ -30,14 +35,35 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
     
-    # Extract user ID from token
-    user_id = payload.get("sub")
-    if user_id is None:
+    if payload.get("sub") is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
             headers={"WWW-Authenticate": "Bearer"}
         )
+    return payload
+
+def _revoked_token_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token has been revoked",
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user from JWT token.
+    
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    payload = _decode_credentials(credentials)
+    
+    # Extract user ID from token
+    user_id = payload["sub"]
     
     # Get user from database
     user = db.query(User).filter(User.id == int(user_id)).first()
@@ -55,6 +81,10 @@ async def get_current_user(
             detail="User account is inactive"
         )
     
+    # Tokens issued before the last revocation are no longer valid
+    if payload.get("ver", 0) != user.token_version:
+        raise _revoked_token_error()
+    
     return user
 
 async def get_current_admin(
@@ -87,4 +117,52 @@ async def get_optional_user(
     try:
         return await get_current_user(credentials, db)
     except HTTPException:
-        return None
\ No newline at end of file
+        return None
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """
+    Identity and role for routes that don't need the full User row.
+    
+    With STATELESS_AUTH the claims are trusted once the signature and the token
+    version check out, so no query is made. Deactivating a user or changing
+    their role bumps the version, which revokes their existing tokens.
+    
+    Raises:
+        HTTPException: If token is invalid or revoked
+    """
+    if not STATELESS_AUTH:
+        user = await get_current_user(credentials, db)
+        return Principal(id=user.id, email=user.email, is_admin=bool(user.is_admin))
+    
+    payload = _decode_credentials(credentials)
+    user_id = int(payload["sub"])
+    if not token_versions.loaded:
+        # First request before the background sync ran: load the map once
+        token_versions.sync(db)
+    if payload.get("ver", 0) != token_versions.get(user_id):
+        raise _revoked_token_error()
+    
+    return Principal(
+        id=user_id,
+        email=payload.get("email"),
+        is_admin=bool(payload.get("is_admin", False))
+    )
+
+async def get_admin_principal(
+    principal: Principal = Depends(get_current_principal)
+) -> Principal:
+    """
+    Require admin privileges (claims-based counterpart of get_current_admin).
+    
+    Raises:
+        HTTPException: If user is not an admin
+    """
+    if not principal.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+    return principal
@@ -0,0 +1,80 @@
+# app/utils/email_templates.py
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, NamedTuple
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+# Message name -> subject. Each message also has <name>.html and <name>.txt
+# in TEMPLATE_DIR; subjects and .txt parts are plain text (not escaped).
+EMAIL_SUBJECTS: Dict[str, str] = {
+    "welcome": "Welcome to E-Commerce Club!",
+    "event_registration": "You're registered: {{ event_title }}",
+    "event_reminder": "Reminder: {{ event_title }} starts in {{ lead }}",
+    "announcement": "{{ title }}",
+    "email_verification": "Verify your email address",
+}
+
+_environment = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(enabled_extensions=("html",), default_for_string=False),
+    undefined=StrictUndefined,
+    # Templates ship with the code; never stat the files again after compiling
+    auto_reload=False,
+    cache_size=-1,
+    keep_trailing_newline=True,
+)
+
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    html: str
+    text: str
+
+
+class EmailTemplate:
+    """The compiled subject, HTML and plain-text parts of one message type."""
+
+    def __init__(self, name: str, subject: str):
+        self.name = name
+        self._subject = _environment.from_string(subject)
+        self._html = _environment.get_template(f"{name}.html")
+        self._text = _environment.get_template(f"{name}.txt")
+
+    def render(self, **context: Any) -> RenderedEmail:
+        return self._render(context)
+
+    def _render(self, context: Mapping[str, Any]) -> RenderedEmail:
+        return RenderedEmail(
+            self._subject.render(context).strip(),
+            self._html.render(context),
+            self._text.render(context),
+        )
+
+    def render_many(self, recipients: Iterable[Mapping[str, Any]], **shared: Any) -> Iterator[RenderedEmail]:
+        """
+        One message per recipient for fan-out jobs: `shared` holds what every
+        message has in common, each recipient mapping only what differs.
+        """
+        for recipient in recipients:
+            yield self._render({**shared, **recipient})
+
+
+_templates: Dict[str, EmailTemplate] = {}
+
+
+def load_email_templates() -> int:
+    """Compile every message type; called at startup. Returns how many were loaded."""
+    for name, subject in EMAIL_SUBJECTS.items():
+        if name not in _templates:
+            _templates[name] = EmailTemplate(name, subject)
+    return len(_templates)
+
+
+def get_email_template(name: str) -> EmailTemplate:
+    """The compiled template of a message type, compiling it on first use if needed."""
+    template = _templates.get(name)
+    if template is None:
+        template = _templates[name] = EmailTemplate(name, EMAIL_SUBJECTS[name])
+    return template
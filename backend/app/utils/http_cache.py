@@ -0,0 +1,93 @@
+# app/utils/http_cache.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak validator from identifying values, e.g. (id, updated_at) or a collection version."""
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def latest(*timestamps: Optional[datetime]) -> Optional[datetime]:
+    """Most recent non-empty timestamp (e.g. updated_at falling back to created_at)."""
+    values = [_as_utc(t) for t in timestamps if t is not None]
+    return max(values) if values else None
+
+
+def collection_etag(kind: str, rows: Iterable[tuple]) -> str:
+    """Validator for a list response from the (id, updated_at) pairs it contains."""
+    return weak_etag(kind, tuple(rows))
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; every timestamp we store is UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison (RFC 9110 §13.1.2): W/ prefixes are ignored."""
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def _validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> Optional[Response]:
+    """
+    A 304 response if the client's copy is still current, otherwise None.
+    If-None-Match takes precedence over If-Modified-Since, as required by RFC 9110.
+
+    Leave last_modified out for collections: the newest timestamp of the rows
+    still visible does not move when a row is deleted or hidden.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or last_modified is None:
+            return None
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        # HTTP dates have second precision
+        fresh = _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+    if not fresh:
+        return None
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_validator_headers(etag, last_modified))
+
+
+def conditional_json(
+    request: Request,
+    payload: Any,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> Response:
+    """JSONResponse carrying validators, or 304 when the client already has it."""
+    cached = not_modified(request, etag, last_modified)
+    if cached is not None:
+        return cached
+    return JSONResponse(content=payload, headers=_validator_headers(etag, last_modified))
@@ -0,0 +1,355 @@
+# app/utils/rate_limit.py
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.utils.auth import verify_token
+
+# Sliding-window counter: every key keeps the count of the current fixed window
+# and of the previous one. The previous count is weighted by how much of it still
+# overlaps the sliding window, which gives a smooth limit with O(1) memory per key.
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() != "false"
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "50000"))
+
+
+def _estimate(prev: int, curr: int, elapsed: float, window: int) -> float:
+    """Weighted request count inside the sliding window."""
+    return prev * (1 - elapsed / window) + curr
+
+
+def _retry_after(prev: int, curr: int, elapsed: float, window: int, limit: int) -> int:
+    """Seconds until one more request fits under the limit."""
+    if curr < limit and prev > 0:
+        # Wait until enough of the previous window has slid out.
+        fraction = 1 - (limit - 1 - curr) / prev
+        wait = fraction * window - elapsed
+    else:
+        # The current window alone is full: wait for it to become the previous one.
+        fraction = max(0.0, 1 - (limit - 1) / curr) if curr else 0.0
+        wait = (window - elapsed) + fraction * window
+    return max(1, math.ceil(wait))
+
+
+class RateLimitBackend:
+    """Interface for rate limit stores."""
+
+    def hit(self, key: str, limit: int, window: int) -> Optional[int]:
+        """
+        Record one request for `key`.
+
+        Returns None when the request is allowed, otherwise the number of
+        seconds the client should wait (the request is not counted).
+        """
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryBackend(RateLimitBackend):
+    """
+    In-process store. Each key holds four numbers (window index, previous and
+    current count, last use); idle keys are evicted lazily and the store is
+    capped at `max_keys` entries in LRU order.
+
+    Keys are kept in one LRU per window length, so an hour-long scope that was
+    just used never hides stale one-minute keys from eviction.
+    """
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lrus: "Dict[int, OrderedDict[str, list]]" = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._ops = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def hit(self, key: str, limit: int, window: int) -> Optional[int]:
+        now = self._clock()
+        index = int(now // window)
+        elapsed = now - index * window
+
+        with self._lock:
+            lru = self._lrus.setdefault(window, OrderedDict())
+            entry = lru.get(key)
+            if entry is None:
+                entry = [index, 0, 0, now]
+                lru[key] = entry
+                self._size += 1
+            else:
+                lru.move_to_end(key)
+                entry[3] = now
+                if entry[0] != index:
+                    # Roll the windows forward; anything older than one window is gone.
+                    entry[1] = entry[2] if entry[0] == index - 1 else 0
+                    entry[2] = 0
+                    entry[0] = index
+
+            prev, curr = entry[1], entry[2]
+            if _estimate(prev, curr, elapsed, window) + 1 > limit:
+                return _retry_after(prev, curr, elapsed, window, limit)
+
+            entry[2] += 1
+            self._ops += 1
+            if self._ops % 1000 == 0:
+                self._evict(now)
+            while self._size > self.max_keys:
+                self._pop_least_recent()
+            return None
+
+    def _evict(self, now: float) -> None:
+        """Drop keys that have been idle for two full windows (oldest first)."""
+        for window, lru in self._lrus.items():
+            # Within one window length LRU order is also window-index order
+            stale = []
+            for key, entry in lru.items():
+                if entry[0] >= int(now // window) - 1:
+                    break
+                stale.append(key)
+            for key in stale:
+                del lru[key]
+            self._size -= len(stale)
+
+    def _pop_least_recent(self) -> None:
+        # Few distinct windows exist, so comparing their oldest keys is cheap
+        lru = min(
+            (lru for lru in self._lrus.values() if lru),
+            key=lambda lru: next(iter(lru.values()))[3]
+        )
+        lru.popitem(last=False)
+        self._size -= 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._lrus.clear()
+            self._size = 0
+
+
+class SharedBackend(RateLimitBackend):
+    """
+    Store for multi-worker deployments, built on any counter service that offers
+    `incr(key, ttl) -> int`, `decr(key)` and `get(key) -> int | None`
+    (see `RedisCounterStore` and the `LocalCounterStore` stand-in).
+    """
+
+    def __init__(self, store, clock: Callable[[], float] = time.time):
+        self.store = store
+        self._clock = clock
+
+    def hit(self, key: str, limit: int, window: int) -> Optional[int]:
+        now = self._clock()
+        index = int(now // window)
+        elapsed = now - index * window
+
+        curr_key = f"rl:{key}:{index}"
+        prev = int(self.store.get(f"rl:{key}:{index - 1}") or 0)
+        curr = int(self.store.incr(curr_key, window * 2))
+
+        # `curr` already includes this request.
+        if _estimate(prev, curr, elapsed, window) > limit:
+            self.store.decr(curr_key)
+            return _retry_after(prev, curr - 1, elapsed, window, limit)
+        return None
+
+    def reset(self) -> None:
+        self.store.clear()
+
+
+class LocalCounterStore:
+    """In-process stand-in for a shared counter service (local runs and tests)."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._data: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str):
+        item = self._data.get(key)
+        if item is not None and item[1] <= self._clock():
+            del self._data[key]
+            return None
+        return item
+
+    def incr(self, key: str, ttl: int) -> int:
+        with self._lock:
+            item = self._live(key)
+            if item is None:
+                item = [0, self._clock() + ttl]
+                self._data[key] = item
+            item[0] += 1
+            return item[0]
+
+    def decr(self, key: str) -> None:
+        with self._lock:
+            item = self._live(key)
+            if item is not None:
+                item[0] -= 1
+
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            item = self._live(key)
+            return item[0] if item else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCounterStore:
+    """Adapter for a redis-py client (the client is created by the caller)."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def incr(self, key: str, ttl: int) -> int:
+        pipe = self.client.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, ttl)
+        count, _ = pipe.execute()
+        return int(count)
+
+    def decr(self, key: str) -> None:
+        self.client.decr(key)
+
+    def get(self, key: str) -> Optional[int]:
+        value = self.client.get(key)
+        return int(value) if value is not None else None
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter("rl:*"):
+            self.client.delete(key)
+
+
+_backend: RateLimitBackend = MemoryBackend()
+_rejections: Dict[str, int] = {}
+_stats_lock = threading.Lock()
+
+
+def set_backend(backend: RateLimitBackend) -> None:
+    """Swap the store used by every limiter (e.g. a SharedBackend at startup)."""
+    global _backend
+    _backend = backend
+
+
+def get_backend() -> RateLimitBackend:
+    return _backend
+
+
+def get_rejection_counts() -> Dict[str, int]:
+    """Rejected calls per "<scope>:<ip|account>" since startup."""
+    with _stats_lock:
+        return dict(_rejections)
+
+
+def reset_rate_limits() -> None:
+    """Clear all counters and statistics."""
+    _backend.reset()
+    with _stats_lock:
+        _rejections.clear()
+
+
+def _record_rejection(name: str) -> None:
+    with _stats_lock:
+        _rejections[name] = _rejections.get(name, 0) + 1
+
+
+# --- Account key extractors ---
+
+def body_field(field: str) -> Callable[[Request], Awaitable[Optional[str]]]:
+    """Use a JSON body field (e.g. the email on login) as the account key."""
+    async def extract(request: Request) -> Optional[str]:
+        try:
+            body = await request.json()
+        except Exception:
+            return None
+        value = body.get(field) if isinstance(body, dict) else None
+        return str(value).strip().lower() if value else None
+    return extract
+
+
+async def token_subject(request: Request) -> Optional[str]:
+    """Use the `sub` claim of the bearer token as the account key (no DB lookup)."""
+    header = request.headers.get("authorization", "")
+    if not header.lower().startswith("bearer "):
+        return None
+    payload = verify_token(header[7:])
+    return str(payload["sub"]) if payload and payload.get("sub") else None
+
+
+class RateLimit:
+    """
+    FastAPI dependency enforcing per-IP and per-account sliding windows.
+
+    Usage:
+        @router.post("/login", dependencies=[Depends(login_rate_limit)])
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        ip_limit: int,
+        window: int = 60,
+        account_limit: Optional[int] = None,
+        account_key: Optional[Callable[[Request], Awaitable[Optional[str]]]] = None,
+    ):
+        self.scope = scope
+        self.ip_limit = ip_limit
+        self.window = window
+        self.account_limit = account_limit
+        self.account_key = account_key
+
+    def _check(self, kind: str, ident: str, limit: int) -> None:
+        retry_after = _backend.hit(f"{self.window}:{self.scope}:{kind}:{ident}", limit, self.window)
+        if retry_after is not None:
+            _record_rejection(f"{self.scope}:{kind}")
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Please try again later.",
+                headers={"Retry-After": str(retry_after)},
+            )
+
+    async def __call__(self, request: Request) -> None:
+        if not RATE_LIMIT_ENABLED:
+            return
+
+        client_ip = request.client.host if request.client else "unknown"
+        self._check("ip", client_ip, self.ip_limit)
+
+        if self.account_limit and self.account_key:
+            account = await self.account_key(request)
+            if account:
+                self._check("account", account, self.account_limit)
+
+
+# --- Limits used by the routes ---
+
+login_rate_limit = RateLimit(
+    "login",
+    ip_limit=int(os.getenv("RATE_LIMIT_LOGIN_PER_IP", "20")),
+    account_limit=int(os.getenv("RATE_LIMIT_LOGIN_PER_ACCOUNT", "5")),
+    account_key=body_field("email"),
+)
+
+register_rate_limit = RateLimit(
+    "register",
+    ip_limit=int(os.getenv("RATE_LIMIT_REGISTER_PER_IP", "5")),
+    account_limit=int(os.getenv("RATE_LIMIT_REGISTER_PER_ACCOUNT", "3")),
+    account_key=body_field("email"),
+)
+
+email_change_rate_limit = RateLimit(
+    "change_email",
+    ip_limit=int(os.getenv("RATE_LIMIT_EMAIL_CHANGE_PER_IP", "10")),
+    window=3600,
+    account_limit=int(os.getenv("RATE_LIMIT_EMAIL_CHANGE_PER_ACCOUNT", "5")),
+    account_key=token_subject,
+)
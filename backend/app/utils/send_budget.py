@@ -0,0 +1,43 @@
+# app/utils/send_budget.py
+import os
+import threading
+import time
+from typing import Optional
+
+# Outgoing email messages per second, shared by every sender in this process
+# (event reminders, announcement broadcasts). 0 disables throttling.
+EMAIL_SEND_RATE_PER_SECOND = float(os.getenv("EMAIL_SEND_RATE_PER_SECOND", "10"))
+
+
+class SendBudget:
+    """
+    Process-wide rate budget. Each caller reserves the slot after the last
+    reservation, so concurrent senders share the rate instead of each using it.
+    """
+
+    def __init__(self, rate_per_second: float):
+        self.rate = rate_per_second
+        self._next_free = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, messages: int = 1, stop: Optional[threading.Event] = None) -> bool:
+        """
+        Block until `messages` may be sent. Returns False if `stop` was set while
+        waiting (the reservation is then simply wasted).
+        """
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_free)
+            self._next_free = start + messages / self.rate
+        delay = start - now
+        if delay <= 0:
+            return True
+        if stop is not None:
+            return not stop.wait(delay)
+        time.sleep(delay)
+        return True
+
+
+email_send_budget = SendBudget(EMAIL_SEND_RATE_PER_SECOND)
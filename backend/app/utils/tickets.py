@@ -0,0 +1,59 @@
+# app/utils/tickets.py
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+import struct
+from typing import NamedTuple, Optional
+
+# Tickets are checked at the door without the database: the signature alone
+# proves which registration, event and user a ticket was issued for.
+# Set TICKET_SECRET to rotate tickets independently of login tokens.
+_SECRET = os.getenv("TICKET_SECRET") or os.getenv("SECRET_KEY", "dev-secret")
+_KEY = hmac.new(_SECRET.encode(), b"registration-ticket", hashlib.sha256).digest()
+_MAC = hmac.new(_KEY, digestmod=hashlib.sha256)
+
+TICKET_PREFIX = "T1"
+# registration id, event id, user id as unsigned 32-bit ints
+_FIELDS = struct.Struct(">III")
+# 64-bit truncated HMAC-SHA256; with the fields that makes 20 bytes, which is
+# exactly 32 base32 characters (no padding, no ambiguous trailing bits)
+_SIGNATURE_BYTES = 8
+_TICKET_LENGTH = len(TICKET_PREFIX) + 32
+
+
+class Ticket(NamedTuple):
+    registration_id: int
+    event_id: int
+    user_id: int
+
+
+def _signature(fields: bytes) -> bytes:
+    mac = _MAC.copy()
+    mac.update(fields)
+    return mac.digest()[:_SIGNATURE_BYTES]
+
+
+def sign_ticket(registration_id: int, event_id: int, user_id: int) -> str:
+    """
+    Compact ticket for a registration, e.g. "T1GEZDGNBVGY3TQOJQ...". Only
+    upper-case letters and digits, so QR codes encode it in alphanumeric mode.
+    """
+    fields = _FIELDS.pack(registration_id, event_id, user_id)
+    return TICKET_PREFIX + base64.b32encode(fields + _signature(fields)).decode()
+
+
+def verify_ticket(ticket: str) -> Optional[Ticket]:
+    """The ticket's contents if it was issued by this server, otherwise None."""
+    ticket = ticket.upper()
+    if len(ticket) != _TICKET_LENGTH or not ticket.startswith(TICKET_PREFIX):
+        return None
+    try:
+        raw = base64.b32decode(ticket[len(TICKET_PREFIX):])
+    except (binascii.Error, ValueError):
+        return None
+    fields, signature = raw[:_FIELDS.size], raw[_FIELDS.size:]
+    if not hmac.compare_digest(signature, _signature(fields)):
+        return None
+    return Ticket(*_FIELDS.unpack(fields))
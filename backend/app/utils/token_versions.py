@@ -0,0 +1,141 @@
+# app/utils/token_versions.py
+import asyncio
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, select, func
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+TOKEN_VERSION_SYNC_SECONDS = 5
+# How far behind the watermark each sync re-reads. Must exceed the longest
+# transaction that bumps a version (see TokenVersionMap)
+TOKEN_VERSION_SETTLE_SECONDS = float(os.getenv("TOKEN_VERSION_SETTLE_SECONDS", "60"))
+
+
+class TokenVersionMap:
+    """
+    In-memory copy of users.token_version, so signed token claims can be trusted
+    without loading the user on every request.
+
+    Only users whose version is not 0 are stored (most users never get revoked).
+    After the first full load, `sync` only reads rows whose `updated_at` is at
+    least the last seen watermark minus `settle_seconds`. Bumps made by this
+    worker are applied immediately via `bump`; other workers pick them up on
+    their next sync.
+
+    `updated_at` is stamped with now(), which on Postgres is the transaction
+    start, not the commit: a bump can become visible with a timestamp older than
+    a watermark already passed. The overlap covers that as long as no bumping
+    transaction stays open longer than `settle_seconds`.
+    """
+
+    def __init__(self, settle_seconds: float = TOKEN_VERSION_SETTLE_SECONDS):
+        self.settle_seconds = settle_seconds
+        self._versions: Dict[int, int] = {}
+        self._watermark: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def get(self, user_id: int) -> int:
+        return self._versions.get(user_id, 0)
+
+    def set(self, user_id: int, version: int) -> None:
+        with self._lock:
+            if version:
+                self._versions[user_id] = version
+            else:
+                self._versions.pop(user_id, None)
+
+    def bump(self, user_ids: Iterable[int]) -> None:
+        """Mirror a `token_version + 1` that this worker just committed."""
+        with self._lock:
+            for user_id in user_ids:
+                self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    def sync(self, db: Session) -> int:
+        """Load changed versions from the database. Returns the number of rows read."""
+        query = select(User.id, User.token_version, User.updated_at)
+        if self._watermark is None:
+            query = query.where(User.token_version != 0)
+        else:
+            # Overlap so late commits stamped before the watermark are still seen;
+            # re-reading a row is harmless
+            query = query.where(User.updated_at >= self._watermark - timedelta(seconds=self.settle_seconds))
+        rows = db.execute(query).all()
+
+        if self._watermark is None:
+            self._watermark = db.scalar(select(func.max(User.updated_at)))
+
+        for user_id, version, updated_at in rows:
+            self.set(user_id, version or 0)
+            if updated_at is not None and (self._watermark is None or updated_at > self._watermark):
+                self._watermark = updated_at
+
+        self.loaded = True
+        return len(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versions.clear()
+        self._watermark = None
+        self.loaded = False
+
+
+token_versions = TokenVersionMap()
+
+
+def bump_token_versions(db: Session, user_ids: Iterable[int]) -> None:
+    """
+    Revoke all tokens of the given users: increments token_version in one UPDATE.
+    The caller commits; the local map is only updated once the commit succeeds.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    db.query(User).filter(User.id.in_(user_ids)).update(
+        {User.token_version: User.token_version + 1, User.updated_at: func.now()},
+        synchronize_session="fetch"
+    )
+    note_token_version_bumps(db, user_ids)
+
+
+def note_token_version_bumps(db: Session, user_ids: Iterable[int]) -> None:
+    """
+    Record `token_version + 1` updates the caller wrote itself (e.g. as part of
+    a bulk UPDATE), so the local map follows once the session commits.
+    """
+    db.info.setdefault("token_version_bumps", []).extend(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_bumps(session: Session) -> None:
+    user_ids = session.info.pop("token_version_bumps", None)
+    if user_ids:
+        token_versions.bump(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_bumps(session: Session) -> None:
+    session.info.pop("token_version_bumps", None)
+
+
+async def sync_token_versions_periodically(session_factory, interval: int = TOKEN_VERSION_SYNC_SECONDS):
+    """Background loop started by the app: keep `token_versions` close to the database."""
+    def sync_once() -> int:
+        db = session_factory()
+        try:
+            return token_versions.sync(db)
+        finally:
+            db.close()
+
+    while True:
+        try:
+            await run_in_threadpool(sync_once)
+        except Exception as e:
+            print(f"[AUTH] Token version sync failed: {e}")
+        await asyncio.sleep(interval)
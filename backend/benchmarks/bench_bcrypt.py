@@ -0,0 +1,49 @@
+"""
+Login throughput per core at each bcrypt cost.
+
+A login is dominated by one bcrypt verification, so logins/sec per core is
+roughly 1000 / (ms per hash). Run from the backend directory:
+
+    python -m benchmarks.bench_bcrypt --min 10 --max 14
+"""
+import argparse
+import os
+import time
+
+import bcrypt
+
+os.environ.setdefault("BCRYPT_ROUNDS", "12")  # skip calibration on import
+from app.utils.auth import calibrate_bcrypt_rounds  # noqa: E402
+
+
+def bench_rounds(rounds: int, samples: int) -> float:
+    """Median milliseconds to verify one password at the given cost."""
+    hashed = bcrypt.hashpw(b"Password123!", bcrypt.gensalt(rounds=rounds))
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        bcrypt.checkpw(b"Password123!", hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min", type=int, default=10)
+    parser.add_argument("--max", type=int, default=14)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=250)
+    args = parser.parse_args()
+
+    print(f"{'cost':>4}  {'ms/login':>9}  {'logins/s/core':>13}")
+    for rounds in range(args.min, args.max + 1):
+        ms = bench_rounds(rounds, args.samples)
+        print(f"{rounds:>4}  {ms:>9.1f}  {1000 / ms:>13.1f}")
+
+    chosen = calibrate_bcrypt_rounds(args.target_ms, args.min, args.max)
+    print(f"\ncalibrated cost for {args.target_ms:.0f} ms target: {chosen}")
+
+
+if __name__ == "__main__":
+    main()
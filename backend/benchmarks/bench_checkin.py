@@ -0,0 +1,101 @@
+"""
+Door check-in throughput: CheckInDesk vs a database round trip per scan.
+
+Seeds one event with N registrations into an in-memory SQLite database and
+scans every ticket once. The per-scan baseline looks the registration up,
+rejects duplicates from checked_in_at and commits an UPDATE; the desk verifies
+the signature, checks its bitmap and writes everything in one batched flush.
+Run from the backend directory:
+
+    python -m benchmarks.bench_checkin --attendees 5000
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("RESEND_API_KEY", "unused")
+from sqlalchemy import create_engine, insert, update  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import Event, Registration, User  # noqa: E402
+from app.services.checkin_service import CheckInDesk  # noqa: E402
+from app.utils.tickets import sign_ticket, verify_ticket  # noqa: E402
+
+
+def seed(Session, attendees: int) -> list:
+    db = Session()
+    db.execute(insert(User), [
+        {"email": f"member{i}@example.com", "full_name": f"Member {i}", "hashed_password": "x", "token_version": 0}
+        for i in range(attendees)
+    ])
+    db.add(Event(
+        title="Career fair", description="All hands", location="Main hall", capacity=attendees,
+        event_date=datetime(2027, 3, 1), event_time="18:00:00", registration_deadline=datetime(2027, 3, 1),
+        creator_id=1, current_registrations=attendees,
+    ))
+    db.execute(insert(Registration), [{"user_id": i + 1, "event_id": 1} for i in range(attendees)])
+    db.commit()
+    db.close()
+    return [sign_ticket(i + 1, 1, i + 1) for i in range(attendees)]
+
+
+def reset(Session) -> None:
+    db = Session()
+    db.execute(update(Registration).values(checked_in_at=None))
+    db.commit()
+    db.close()
+
+
+def per_scan(Session, tickets) -> int:
+    db = Session()
+    admitted = 0
+    for ticket in tickets:
+        registration = db.get(Registration, verify_ticket(ticket).registration_id)
+        if registration.checked_in_at is None and not registration.is_cancelled:
+            registration.checked_in_at = datetime.utcnow()
+            db.commit()
+            admitted += 1
+    db.close()
+    return admitted
+
+
+def desk(Session, tickets) -> int:
+    db = Session()
+    check_in_desk = CheckInDesk()
+    for ticket in tickets:
+        check_in_desk.check_in(db, 1, ticket)
+    written = check_in_desk.flush(db)
+    db.close()
+    return written
+
+
+def rate(label: str, scans: int, fn) -> None:
+    start = time.perf_counter()
+    admitted = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {admitted:>7} {scans / elapsed:>12,.0f} scans/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--attendees", type=int, default=5_000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    tickets = seed(Session, args.attendees)
+
+    print(f"{'strategy':<36} {'admitted':>7} {'throughput':>12}")
+    rate("verify signature only", len(tickets), lambda: sum(1 for t in tickets if verify_ticket(t)))
+    rate("lookup + commit per scan", len(tickets), lambda: per_scan(Session, tickets))
+    reset(Session)
+    rate("CheckInDesk (bitmap, one flush)", len(tickets), lambda: desk(Session, tickets))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Registration confirmation renders per second: inline f-string vs compiled templates.
+
+Compares the old f-string body (HTML only, nothing escaped), compiling the
+template for every message (what an uncached engine would do), the startup-
+compiled template (HTML + text + subject, autoescaped) and render_many for a
+fan-out batch. Run from the backend directory:
+
+    python -m benchmarks.bench_email_templates --messages 20000
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("RESEND_API_KEY", "unused")
+from jinja2 import Environment, FileSystemLoader, select_autoescape  # noqa: E402
+
+from app.services.email import event_registration_message  # noqa: E402
+from app.utils.email_templates import TEMPLATE_DIR, get_email_template, load_email_templates  # noqa: E402
+
+EVENT = {
+    "event_title": "Career fair", "event_date": datetime(2027, 3, 1, 18), "event_time": "18:00:00",
+    "location": "Main hall",
+}
+
+
+def fstring(full_name: str) -> str:
+    """The body send_event_registration_confirmation built before templates"""
+    date_str = EVENT["event_date"].strftime("%Y-%m-%d %H:%M")
+    return f"""
+        <h2>Registration confirmed ✅</h2>
+        <p>Hello {full_name},</p>
+        <p>You have registered for:</p>
+        <ul>
+          <li><b>Event:</b> {EVENT["event_title"]}</li>
+          <li><b>Date:</b> {date_str}</li>
+          <li><b>Time:</b> {EVENT["event_time"]}</li>
+          <li><b>Location:</b> {EVENT["location"]}</li>
+        </ul>
+        <p>See you there!</p>
+    """
+
+
+def uncached(full_name: str) -> str:
+    environment = Environment(loader=FileSystemLoader(TEMPLATE_DIR), autoescape=select_autoescape(["html"]))
+    return environment.get_template("event_registration.html").render(
+        full_name=full_name, event_title=EVENT["event_title"], location=EVENT["location"],
+        date_str="2027-03-01 18:00", time_str=EVENT["event_time"]
+    )
+
+
+def compiled(full_name: str):
+    return event_registration_message(full_name, **EVENT)
+
+
+def batch(names):
+    template = get_email_template("event_registration")
+    return list(template.render_many(
+        ({"full_name": name} for name in names),
+        event_title=EVENT["event_title"], location=EVENT["location"],
+        date_str="2027-03-01 18:00", time_str=EVENT["event_time"]
+    ))
+
+
+def rate(label: str, messages: int, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {messages / elapsed:>10,.0f} renders/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20_000)
+    args = parser.parse_args()
+
+    load_email_templates()
+    names = [f"Member {i}" for i in range(args.messages)]
+    rate("f-string (html only, unescaped)", len(names), lambda: [fstring(n) for n in names])
+    few = names[:max(1, args.messages // 100)]
+    rate("compile per message (html only)", len(few), lambda: [uncached(n) for n in few])
+    rate("compiled (subject + html + text)", len(names), lambda: [compiled(n) for n in names])
+    rate("render_many (subject + html + text)", len(names), lambda: batch(names))
+
+
+if __name__ == "__main__":
+    main()
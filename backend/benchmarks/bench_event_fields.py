@@ -0,0 +1,97 @@
+"""
+Payload size and build time of a 100-event list page: full vs summary vs sparse fields.
+
+Measures what a response-cache miss costs: the page query plus serialization.
+Runs against an in-memory SQLite database. Run from the backend directory:
+
+    python -m benchmarks.bench_event_fields --events 100 --description-chars 2000
+"""
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import Event, User  # noqa: E402
+from app.schemas.event import EventResponse  # noqa: E402
+from app.services.event_service import EventService, resolve_event_fields, project_event  # noqa: E402
+
+
+def seed(Session, events: int, description_chars: int) -> None:
+    db = Session()
+    user = User(email="bench@example.com", hashed_password="x", full_name="Bench")
+    db.add(user)
+    db.commit()
+    now = datetime.utcnow()
+    db.add_all(
+        Event(
+            title=f"Event {i}",
+            description="x" * description_chars,
+            event_date=now + timedelta(days=1 + i),
+            registration_deadline=now + timedelta(hours=12),
+            location="Main hall",
+            capacity=100,
+            current_registrations=0,
+            creator_id=user.id,
+        )
+        for i in range(events)
+    )
+    db.commit()
+    db.close()
+
+
+def build_page(Session, page_size: int, fields) -> bytes:
+    db = Session()
+    try:
+        events, _ = EventService.get_events(db, limit=page_size, fields=fields, count=False)
+        if fields is None:
+            items = [EventResponse.model_validate(e).model_dump(mode="json") for e in events]
+        else:
+            items = [project_event(e, fields) for e in events]
+        return json.dumps({"events": items}).encode("utf-8")
+    finally:
+        db.close()
+
+
+def bench(Session, page_size: int, fields, samples: int):
+    """(median ms, payload bytes)"""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        body = build_page(Session, page_size, fields)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--description-chars", type=int, default=2000)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    seed(Session, args.events, args.description_chars)
+
+    variants = [
+        ("full", None),
+        ("view=summary", resolve_event_fields(view="summary")),
+        ("fields=title,event_date", resolve_event_fields("title,event_date")),
+    ]
+    print(f"{'variant':<24}  {'ms/page':>8}  {'bytes':>9}")
+    for name, fields in variants:
+        ms, size = bench(Session, args.events, fields, args.samples)
+        print(f"{name:<24}  {ms:>8.2f}  {size:>9,}")
+
+
+if __name__ == "__main__":
+    main()
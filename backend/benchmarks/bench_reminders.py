@@ -0,0 +1,96 @@
+"""
+Reminder fan-out for one large event: chunked scheduler vs loading every registrant.
+
+Seeds one event with N registrants into an in-memory SQLite database and sends its
+reminder wave through a no-op transport (unthrottled), reporting wall time and
+peak Python memory (tracemalloc). Run from the backend directory:
+
+    python -m benchmarks.bench_reminders --registrants 10000
+"""
+import argparse
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("RESEND_API_KEY", "unused")
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import Event, Registration, User  # noqa: E402
+from app.services.email import event_reminder_message  # noqa: E402
+from app.services.reminder_service import ReminderScheduler  # noqa: E402
+from app.utils.send_budget import SendBudget  # noqa: E402
+
+NOW = datetime(2027, 3, 1, 12, 0)
+
+
+def seed(Session, registrants: int) -> None:
+    db = Session()
+    db.execute(insert(User), [
+        {"email": f"member{i}@example.com", "full_name": f"Member {i}", "hashed_password": "x", "token_version": 0}
+        for i in range(registrants)
+    ])
+    starts_at = NOW + timedelta(hours=3)
+    db.add(Event(
+        title="Career fair", description="All hands", location="Main hall", capacity=registrants,
+        event_date=datetime.combine(starts_at.date(), datetime.min.time()), event_time=starts_at.strftime("%H:%M:%S"),
+        registration_deadline=NOW, creator_id=1, current_registrations=registrants,
+    ))
+    db.flush()
+    db.execute(insert(Registration), [
+        {"user_id": i + 1, "event_id": 1, "is_cancelled": i % 10 == 0} for i in range(registrants)
+    ])
+    db.commit()
+    db.close()
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    sent = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return sent, elapsed, peak
+
+
+def naive(Session):
+    """Load all registrations with their users, then send serially"""
+    db = Session()
+    event = db.get(Event, 1)
+    registrations = db.query(Registration).filter(
+        Registration.event_id == 1, Registration.is_cancelled == False
+    ).all()
+    for registration in registrations:
+        user = registration.user
+        event_reminder_message(user.full_name, event.title, event.event_date, event.event_time, event.location, "24 hours")
+    db.close()
+    return len(registrations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--registrants", type=int, default=10_000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    seed(Session, args.registrants)
+
+    print(f"{'strategy':<34}  {'sent':>6}  {'ms':>9}  {'peak MiB':>8}")
+    sent, ms, peak = measure(lambda: naive(Session))
+    print(f"{'load everything (no progress)':<34}  {sent:>6}  {ms:>9.1f}  {peak:>8.2f}")
+
+    scheduler = ReminderScheduler(Session, transport=lambda *message: None, budget=SendBudget(0), chunk_size=args.chunk_size)
+    sent, ms, peak = measure(lambda: scheduler.run_once(NOW))
+    print(f"{'scheduler (chunked, checkpointed)':<34}  {sent:>6}  {ms:>9.1f}  {peak:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
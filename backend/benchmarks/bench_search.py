@@ -0,0 +1,97 @@
+"""
+Full-text search latency over a large synthetic index.
+
+Builds search_documents with N rows in an in-memory SQLite database (FTS5) and
+times SearchService.search for a few query shapes. The target is < 20 ms per
+query at 100k documents. Run from the backend directory:
+
+    python -m benchmarks.bench_search --documents 100000
+"""
+import argparse
+import itertools
+import os
+import random
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import SearchDocument  # noqa: E402
+from app.services.search_service import SearchService, SEARCH_KINDS  # noqa: E402
+
+DOMAIN_WORDS = (
+    "commerce marketing startup pitch workshop dropshipping funnel seo analytics logistics "
+    "payments branding design networking mentor investor product pricing campus student "
+    "career fair webinar masterclass strategy growth retail supply chain customer data"
+).split()
+SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "ta", "vo", "si", "de", "pa", "zu", "fi", "go", "he", "ji")
+
+
+def vocabulary(rng: random.Random):
+    """Synthetic words plus the domain words, with Zipf-like frequencies like real text."""
+    words = ["".join(parts) for parts in itertools.product(SYLLABLES, repeat=3)][:3000] + DOMAIN_WORDS
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    rng.shuffle(weights)
+    return words, list(itertools.accumulate(weights))
+
+
+def seed(Session, documents: int) -> None:
+    rng = random.Random(42)
+    words, cum_weights = vocabulary(rng)
+    db = Session()
+    batch = []
+    for i in range(documents):
+        batch.append({
+            "kind": "event" if i % 3 else "announcement",
+            "ref_id": i,
+            "title": " ".join(rng.choices(words, cum_weights=cum_weights, k=5)),
+            "body": " ".join(rng.choices(words, cum_weights=cum_weights, k=80)),
+            "is_visible": i % 10 != 0,
+        })
+        if len(batch) == 5000:
+            db.execute(insert(SearchDocument), batch)
+            batch.clear()
+    if batch:
+        db.execute(insert(SearchDocument), batch)
+    db.commit()
+    db.close()
+
+
+def bench(Session, q: str, kinds, samples: int) -> float:
+    """Median milliseconds for the first page of results."""
+    db = Session()
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        SearchService.search(db, q, kinds=kinds, limit=20)
+        timings.append((time.perf_counter() - start) * 1000)
+    db.close()
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=100_000)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    start = time.perf_counter()
+    seed(Session, args.documents)
+    print(f"indexed {args.documents:,} documents in {time.perf_counter() - start:.1f}s\n")
+
+    print(f"{'query':<28}  {'kinds':<18}  {'ms':>7}")
+    for q in ("investor", "supply chain", "dropshipping masterclass", "mark", "nonexistentword"):
+        for kinds in (SEARCH_KINDS, ("event",)):
+            print(f"{q:<28}  {','.join(kinds):<18}  {bench(Session, q, kinds, args.samples):>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
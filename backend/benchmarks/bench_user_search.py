@@ -0,0 +1,100 @@
+"""
+Admin user search at scale: indexed search vs loading every user.
+
+Seeds N users into an in-memory SQLite database and times UserService.search_users
+for typical admin queries, deep keyset pages, and the old "load all" listing.
+Run from the backend directory:
+
+    python -m benchmarks.bench_user_search --users 100000
+"""
+import argparse
+import os
+import random
+import string
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import User  # noqa: E402
+from app.services.user_service import UserService  # noqa: E402
+
+FIRST = ["aysel", "murad", "leyla", "kamran", "nigar", "elvin", "sabina", "tural", "gunel", "rashad"]
+LAST = ["aliyev", "mammadov", "hasanova", "huseynov", "guliyeva", "ismayilov", "karimova", "babayev"]
+
+
+def seed(Session, users: int) -> None:
+    rng = random.Random(7)
+    db = Session()
+    batch = []
+    for i in range(users):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        student = i % 4 != 0
+        batch.append({
+            "email": f"{first}.{last}{i}@example.com",
+            "full_name": f"{first.title()} {last.title()}",
+            "hashed_password": "x",
+            "is_university_student": student,
+            "student_id": f"{10000 + i}" if student else None,
+            "national_id": None if student else "".join(rng.choices(string.ascii_uppercase + string.digits, k=7)),
+            "is_active": i % 20 != 0,
+            "is_admin": i % 1000 == 0,
+            "token_version": 0,
+        })
+        if len(batch) == 5000:
+            db.execute(insert(User), batch)
+            batch.clear()
+    if batch:
+        db.execute(insert(User), batch)
+    db.commit()
+    db.close()
+
+
+def timed(fn, samples: int) -> float:
+    """Median milliseconds."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--samples", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    seed(Session, args.users)
+    db = Session()
+
+    cases = [
+        ("q=leyla.h", dict(q="leyla.h")),
+        ("q=kamran (name)", dict(q="kamran")),
+        ("q=5123 (student id)", dict(q="5123")),
+        ("q=ab (national id)", dict(q="ab")),
+        ("q=tural, active only", dict(q="tural", is_active=True)),
+        ("admins only", dict(is_admin=True)),
+        ("no filter, first page", dict()),
+        ("no filter, deep page", dict(after=args.users - 100)),
+    ]
+    print(f"{'case':<28}  {'ms':>8}")
+    for name, kwargs in cases:
+        ms = timed(lambda: (db.expunge_all(), UserService.search_users(db, **kwargs)), args.samples)
+        print(f"{name:<28}  {ms:>8.2f}")
+
+    ms = timed(lambda: (db.expunge_all(), db.query(User).all()), max(1, args.samples // 5))
+    print(f"{'old: load every user':<28}  {ms:>8.2f}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
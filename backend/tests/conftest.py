@@ -1,13 +1,21 @@
+from datetime import datetime, timedelta
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event as sa_event
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.database import Base, get_db
+from app.models.event import Event
 from app.models.user import User
 from app.utils.auth import hash_password
 from app.utils.dependencies import get_current_user
+from app.utils.rate_limit import reset_rate_limits
+from app.utils.token_versions import token_versions
+from app.services.event_service import availability_cache, event_count_cache
+from app.services.event_cache import event_list_cache, event_detail_cache, home_bundle_cache
+from app.services.checkin_service import check_in_desk
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
@@ -41,6 +49,14 @@ def client(db):
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
+    reset_rate_limits()
+    token_versions.clear()
+    availability_cache.clear()
+    event_count_cache.clear()
+    event_list_cache.clear()
+    event_detail_cache.clear()
+    home_bundle_cache.clear()
+    check_in_desk.reset()
 
     with TestClient(app) as c:
         yield c
@@ -70,3 +86,96 @@ def auth_client(client, test_user):
     app.dependency_overrides[get_current_user] = override_get_current_user
     yield client
     app.dependency_overrides.pop(get_current_user)
+
+
+# --- Shared helpers ---
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class QueryCounter:
+    """Records the SQL statements sent to `engine` while the block runs"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def __enter__(self):
+        sa_event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc):
+        sa_event.remove(self.engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def count_queries(db):
+    """`with count_queries() as counter:` collects the statements in counter.statements"""
+    return lambda: QueryCounter(db.get_bind())
+
+
+@pytest.fixture
+def create_user(db):
+    """Active user with password "Password123!"; `bearer` logs them in"""
+    def create(email, is_admin=False):
+        user = User(
+            email=email,
+            hashed_password=hash_password("Password123!"),
+            full_name="Principal Test",
+            is_admin=is_admin,
+            is_active=True,
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+    return create
+
+
+@pytest.fixture
+def bearer(client):
+    """Authorization header of a fresh login of a `create_user` user"""
+    def login(email):
+        response = client.post("/api/auth/login", json={"email": email, "password": "Password123!"})
+        assert response.status_code == 200
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return login
+
+
+@pytest.fixture
+def make_events(db):
+    """Upcoming events (a week out and later) by one creator; returns their ids"""
+    def make(count=3):
+        user = User(email="creator@example.com", hashed_password="x", full_name="Creator")
+        db.add(user)
+        db.commit()
+        ids = []
+        for i in range(count):
+            event = Event(
+                title=f"Event {i}",
+                description="Description",
+                event_date=datetime.utcnow() + timedelta(days=7 + i),
+                registration_deadline=datetime.utcnow() + timedelta(days=5),
+                location="Hall",
+                capacity=10,
+                current_registrations=0,
+                creator_id=user.id,
+            )
+            db.add(event)
+            db.commit()
+            ids.append(event.id)
+        return ids
+    return make
@@ -0,0 +1,73 @@
+from app.models.user import User
+
+
+def test_bulk_deactivate_by_ids_uses_one_update(client, db, create_user, bearer, count_queries):
+    create_user("admin@example.com", is_admin=True)
+    members = [create_user(f"member{i}@example.com") for i in range(3)]
+    admin_headers = bearer("admin@example.com")
+    member_headers = bearer("member0@example.com")
+    ids = [member.id for member in members]
+    db.query(User).filter(User.id == ids[2]).update({User.is_active: False})
+    db.commit()
+
+    with count_queries() as counter:
+        response = client.patch(
+            "/api/admin/users/bulk/active",
+            json={"user_ids": ids, "is_active": False},
+            headers=admin_headers,
+        )
+    assert response.status_code == 200
+    # Already inactive users are not touched (nor are their tokens revoked)
+    assert response.json() == {"updated": 2, "user_ids": ids[:2]}
+    assert len([s for s in counter.statements if s.lstrip().upper().startswith("UPDATE")]) == 1
+
+    db.expire_all()
+    assert db.query(User).filter(User.id.in_(ids), User.is_active == True).count() == 0
+    response = client.get("/api/registrations/my-registrations", headers=member_headers)
+    assert response.status_code == 401
+
+
+def test_bulk_updates_keep_self_protection(client, db, create_user, bearer):
+    admin = create_user("admin@example.com", is_admin=True)
+    other = create_user("other-admin@example.com", is_admin=True)
+    admin_headers = bearer("admin@example.com")
+
+    response = client.patch(
+        "/api/admin/users/bulk/role",
+        json={"user_ids": [admin.id, other.id], "is_admin": False},
+        headers=admin_headers,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cannot revoke your own admin privileges."
+
+    # A filter matching the caller skips them
+    response = client.patch(
+        "/api/admin/users/bulk/role",
+        json={"filter": {"is_admin": True}, "is_admin": False},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["user_ids"] == [other.id]
+    # The caller's own token still works
+    assert client.get("/api/admin/users/", headers=admin_headers).status_code == 200
+
+
+def test_bulk_selection_validation(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    create_user("member@example.com")
+    admin_headers = bearer("admin@example.com")
+
+    for body in (
+        {"is_active": False},
+        {"user_ids": [1], "filter": {"is_admin": False}, "is_active": False},
+        {"filter": {}, "is_active": False},
+    ):
+        response = client.patch("/api/admin/users/bulk/active", json=body, headers=admin_headers)
+        assert response.status_code == 422
+
+    response = client.patch(
+        "/api/admin/users/bulk/active",
+        json={"filter": {"q": "member"}, "is_active": False},
+        headers=bearer("member@example.com"),
+    )
+    assert response.status_code == 403
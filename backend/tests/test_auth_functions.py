@@ -1,4 +1,9 @@
-from app.utils.auth import hash_password, verify_password, create_access_token, verify_token
+from app.models.user import User
+from app.utils.auth import (
+    hash_password, verify_password, create_access_token, verify_token,
+    calibrate_bcrypt_rounds, get_bcrypt_rounds, set_bcrypt_rounds,
+    get_hash_rounds, needs_rehash
+)
 
 def test_password_hashing():
     password = "Test123!"
@@ -18,3 +23,59 @@ def test_jwt_functions():
 
     # invalid token must return None
     assert verify_token("invalid_token") is None
+
+def test_needs_rehash_follows_target_cost():
+    original = get_bcrypt_rounds()
+    try:
+        set_bcrypt_rounds(4)
+        hashed = hash_password("Test123!")
+        assert get_hash_rounds(hashed) == 4
+        assert not needs_rehash(hashed)
+
+        set_bcrypt_rounds(5)
+        assert needs_rehash(hashed)
+
+        # A worker calibrated to a lower cost must not downgrade the hash
+        stronger = hash_password("Test123!")
+        set_bcrypt_rounds(4)
+        assert not needs_rehash(stronger)
+        assert get_hash_rounds("not-a-bcrypt-hash") is None
+    finally:
+        set_bcrypt_rounds(original)
+
+def test_calibration_stays_within_bounds():
+    rounds = calibrate_bcrypt_rounds(target_ms=0, min_rounds=4, max_rounds=6)
+    assert rounds == 4
+    rounds = calibrate_bcrypt_rounds(target_ms=10_000, min_rounds=4, max_rounds=6)
+    assert rounds == 6
+
+def test_login_rehashes_outdated_hash(client, db):
+    original = get_bcrypt_rounds()
+    try:
+        set_bcrypt_rounds(4)
+        user = User(
+            email="rehash@example.com",
+            hashed_password=hash_password("Password123!"),
+            full_name="Rehash User",
+        )
+        db.add(user)
+        db.commit()
+
+        set_bcrypt_rounds(5)
+        response = client.post(
+            "/api/auth/login",
+            json={"email": "rehash@example.com", "password": "Password123!"}
+        )
+        assert response.status_code == 200
+
+        db.refresh(user)
+        assert get_hash_rounds(user.hashed_password) == 5
+        assert verify_password("Password123!", user.hashed_password)
+
+        response = client.post(
+            "/api/auth/login",
+            json={"email": "rehash@example.com", "password": "wrong"}
+        )
+        assert response.status_code == 401
+    finally:
+        set_bcrypt_rounds(original)
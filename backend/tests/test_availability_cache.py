@@ -0,0 +1,115 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import event as sa_event
+
+from app.models.event import Event
+from app.models.user import User
+from app.services.registration_service import RegistrationService
+from app.utils.cache import TTLCache, MISSING
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expiry_and_invalidation():
+    clock = FakeClock()
+    cache = TTLCache(ttl=5, clock=clock)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    clock.now = 6
+    assert cache.get("a") is MISSING
+
+    cache.set("b", 2)
+    cache.invalidate("b")
+    assert cache.get("b") is MISSING
+
+
+def test_single_flight_loads_once():
+    cache = TTLCache(ttl=5)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+        for _ in range(10)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["value"] * 10
+    assert len(calls) == 1
+
+
+def test_invalidation_during_load_is_not_cached():
+    cache = TTLCache(ttl=5)
+
+    def loader():
+        cache.invalidate("k")  # a write lands while we are reading
+        return "old"
+
+    assert cache.get_or_load("k", loader) == "old"
+    assert cache.get("k") is MISSING
+
+
+def make_event(db):
+    user = User(email="creator@example.com", hashed_password="x", full_name="Creator")
+    db.add(user)
+    db.commit()
+    event = Event(
+        title="Workshop",
+        description="Long description",
+        event_date=datetime.utcnow() + timedelta(days=7),
+        registration_deadline=datetime.utcnow() + timedelta(days=5),
+        location="Hall A",
+        capacity=2,
+        current_registrations=0,
+        creator_id=user.id,
+    )
+    db.add(event)
+    db.commit()
+    return user, event
+
+
+def test_availability_served_from_cache(client, db):
+    user, event = make_event(db)
+    event_id, user_id = event.id, user.id
+
+    statements = []
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+    engine = db.get_bind()
+    sa_event.listen(engine, "before_cursor_execute", count)
+    try:
+        first = client.get(f"/api/events/{event_id}/availability")
+        second = client.get(f"/api/events/{event_id}/availability")
+    finally:
+        sa_event.remove(engine, "before_cursor_execute", count)
+
+    assert first.json() == second.json()
+    assert first.json()["available_spots"] == 2
+    assert first.headers["Cache-Control"] == "public, max-age=5"
+    assert len(statements) == 1
+
+    # Registering invalidates the snapshot
+    RegistrationService.register_for_event(db, event_id=event_id, user_id=user_id)
+    response = client.get(f"/api/events/{event_id}/availability")
+    assert response.json()["available_spots"] == 1
+
+
+def test_unknown_event_is_404(client):
+    assert client.get("/api/events/999/availability").status_code == 404
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+from app.routes import events as routes
+from app.services.availability_hub import AvailabilityHub
+from app.services.event_service import EventService
+
+
+async def test_burst_is_coalesced():
+    hub = AvailabilityHub(min_interval=0.2)
+    subscription = hub.subscribe(1)
+
+    for spots in range(10, 0, -1):
+        hub.publish(1, {"available_spots": spots})
+
+    received = []
+    while True:
+        snapshot = await subscription.next(timeout=0.5)
+        if snapshot is None:
+            break
+        received.append(snapshot["available_spots"])
+
+    # The first change goes out at once; the rest of the burst collapses into the latest value
+    assert received == [10, 1]
+
+
+async def test_updates_are_rate_limited_per_event():
+    hub = AvailabilityHub(min_interval=0.2)
+    subscription = hub.subscribe(1)
+    other = hub.subscribe(2)
+
+    hub.publish(1, {"available_spots": 5})
+    assert (await subscription.next(timeout=0.1))["available_spots"] == 5
+
+    hub.publish(1, {"available_spots": 4})
+    # Too soon after the previous broadcast: held back until the interval passes
+    assert await subscription.next(timeout=0.05) is None
+    assert (await subscription.next(timeout=0.5))["available_spots"] == 4
+
+    # Other events are not affected
+    assert await other.next(timeout=0.05) is None
+
+
+async def test_publish_from_worker_thread():
+    hub = AvailabilityHub(min_interval=0)
+    subscription = hub.subscribe(7)
+
+    thread = threading.Thread(target=hub.publish, args=(7, {"is_full": True}))
+    thread.start()
+    thread.join()
+
+    assert (await subscription.next(timeout=1))["is_full"] is True
+
+
+async def test_unsubscribe_and_unwatched_events():
+    hub = AvailabilityHub()
+    subscription = hub.subscribe(3)
+    assert hub.is_watched(3)
+
+    hub.unsubscribe(subscription)
+    assert not hub.is_watched(3)
+    hub.publish(3, {"available_spots": 1})  # no listeners: ignored
+    assert hub.subscriber_count() == 0
+
+
+async def test_many_idle_subscribers():
+    hub = AvailabilityHub(min_interval=0)
+    subscriptions = [hub.subscribe(1) for _ in range(5000)]
+
+    hub.publish(1, {"available_spots": 0})
+    results = await asyncio.gather(*(s.next(timeout=1) for s in subscriptions))
+    assert all(r == {"available_spots": 0} for r in results)
+
+
+class OpenRequest:
+    """Stands in for a client that stays connected"""
+
+    async def is_disconnected(self):
+        return False
+
+
+async def test_stream_keeps_update_made_while_reading_snapshot(monkeypatch):
+    hub = AvailabilityHub(min_interval=0)
+    monkeypatch.setattr(routes, "availability_hub", hub)
+
+    def check_availability(db, event_id):
+        # A registration commits while the snapshot is being read
+        hub.publish(event_id, {"available_spots": 4})
+        return {"available_spots": 5}
+
+    monkeypatch.setattr(EventService, "check_availability", staticmethod(check_availability))
+
+    class Session:
+        def close(self):
+            pass
+
+    response = await routes.stream_availability(1, OpenRequest(), Session())
+    stream = response.body_iterator
+    assert '"available_spots": 5' in await stream.__anext__()
+    assert '"available_spots": 4' in await asyncio.wait_for(stream.__anext__(), 1)
+    await stream.aclose()
+    assert hub.subscriber_count() == 0
@@ -0,0 +1,180 @@
+from resend.exceptions import ValidationError
+from sqlalchemy.orm import sessionmaker
+
+from app.models.content import Announcement, AnnouncementBroadcast
+from app.models.user import User
+from app.services.broadcast_service import BroadcastSender, BroadcastService
+from app.utils.send_budget import SendBudget
+
+
+class StubProvider:
+    """Records batch calls instead of talking to Resend"""
+
+    def __init__(self, fail_on_call=None):
+        self.calls = []
+        self.fail_on_call = fail_on_call
+
+    def __call__(self, messages):
+        if self.fail_on_call is not None and len(self.calls) + 1 == self.fail_on_call:
+            self.fail_on_call = None
+            raise RuntimeError("provider down")
+        self.calls.append(messages)
+
+    @property
+    def recipients(self):
+        return [message["to"] for batch in self.calls for message in batch]
+
+
+def add_members(db, count, inactive=()):
+    for i in range(count):
+        db.add(User(
+            email=f"m{i}@example.com", full_name=f"Member <{i}>", hashed_password="x",
+            is_active=i not in inactive
+        ))
+    db.commit()
+
+
+def add_announcement(db, author_id=1, published=True):
+    announcement = Announcement(
+        title="Costs $5", content="<p>Pay $amount at the door</p>", author_id=author_id,
+        is_published=published
+    )
+    db.add(announcement)
+    db.commit()
+    return announcement
+
+
+def sender(db, provider, **options):
+    return BroadcastSender(sessionmaker(bind=db.get_bind()), transport=provider, budget=SendBudget(0), **options)
+
+
+def test_broadcast_batches_active_members_with_personal_greeting(db):
+    add_members(db, 7, inactive={3})
+    announcement = add_announcement(db)
+    BroadcastService.start_broadcast(db, announcement.id, admin_id=1)
+    provider = StubProvider()
+
+    assert sender(db, provider, batch_size=2, chunk_size=4).run_once() == 6
+    assert [len(batch) for batch in provider.calls] == [2, 2, 2]
+    assert "m3@example.com" not in provider.recipients
+    first = provider.calls[0][0]
+    assert first["subject"] == "Costs $5"
+    assert "Hello Member &lt;0&gt;," in first["html"]
+    assert "Pay $amount at the door" in first["html"]
+    assert "Pay $amount at the door" in first["text"] and "<p>" not in first["text"]
+
+    db.expire_all()
+    broadcast = BroadcastService.get_broadcast(db, announcement.id)
+    assert broadcast.sent_count == 6 and broadcast.completed_at is not None
+    assert sender(db, StubProvider()).run_once() == 0
+
+
+def test_broadcast_resumes_after_provider_failure_without_resending(db):
+    add_members(db, 5)
+    announcement = add_announcement(db)
+    BroadcastService.start_broadcast(db, announcement.id, admin_id=1)
+    provider = StubProvider(fail_on_call=2)
+
+    assert sender(db, provider, batch_size=2).run_once() == 2
+    db.expire_all()
+    broadcast = BroadcastService.get_broadcast(db, announcement.id)
+    assert broadcast.completed_at is None and broadcast.lease_expires_at is None
+
+    assert sender(db, provider, batch_size=2).run_once() == 3
+    assert sorted(provider.recipients) == [f"m{i}@example.com" for i in range(5)]
+    db.expire_all()
+    # An outage is not held against the batch
+    assert BroadcastService.get_broadcast(db, announcement.id).attempts == 0
+
+
+class RejectingProvider:
+    """Up, but refuses every batch (e.g. a validation error)"""
+
+    def __init__(self):
+        self.attempts = 0
+
+    def __call__(self, messages):
+        self.attempts += 1
+        raise ValidationError(message="invalid recipient", error_type="validation_error", code=422)
+
+
+def test_rejected_batch_fails_broadcast_after_max_attempts(db):
+    add_members(db, 3)
+    announcement = add_announcement(db)
+    BroadcastService.start_broadcast(db, announcement.id, admin_id=1)
+    provider = RejectingProvider()
+
+    for _ in range(4):
+        assert sender(db, provider, max_attempts=3).run_once() == 0
+    assert provider.attempts == 3
+    db.expire_all()
+    broadcast = BroadcastService.get_broadcast(db, announcement.id)
+    assert broadcast.failed_at is not None and broadcast.completed_at is None
+    assert broadcast.attempts == 3 and "invalid recipient" in broadcast.last_error
+
+
+def test_broadcast_held_by_another_worker_is_skipped(db):
+    add_members(db, 2)
+    announcement = add_announcement(db)
+    BroadcastService.start_broadcast(db, announcement.id, admin_id=1)
+    sender(db, StubProvider())._claim(db, BroadcastService.get_broadcast(db, announcement.id).id)
+
+    provider = StubProvider()
+    assert sender(db, provider).run_once() == 0
+    assert provider.calls == []
+
+
+def test_deleted_announcement_completes_its_broadcast(db):
+    add_members(db, 2)
+    announcement = add_announcement(db)
+    broadcast = BroadcastService.start_broadcast(db, announcement.id, admin_id=1)
+    broadcast_id = broadcast.id
+    db.delete(announcement)
+    db.commit()
+
+    provider = StubProvider()
+    assert sender(db, provider).run_once() == 0
+    assert provider.calls == []
+    completed = db.query(AnnouncementBroadcast).filter(AnnouncementBroadcast.id == broadcast_id).first()
+    assert completed is None or completed.completed_at is not None
+
+
+def test_create_with_broadcast_queues_it_once(client, db, create_user, bearer):
+    admin = create_user("admin@example.com", is_admin=True)
+    headers = bearer("admin@example.com")
+    response = client.post(
+        "/api/content/api/content/announcements",
+        json={"title": "News", "content": "Body", "broadcast": True},
+        headers=headers
+    )
+    assert response.status_code == 201
+    announcement_id = response.json()["id"]
+
+    again = client.post(f"/api/content/api/content/announcements/{announcement_id}/broadcast", headers=headers)
+    assert again.status_code == 202
+    assert again.json()["requested_by"] == admin.id
+    assert db.query(AnnouncementBroadcast).count() == 1
+
+    progress = client.get(f"/api/content/api/content/announcements/{announcement_id}/broadcast", headers=headers)
+    assert progress.status_code == 200
+    assert progress.json()["sent_count"] == 0 and progress.json()["completed_at"] is None
+
+
+def test_broadcast_requires_published_announcement_and_admin(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    create_user("member@example.com")
+    draft = add_announcement(db, published=False)
+    headers = bearer("admin@example.com")
+
+    assert client.post(
+        "/api/content/api/content/announcements",
+        json={"title": "Draft", "content": "Body", "is_published": False, "broadcast": True},
+        headers=headers
+    ).status_code == 400
+    assert client.post(f"/api/content/api/content/announcements/{draft.id}/broadcast", headers=headers).status_code == 400
+    assert client.post("/api/content/api/content/announcements/999/broadcast", headers=headers).status_code == 404
+    assert client.get(f"/api/content/api/content/announcements/{draft.id}/broadcast", headers=headers).status_code == 404
+    assert client.post(
+        f"/api/content/api/content/announcements/{draft.id}/broadcast",
+        headers=bearer("member@example.com")
+    ).status_code == 403
@@ -0,0 +1,65 @@
+from app.models.content import Announcement, PageContent
+from app.schemas.content import AnnouncementCreate
+from app.schemas.event import EventUpdate
+from app.services.content_service import ContentService
+from app.services.event_service import EventService
+
+
+def seed_content(db):
+    db.add(Announcement(title="Welcome", content="Hi", author_id=1, is_published=True))
+    db.add(PageContent(page_name="about_us", content="About", updated_by=1))
+    db.commit()
+
+
+def test_home_bundle_collects_everything(client, db, make_events):
+    ids = make_events(2)
+    seed_content(db)
+
+    response = client.get("/api/bundle/home", params={"pages": "about_us,missing"})
+    assert response.status_code == 200
+    body = response.json()
+    assert [e["id"] for e in body["upcoming_events"]] == ids
+    assert [a["title"] for a in body["announcements"]] == ["Welcome"]
+    assert list(body["pages"]) == ["about_us"]
+    assert response.headers["etag"]
+    assert "last-modified" not in response.headers
+
+
+def test_home_bundle_is_cached_and_revalidated(client, db, make_events, count_queries):
+    ids = make_events(1)
+    seed_content(db)
+
+    first = client.get("/api/bundle/home")
+    etag = first.headers["etag"]
+    with count_queries() as counter:
+        assert client.get("/api/bundle/home").json() == first.json()
+        assert client.get("/api/bundle/home", headers={"If-None-Match": etag}).status_code == 304
+    assert counter.statements == []
+
+    # Writes to any part drop the composite entry and change the ETag
+    EventService.update_event(db, ids[0], EventUpdate(title="Renamed"))
+    changed = client.get("/api/bundle/home", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["upcoming_events"][0]["title"] == "Renamed"
+
+    etag = changed.headers["etag"]
+    ContentService.create_announcement(db, AnnouncementCreate(title="News", content="Fresh"), author_id=1)
+    changed = client.get("/api/bundle/home", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(changed.json()["announcements"]) == 2
+
+
+def test_home_bundle_limits_page_names(client):
+    pages = ",".join(f"page_{i}" for i in range(11))
+    assert client.get("/api/bundle/home", params={"pages": pages}).status_code == 400
+
+
+def test_home_bundle_notices_removed_announcements(client, db):
+    seed_content(db)
+    extra = ContentService.create_announcement(db, AnnouncementCreate(title="News", content="Fresh"), author_id=1)
+    etag = client.get("/api/bundle/home").headers["etag"]
+
+    ContentService.delete_announcement(db, extra.id)
+    changed = client.get("/api/bundle/home", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert [a["title"] for a in changed.json()["announcements"]] == ["Welcome"]
@@ -0,0 +1,168 @@
+import pytest
+from fastapi import HTTPException
+
+from app.models.registration import Registration
+from app.models.user import User
+from app.services.checkin_service import CheckInDesk, check_in_desk
+from app.utils.bitmap import Bitmap
+from app.utils.tickets import sign_ticket, verify_ticket
+from app.utils.token_versions import token_versions
+
+
+class BrokenSession:
+    """A session whose database is unreachable"""
+
+    def execute(self, *args, **kwargs):
+        raise ConnectionError("database unavailable")
+
+    def rollback(self):
+        pass
+
+
+def add_registrations(db, event_id, count, cancelled=()):
+    tickets = []
+    for i in range(count):
+        user = User(email=f"a{i}-{event_id}@example.com", full_name=f"Attendee {i}", hashed_password="x")
+        db.add(user)
+        db.flush()
+        registration = Registration(user_id=user.id, event_id=event_id, is_cancelled=i in cancelled)
+        db.add(registration)
+        db.flush()
+        tickets.append(registration.ticket)
+    db.commit()
+    return tickets
+
+
+def test_ticket_round_trip_and_tampering():
+    ticket = sign_ticket(12, 3, 4)
+    assert ticket.startswith("T1") and ticket.isalnum() and ticket.isupper()
+    assert verify_ticket(ticket) == (12, 3, 4)
+    assert verify_ticket(ticket.lower()) == (12, 3, 4)
+    for position in range(2, len(ticket)):
+        other = "B" if ticket[position] == "A" else "A"
+        assert verify_ticket(ticket[:position] + other + ticket[position + 1:]) is None
+    assert verify_ticket("T1" + "A" * 32) is None
+    assert verify_ticket("not a ticket") is None
+
+
+def test_bitmap_grows_both_ways():
+    bitmap = Bitmap([100, 5])
+    assert bitmap.add(7) and not bitmap.add(5)
+    assert bitmap.add(10_000) and 10_000 in bitmap
+    assert 6 not in bitmap and 0 not in bitmap
+    bitmap.discard(5)
+    assert 5 not in bitmap and len(bitmap) == 3
+
+
+def test_scans_are_checked_in_memory_and_written_in_batches(db, make_events, count_queries):
+    event_id = make_events(count=1)[0]
+    tickets = add_registrations(db, event_id, 5)
+    desk = CheckInDesk()
+
+    desk.check_in(db, event_id, tickets[0])  # loads the roster
+    with count_queries() as counter:
+        for ticket in tickets[1:]:
+            desk.check_in(db, event_id, ticket)
+    assert counter.statements == []
+    assert desk.checked_in_count(event_id) == 5 and desk.pending_writes() == 5
+
+    with count_queries() as counter:
+        assert desk.flush(db) == 5
+    assert len([s for s in counter.statements if s.startswith("UPDATE")]) == 1
+    db.expire_all()
+    assert db.query(Registration).filter(Registration.checked_in_at.is_not(None)).count() == 5
+
+
+def test_duplicates_are_rejected_across_restarts(db, make_events):
+    event_id = make_events(count=1)[0]
+    tickets = add_registrations(db, event_id, 2)
+    desk = CheckInDesk()
+    desk.check_in(db, event_id, tickets[0])
+    with pytest.raises(HTTPException) as duplicate:
+        desk.check_in(db, event_id, tickets[0])
+    assert duplicate.value.status_code == 409
+    desk.flush(db)
+
+    restarted = CheckInDesk()
+    with pytest.raises(HTTPException) as duplicate:
+        restarted.check_in(db, event_id, tickets[0])
+    assert duplicate.value.status_code == 409
+    assert restarted.check_in(db, event_id, tickets[1]).registration_id
+
+
+def test_check_in_continues_through_database_outage(db, make_events, fake_clock):
+    event_id = make_events(count=1)[0]
+    tickets = add_registrations(db, event_id, 3)
+    clock = fake_clock
+    desk = CheckInDesk(roster_ttl=60, clock=clock)
+
+    # Roster cannot be loaded and writes fail: scanning still works
+    desk.check_in(BrokenSession(), event_id, tickets[0])
+    desk.check_in(BrokenSession(), event_id, tickets[1])
+    try:
+        desk.flush(BrokenSession())
+    except ConnectionError:
+        pass
+    assert desk.pending_writes() == 2
+
+    # Database is back
+    clock.now += 5
+    desk.check_in(db, event_id, tickets[2])
+    assert desk.flush(db) == 3
+    db.expire_all()
+    assert db.query(Registration).filter(Registration.checked_in_at.is_not(None)).count() == 3
+
+
+def test_cancelled_tickets_are_refused(db, make_events):
+    event_id = make_events(count=1)[0]
+    tickets = add_registrations(db, event_id, 3, cancelled={0})
+    desk = CheckInDesk()
+    with pytest.raises(HTTPException) as refused:
+        desk.check_in(db, event_id, tickets[0])
+    assert refused.value.detail == "Registration was cancelled"
+
+    desk.note_cancelled(event_id, verify_ticket(tickets[1]).registration_id)
+    with pytest.raises(HTTPException) as refused:
+        desk.check_in(db, event_id, tickets[1])
+    assert refused.value.detail == "Registration was cancelled"
+    assert desk.check_in(db, event_id, tickets[2])
+
+
+def test_check_in_endpoint(client, db, create_user, bearer, make_events, count_queries):
+    event_ids = make_events(count=2)
+    tickets = add_registrations(db, event_ids[0], 2)
+    create_user("admin@example.com", is_admin=True)
+    create_user("member@example.com")
+    headers = bearer("admin@example.com")
+    token_versions.sync(db)
+    url = f"/api/registrations/event/{event_ids[0]}/check-in"
+
+    response = client.post(url, json={"ticket": tickets[0]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["registration_id"] == verify_ticket(tickets[0]).registration_id
+    with count_queries() as counter:
+        assert client.post(url, json={"ticket": tickets[0]}, headers=headers).status_code == 409
+        assert client.post(url, json={"ticket": tickets[1]}, headers=headers).status_code == 200
+    assert counter.statements == []
+
+    assert client.post(
+        f"/api/registrations/event/{event_ids[1]}/check-in", json={"ticket": tickets[0]}, headers=headers
+    ).status_code == 400
+    forged = tickets[0][:-1] + ("B" if tickets[0][-1] == "A" else "A")
+    assert client.post(url, json={"ticket": forged}, headers=headers).json()["detail"] == "Invalid ticket"
+    assert client.post(url, json={"ticket": "garbage"}, headers=headers).status_code == 400
+    assert client.post(
+        url, json={"ticket": tickets[1]}, headers=bearer("member@example.com")
+    ).status_code == 403
+    assert check_in_desk.checked_in_count(event_ids[0]) == 2
+
+
+def test_registrations_carry_their_ticket(client, db, create_user, bearer, make_events):
+    event_id = make_events(count=1)[0]
+    create_user("member@example.com")
+    headers = bearer("member@example.com")
+    response = client.post("/api/registrations/", json={"event_id": event_id}, headers=headers)
+    assert response.status_code == 201
+    body = response.json()
+    assert verify_ticket(body["ticket"]) == (body["id"], event_id, body["user_id"])
+    assert body["checked_in_at"] is None
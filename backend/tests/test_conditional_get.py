@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+
+from app.models.content import Announcement, PageContent
+from app.schemas.event import EventUpdate
+from app.services.event_service import EventService
+from app.utils.http_cache import weak_etag, _etag_matches
+
+
+ANNOUNCEMENTS = "/api/content/api/content/announcements"
+
+
+def test_weak_etag_comparison():
+    etag = weak_etag("event", 1, datetime(2024, 1, 1))
+    assert etag.startswith('W/"')
+    assert etag != weak_etag("event", 1, datetime(2024, 1, 2))
+    assert _etag_matches(etag, etag)
+    assert _etag_matches(f'"abc", {etag[2:]}', etag)
+    assert _etag_matches("*", etag)
+    assert not _etag_matches('W/"other"', etag)
+
+
+def test_event_detail_revalidates(client, db, make_events):
+    event_id = make_events(1)[0]
+
+    response = client.get(f"/api/events/{event_id}")
+    etag = response.headers["etag"]
+    assert response.headers["last-modified"]
+
+    cached = client.get(f"/api/events/{event_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    EventService.update_event(db, event_id, EventUpdate(title="Renamed"))
+    changed = client.get(f"/api/events/{event_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "Renamed"
+    assert changed.headers["etag"] != etag
+
+
+def test_event_list_revalidates_by_etag_only(client, db, make_events):
+    event_ids = make_events()
+    response = client.get("/api/events/")
+    etag = response.headers["etag"]
+    assert "last-modified" not in response.headers
+    assert client.get("/api/events/", headers={"If-None-Match": etag}).status_code == 304
+
+    # Deleting an event moves no timestamp forward; only the ETag notices
+    since = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
+    EventService.delete_event(db, event_ids[0])
+    assert client.get("/api/events/", headers={"If-Modified-Since": since}).status_code == 200
+    assert client.get("/api/events/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_announcements_answer_304_without_loading_rows(client, db, count_queries):
+    db.add(Announcement(title="Hello", content="World", author_id=1, is_published=True))
+    db.add(Announcement(title="Draft", content="Hidden", author_id=1, is_published=False))
+    db.commit()
+
+    response = client.get(ANNOUNCEMENTS)
+    assert [a["title"] for a in response.json()] == ["Hello"]
+    etag = response.headers["etag"]
+
+    with count_queries() as counter:
+        assert client.get(ANNOUNCEMENTS, headers={"If-None-Match": etag}).status_code == 304
+    assert len(counter.statements) == 1
+
+    db.add(Announcement(title="News", content="Fresh", author_id=1, is_published=True))
+    db.commit()
+    assert client.get(ANNOUNCEMENTS, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_announcement_delete_is_not_hidden_by_if_modified_since(client, db):
+    old = Announcement(title="Old", content="Kept", author_id=1, is_published=True,
+                       updated_at=datetime.utcnow() - timedelta(days=2))
+    new = Announcement(title="New", content="Pulled", author_id=1, is_published=True,
+                       updated_at=datetime.utcnow() - timedelta(days=1))
+    db.add_all([old, new])
+    db.commit()
+
+    response = client.get(ANNOUNCEMENTS)
+    assert "last-modified" not in response.headers
+    since = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+    # The remaining row is older than the client's copy, yet the list changed
+    db.delete(new)
+    db.commit()
+    refreshed = client.get(ANNOUNCEMENTS, headers={"If-Modified-Since": since})
+    assert refreshed.status_code == 200
+    assert [a["title"] for a in refreshed.json()] == ["Old"]
+    assert client.get(ANNOUNCEMENTS, headers={"If-None-Match": response.headers["etag"]}).status_code == 200
+
+
+def test_page_content_revalidates(client, db):
+    page = PageContent(page_name="about_us", content="About", updated_by=1,
+                       updated_at=datetime.utcnow() - timedelta(days=1))
+    db.add(page)
+    db.commit()
+
+    url = "/api/content/api/content/pages/about_us"
+    response = client.get(url)
+    assert response.json()["content"] == "About"
+
+    assert client.get(url, headers={"If-None-Match": response.headers["etag"]}).status_code == 304
+    assert client.get(url, headers={"If-Modified-Since": response.headers["last-modified"]}).status_code == 304
+
+    page.content = "Changed"
+    db.commit()
+    assert client.get(url, headers={"If-None-Match": response.headers["etag"]}).status_code == 200
@@ -0,0 +1,237 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import resend
+from sqlalchemy.orm import sessionmaker
+
+import app.services.email as email
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox import EmailOutboxWorker
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+REPLIES = {
+    "ok": (200, {"id": "msg_1"}),
+    "down": (500, {"statusCode": 500, "message": "provider down", "name": "application_error"}),
+    "reject": (422, {"statusCode": 422, "message": "invalid address", "name": "validation_error"}),
+}
+
+
+class FakeResend:
+    """Local HTTP server standing in for api.resend.com"""
+
+    def __init__(self):
+        self.mode = "ok"
+        self.requests = []
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                fake.requests.append((self.path, json.loads(body)))
+                status, reply = REPLIES[fake.mode]
+                payload = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    fake = FakeResend()
+    monkeypatch.setattr(resend, "api_url", fake.url)
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    email.email_breaker.reset()
+    monkeypatch.setattr(email.email_breaker, "clock", clock)
+    monkeypatch.setattr(email.email_breaker, "min_calls", 3)
+    yield clock
+    email.email_breaker.reset()
+
+
+@pytest.fixture
+def outbox(db, monkeypatch):
+    Session = sessionmaker(bind=db.get_bind())
+    monkeypatch.setattr(email, "SessionLocal", Session)
+    return Session
+
+
+def worker(Session, **options):
+    return EmailOutboxWorker(Session, email.deliver_email, email.email_breaker, email.EMAIL_FROM, **options)
+
+
+def test_breaker_opens_probes_and_backs_off():
+    clock = Clock()
+    breaker = CircuitBreaker("test", failure_rate=0.5, min_calls=4, open_seconds=10, max_open_seconds=30, clock=clock)
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now += 10
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        # Only one probe at a time
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.snapshot()["open_seconds"] == 20
+
+    clock.now += 20
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.snapshot()["open_seconds"] == 30
+
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["open_seconds"] == 10
+    assert breaker.snapshot()["times_opened"] == 3
+
+
+def test_failures_outside_window_are_forgotten():
+    clock = Clock()
+    breaker = CircuitBreaker("test", min_calls=2, window_seconds=60, clock=clock)
+    breaker.record_failure()
+    clock.now += 61
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_outage_opens_circuit_and_defers_to_outbox(provider, clock, outbox, db):
+    provider.mode = "down"
+    for i in range(5):
+        email._send(f"m{i}@example.com", "Hi", "<p>Hi</p>", "Hi")
+
+    # Only the calls needed to trip the breaker reached the provider
+    assert len(provider.requests) == 3
+    assert email.email_breaker.state == "open"
+    pending = db.query(EmailOutbox).order_by(EmailOutbox.id).all()
+    assert [entry.to_email for entry in pending] == [f"m{i}@example.com" for i in range(5)]
+    assert pending[0].text == "Hi" and "provider down" in pending[0].last_error
+    assert "circuit is open" in pending[4].last_error
+
+    # Still open: the worker does not even try
+    assert worker(outbox).run_once() == 0
+    assert len(provider.requests) == 3
+
+    provider.mode = "ok"
+    clock.now += email.email_breaker.base_open_seconds
+    assert worker(outbox).run_once() == 5
+    assert email.email_breaker.state == "closed"
+    assert len(provider.requests) == 8
+    db.expire_all()
+    assert all(entry.sent_at is not None for entry in db.query(EmailOutbox).all())
+
+
+def test_failed_probe_keeps_messages_queued(provider, clock, outbox, db):
+    provider.mode = "down"
+    for i in range(4):
+        email._send(f"m{i}@example.com", "Hi", "<p>Hi</p>")
+    clock.now += email.email_breaker.base_open_seconds
+
+    assert worker(outbox).run_once() == 0
+    # One probe, which failed and reopened the circuit for longer
+    assert len(provider.requests) == 4
+    assert email.email_breaker.state == "open"
+    assert email.email_breaker.snapshot()["open_seconds"] == 2 * email.email_breaker.base_open_seconds
+    db.expire_all()
+    entries = db.query(EmailOutbox).order_by(EmailOutbox.id).all()
+    assert [entry.attempts for entry in entries] == [1, 0, 0, 0]
+    assert all(entry.sent_at is None and entry.failed_at is None for entry in entries)
+
+
+def test_rejected_message_is_not_deferred_and_does_not_trip(provider, clock, outbox, db):
+    provider.mode = "reject"
+    for _ in range(5):
+        email._send("bad@example", "Hi", "<p>Hi</p>")
+    assert len(provider.requests) == 5
+    assert email.email_breaker.state == "closed"
+    assert db.query(EmailOutbox).count() == 0
+
+
+def test_outbox_retries_with_growing_delay_then_gives_up(provider, clock, outbox, db, monkeypatch):
+    monkeypatch.setattr(email.email_breaker, "min_calls", 1000)
+    provider.mode = "down"
+    email._send("m@example.com", "Hi", "<p>Hi</p>")
+    now = datetime.utcnow()
+    retry = worker(outbox, max_attempts=3)
+
+    assert retry.run_once(now) == 0
+    db.expire_all()
+    entry = db.query(EmailOutbox).one()
+    assert entry.attempts == 1 and entry.next_attempt_at == now + timedelta(seconds=30)
+    assert retry.run_once(now) == 0  # not due yet
+
+    now = entry.next_attempt_at
+    retry.run_once(now)
+    db.expire_all()
+    entry = db.query(EmailOutbox).one()
+    assert entry.attempts == 2 and entry.next_attempt_at == now + timedelta(seconds=60)
+
+    retry.run_once(entry.next_attempt_at)
+    db.expire_all()
+    entry = db.query(EmailOutbox).one()
+    assert entry.attempts == 3 and entry.failed_at is not None and entry.sent_at is None
+
+
+def test_broadcast_batch_fails_fast_while_open(provider, clock):
+    provider.mode = "down"
+    for _ in range(3):
+        with pytest.raises(Exception):
+            email._send_batch([{"to": "m@example.com", "subject": "Hi", "html": "<p>Hi</p>"}])
+    with pytest.raises(CircuitOpenError):
+        email._send_batch([{"to": "m@example.com", "subject": "Hi", "html": "<p>Hi</p>"}])
+    assert len(provider.requests) == 3
+
+
+def test_email_metrics_show_breaker_and_outbox(client, db, provider, clock, outbox, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    create_user("member@example.com")
+    provider.mode = "down"
+    for i in range(3):
+        email._send(f"m{i}@example.com", "Hi", "<p>Hi</p>")
+
+    response = client.get("/api/admin/metrics/email", headers=bearer("admin@example.com"))
+    assert response.status_code == 200
+    body = response.json()
+    assert body["breaker"]["state"] == "open"
+    assert body["breaker"]["retry_after"] > 0
+    assert body["outbox"] == {"pending": 3, "failed": 0}
+    assert client.get(
+        "/api/admin/metrics/email", headers=bearer("member@example.com")
+    ).status_code == 403
@@ -0,0 +1,42 @@
+from datetime import datetime
+
+import pytest
+from jinja2 import UndefinedError
+
+from app.services.email import event_registration_message, event_reminder_message
+from app.utils.email_templates import EMAIL_SUBJECTS, get_email_template, load_email_templates
+
+
+def test_every_message_type_compiles():
+    assert load_email_templates() == len(EMAIL_SUBJECTS)
+
+
+def test_html_part_escapes_user_input_but_subject_and_text_do_not():
+    message = event_registration_message(
+        "<script>alert(1)</script>", "Pitch & Pizza", datetime(2027, 3, 1), None, "Hall <B>"
+    )
+    assert "<script>" not in message.html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in message.html
+    assert "Pitch &amp; Pizza" in message.html
+    assert message.subject == "You're registered: Pitch & Pizza"
+    assert "Hello <script>alert(1)</script>," in message.text
+    assert "Time:     TBA" in message.text
+
+
+def test_reminder_has_both_parts():
+    message = event_reminder_message("Ann", "Workshop", datetime(2027, 3, 1, 18), "18:00:00", "Lab 1", "1 hour")
+    assert message.subject == "Reminder: Workshop starts in 1 hour"
+    assert "2027-03-01 18:00" in message.html and "2027-03-01 18:00" in message.text
+
+
+def test_render_many_merges_shared_and_recipient_context():
+    messages = list(get_email_template("welcome").render_many(
+        [{"full_name": "Ann"}, {"full_name": "Bo"}], login_link="https://example.com/login"
+    ))
+    assert [m.text.splitlines()[2] for m in messages] == ["Hello Ann,", "Hello Bo,"]
+    assert all("https://example.com/login" in m.html for m in messages)
+
+
+def test_missing_variable_is_an_error():
+    with pytest.raises(UndefinedError):
+        get_email_template("welcome").render(full_name="Ann")
@@ -0,0 +1,41 @@
+from app.schemas.event import EventUpdate
+from app.services.event_cache import event_detail_cache
+from app.services.event_service import EventService
+
+
+def test_batch_returns_events_keyed_by_id(client, db, make_events):
+    ids = make_events(3)
+
+    response = client.get("/api/events/batch", params={"ids": f"{ids[2]},{ids[0]},999,{ids[0]}"})
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["events"]) == {str(ids[0]), str(ids[2])}
+    assert body["events"][str(ids[2])]["title"] == "Event 2"
+    assert body["missing"] == [999]
+
+
+def test_batch_uses_one_query_and_shares_the_detail_cache(client, db, make_events, count_queries):
+    ids = make_events(3)
+    client.get(f"/api/events/{ids[0]}")
+
+    with count_queries() as counter:
+        client.get("/api/events/batch", params={"ids": ",".join(map(str, ids))})
+    assert len(counter.statements) == 1
+    assert "IN" in counter.statements[0]
+    assert all(event_detail_cache.get(event_id) is not None for event_id in ids)
+
+    # Everything is cached now, for both endpoints
+    with count_queries() as counter:
+        client.get("/api/events/batch", params={"ids": ",".join(map(str, ids))})
+        client.get(f"/api/events/{ids[1]}")
+    assert counter.statements == []
+
+    EventService.update_event(db, ids[1], EventUpdate(title="Renamed"))
+    body = client.get("/api/events/batch", params={"ids": ",".join(map(str, ids))}).json()
+    assert body["events"][str(ids[1])]["title"] == "Renamed"
+
+
+def test_batch_validates_ids(client):
+    assert client.get("/api/events/batch", params={"ids": "1,abc"}).status_code == 400
+    assert client.get("/api/events/batch", params={"ids": ",".join(map(str, range(101)))}).status_code == 400
+    assert client.get("/api/events/batch", params={"ids": ""}).status_code in (400, 422)
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+
+from app.schemas.event import EventCreate, EventUpdate
+from app.services.event_cache import list_lifetime, EVENT_LIST_TTL, EVENT_STALE_TTL
+from app.services.event_service import EventService
+from app.utils.cache import TTLCache, MISSING
+
+
+def test_list_is_cached_until_an_event_changes(client, db, make_events, count_queries):
+    ids = make_events()
+
+    with count_queries() as counter:
+        first = client.get("/api/events/", params={"page": 1, "page_size": 10})
+        second = client.get("/api/events/?page_size=10&page=1")
+    assert first.json() == second.json()
+    assert len(first.json()["events"]) == 3
+    # count + page + next start, all on the first request only
+    assert len(counter.statements) == 3
+
+    EventService.update_event(db, ids[0], EventUpdate(title="Renamed"))
+    response = client.get("/api/events/", params={"page": 1, "page_size": 10})
+    assert response.json()["events"][0]["title"] == "Renamed"
+
+
+def test_detail_is_cached_and_invalidated(client, db, make_events, count_queries):
+    event_id = make_events(1)[0]
+
+    with count_queries() as counter:
+        assert client.get(f"/api/events/{event_id}").json()["title"] == "Event 0"
+        assert client.get(f"/api/events/{event_id}").json()["title"] == "Event 0"
+    assert len(counter.statements) == 1
+
+    EventService.delete_event(db, event_id)
+    assert client.get(f"/api/events/{event_id}").json()["is_active"] is False
+    assert client.get("/api/events/999").status_code == 404
+
+
+def test_list_lifetime_stops_at_next_start():
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    assert list_lifetime(None, now) == (EVENT_LIST_TTL, EVENT_STALE_TTL)
+    assert list_lifetime(now + timedelta(seconds=10), now) == (10, 0)
+    assert list_lifetime(now + timedelta(hours=1), now) == (EVENT_LIST_TTL, EVENT_STALE_TTL)
+
+
+def test_stale_while_revalidate(fake_clock):
+    clock = fake_clock
+    cache = TTLCache(ttl=10, clock=clock)
+    scheduled = []
+    values = iter(["v1", "v2"])
+
+    def get():
+        return cache.get_or_load("k", lambda: next(values), stale_ttl=10, schedule=scheduled.append)
+
+    assert get() == "v1"
+    clock.now = 15  # stale but inside the stale window
+    assert get() == "v1"
+    assert get() == "v1"
+    assert len(scheduled) == 1  # one refresh for any number of stale hits
+
+    scheduled[0]()
+    assert get() == "v2"
+
+    clock.now = 100  # past the stale window: a plain miss
+    assert cache.get("k") is MISSING
+
+
+def test_summary_view_skips_description(client, db, make_events, count_queries):
+    make_events(2)
+
+    with count_queries() as counter:
+        response = client.get("/api/events/", params={"view": "summary"})
+    events = response.json()["events"]
+    assert set(events[0]) == {"id", "title", "event_date", "event_time", "location", "image_url", "is_active"}
+    page_query = next(s for s in counter.statements if "LIMIT" in s)
+    assert "description" not in page_query
+
+    full = client.get("/api/events/").json()["events"]
+    assert full[0]["description"] == "Description"
+    assert full[0]["event_date"] == events[0]["event_date"]
+
+
+def test_sparse_fields(client, db, make_events):
+    make_events(1)
+    events = client.get("/api/events/", params={"fields": "title, location"}).json()["events"]
+    assert events == [{"id": events[0]["id"], "location": "Hall", "title": "Event 0"}]
+
+    assert client.get("/api/events/", params={"fields": "title,password"}).status_code == 400
+    assert client.get("/api/events/", params={"view": "tiny"}).status_code == 400
+
+
+def test_totals_are_cached_per_filter(client, db, make_events, count_queries):
+    make_events(3)
+
+    first = client.get("/api/events/", params={"page_size": 2}).json()
+    assert (first["total"], first["total_pages"], first["approximate"]) == (3, 2, False)
+
+    with count_queries() as counter:
+        second = client.get("/api/events/", params={"page_size": 2, "page": 2}).json()
+    assert second["total"] == 3
+    assert not any("count(" in s.lower() for s in counter.statements)
+
+    EventService.create_event(db, EventCreate(
+        title="New", description="D", location="Hall", capacity=5,
+        event_date=datetime.utcnow() + timedelta(days=30),
+        registration_deadline=datetime.utcnow() + timedelta(days=20),
+    ), admin_id=1)
+    assert client.get("/api/events/", params={"page_size": 2, "page": 2}).json()["total"] == 4
+
+
+def test_totals_can_be_skipped_or_estimated(client, db, make_events, count_queries):
+    make_events(2)
+
+    with count_queries() as counter:
+        body = client.get("/api/events/", params={"include_total": "false"}).json()
+    assert body["total"] is None and body["total_pages"] is None
+    assert not any("count(" in s.lower() for s in counter.statements)
+
+    # No planner estimates on SQLite: the exact count is returned and flagged as such
+    body = client.get("/api/events/", params={"approximate_total": "true"}).json()
+    assert (body["total"], body["approximate"]) == (2, False)
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+from app.models.event import Event
+from app.schemas.event import EventUpdate
+from app.services import event_service
+from app.services.event_service import EventService, decode_sync_token, encode_sync_token
+
+
+def backdate(db, ids, minutes=10):
+    # Same timestamp for all, so paging has to fall back to the id tie-break
+    changed_at = (datetime.utcnow() - timedelta(minutes=minutes)).replace(microsecond=123456)
+    for event in db.query(Event).filter(Event.id.in_(ids)):
+        event.created_at = changed_at
+        event.updated_at = changed_at
+    db.commit()
+
+
+def test_token_round_trip():
+    cursor = (datetime(2024, 5, 1, 12, 30, 15, 250000), 42)
+    assert decode_sync_token(encode_sync_token(cursor)) == cursor
+
+
+def test_full_sync_then_deltas(client, db, monkeypatch, make_events):
+    ids = make_events(3)
+    backdate(db, ids)
+
+    first = client.get("/api/events/changes").json()
+    assert [e["id"] for e in first["changes"]] == ids
+    assert first["deleted"] == []
+    assert first["has_more"] is False
+
+    token = first["next_token"]
+    nothing = client.get("/api/events/changes", params={"since": token}).json()
+    assert nothing == {"changes": [], "deleted": [], "next_token": token, "has_more": False}
+
+    EventService.update_event(db, ids[1], EventUpdate(title="Renamed"))
+    # Fresh writes are held back until they settle
+    assert client.get("/api/events/changes", params={"since": token}).json()["changes"] == []
+
+    monkeypatch.setattr(event_service, "CHANGES_SETTLE_SECONDS", 0)
+    delta = client.get("/api/events/changes", params={"since": token}).json()
+    assert [e["title"] for e in delta["changes"]] == ["Renamed"]
+    assert delta["next_token"] != token
+
+
+def test_soft_delete_is_a_tombstone(client, db, monkeypatch, make_events):
+    monkeypatch.setattr(event_service, "CHANGES_SETTLE_SECONDS", 0)
+    ids = make_events(2)
+    backdate(db, ids)
+    token = client.get("/api/events/changes").json()["next_token"]
+
+    assert EventService.delete_event(db, ids[0])
+    delta = client.get("/api/events/changes", params={"since": token}).json()
+    assert delta["changes"] == []
+    assert delta["deleted"] == [ids[0]]
+
+
+def test_paging_by_keyset(client, db, make_events):
+    ids = make_events(5)
+    backdate(db, ids)
+
+    seen, token = [], None
+    while True:
+        params = {"limit": 2, **({"since": token} if token else {})}
+        page = client.get("/api/events/changes", params=params).json()
+        seen += [e["id"] for e in page["changes"]]
+        token = page["next_token"]
+        if not page["has_more"]:
+            break
+    assert seen == ids
+
+
+def test_invalid_token(client):
+    response = client.get("/api/events/changes", params={"since": "not-a-token"})
+    assert response.status_code == 400
@@ -0,0 +1,204 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event as sa_event
+
+from app.models.event import Event
+from app.schemas.event_series import EventSeriesCreate
+from app.services.event_series_service import iter_occurrences
+
+
+def rule(**overrides):
+    values = dict(starts_at=datetime(2027, 1, 4, 18, 0), frequency="weekly", interval=1,
+                  weekdays=None, until=None, count=None)
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_iter_occurrences_rules():
+    # Mondays and Thursdays, five occurrences
+    series = rule(weekdays="0,3", count=5)
+    assert [d.strftime("%a %d") for d in iter_occurrences(series)] == [
+        "Mon 04", "Thu 07", "Mon 11", "Thu 14", "Mon 18"
+    ]
+    # Every other day until the 9th
+    series = rule(frequency="daily", interval=2, until=datetime(2027, 1, 9, 18, 0))
+    assert [d.day for d in iter_occurrences(series)] == [4, 6, 8]
+    # An open-ended series jumps to the window and gives the same answer as walking
+    series = rule(interval=2)
+    window = (datetime(2030, 3, 1), datetime(2030, 5, 1))
+    walked = [d for d in iter_occurrences(rule(interval=2, count=10_000), *window)]
+    assert list(iter_occurrences(series, *window)) == walked
+    assert len(walked) == 4 and all(d.weekday() == 0 for d in walked)
+
+
+def next_monday(days_ahead=7):
+    day = datetime.utcnow().date() + timedelta(days=days_ahead)
+    return datetime.combine(day + timedelta(days=(7 - day.weekday()) % 7), datetime.min.time()) + timedelta(hours=18)
+
+
+def create_series(client, headers, first, **overrides):
+    body = {
+        "title": "Weekly workshop", "description": "Hands-on", "location": "Lab 1",
+        "capacity": 20, "starts_at": first.isoformat(), "frequency": "weekly", "count": 10,
+    }
+    body.update(overrides)
+    response = client.post("/api/series/", json=body, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+def calendar(client, first, days=28):
+    response = client.get("/api/events/calendar", params={
+        "start": first.date().isoformat(), "end": (first + timedelta(days=days)).date().isoformat()
+    })
+    assert response.status_code == 200
+    return response.json()["events"]
+
+
+def test_series_rule_accepts_mixed_offsets():
+    fields = dict(title="Weekly", description="Sync", location="Lab", capacity=10, frequency="weekly")
+    series = EventSeriesCreate(**fields, starts_at="2026-11-01T18:00:00Z", until="2026-12-01T18:00:00")
+    assert series.starts_at == datetime(2026, 11, 1, 18) and series.until == datetime(2026, 12, 1, 18)
+
+    # 20:00+03:00 is 17:00 UTC, before the start
+    with pytest.raises(ValidationError):
+        EventSeriesCreate(**fields, starts_at="2026-11-01T18:00:00", until="2026-11-01T20:00:00+03:00")
+
+
+def test_create_series_with_mixed_offsets(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    admin = bearer("admin@example.com")
+    first = next_monday()
+    series = create_series(
+        client, admin, first, count=None,
+        starts_at=first.isoformat() + "Z", until=(first + timedelta(weeks=2)).isoformat()
+    )
+    assert series["until"] == (first + timedelta(weeks=2)).isoformat()
+    response = client.post("/api/series/", json={
+        "title": "Weekly", "description": "Sync", "location": "Lab", "capacity": 10, "frequency": "weekly",
+        "starts_at": first.isoformat(), "until": (first - timedelta(hours=1)).isoformat() + "+00:00"
+    }, headers=admin)
+    assert response.status_code == 422
+
+
+def test_series_occurrences_are_listed_without_rows(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    admin = bearer("admin@example.com")
+    first = next_monday()
+    series = create_series(client, admin, first)
+
+    events = calendar(client, first)
+    assert len(events) == 4
+    assert all(event["id"] is None and event["series_id"] == series["id"] for event in events)
+    assert events[1]["occurrence_at"] == (first + timedelta(weeks=1)).isoformat()
+    assert events[1]["event_time"] == "18:00:00"
+    assert db.query(Event).count() == 0
+
+    response = client.get("/api/events/calendar", params={"start": "2027-01-01", "end": "2028-06-01"})
+    assert response.status_code == 400
+
+
+def test_registering_materializes_one_occurrence(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    create_user("a@example.com")
+    create_user("b@example.com")
+    admin = bearer("admin@example.com")
+    first = next_monday()
+    series = create_series(client, admin, first)
+    second = (first + timedelta(weeks=1)).isoformat()
+    url = f"/api/registrations/series/{series['id']}/occurrences/{second}"
+
+    assert client.post(url, headers=bearer("a@example.com")).status_code == 201
+    assert client.post(url, headers=bearer("b@example.com")).status_code == 201
+
+    event = db.query(Event).one()
+    assert (event.series_id, event.current_registrations) == (series["id"], 2)
+    events = calendar(client, first)
+    assert [e["id"] for e in events] == [None, event.id, None, None]
+
+    # Times the rule does not produce are rejected
+    off_schedule = (first + timedelta(days=1)).isoformat()
+    response = client.post(
+        f"/api/registrations/series/{series['id']}/occurrences/{off_schedule}",
+        headers=bearer("a@example.com")
+    )
+    assert response.status_code == 404
+
+
+def test_refused_registration_leaves_no_occurrence_behind(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    create_user("a@example.com")
+    admin = bearer("admin@example.com")
+    first = next_monday()
+    # Registration closed a month before each occurrence
+    series = create_series(client, admin, first, registration_closes_minutes=60 * 24 * 30)
+    url = f"/api/registrations/series/{series['id']}/occurrences/{first.isoformat()}"
+
+    for _ in range(2):
+        response = client.post(url, headers=bearer("a@example.com"))
+        assert response.json()["detail"] == "Registration deadline has passed"
+    assert db.query(Event).count() == 0
+
+
+def test_admin_edits_and_cancels_occurrences(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    admin = bearer("admin@example.com")
+    first = next_monday()
+    series = create_series(client, admin, first)
+    occurrences = [(first + timedelta(weeks=week)).isoformat() for week in range(4)]
+
+    response = client.put(
+        f"/api/series/{series['id']}/occurrences/{occurrences[0]}",
+        json={"title": "Kick-off workshop"}, headers=admin
+    )
+    assert response.status_code == 200
+    assert response.json()["series_id"] == series["id"]
+
+    response = client.delete(f"/api/series/{series['id']}/occurrences/{occurrences[2]}", headers=admin)
+    assert response.status_code == 204
+    assert client.get(f"/api/series/{series['id']}").json()["exceptions"] == [occurrences[2]]
+
+    events = calendar(client, first)
+    assert [e["title"] for e in events] == ["Kick-off workshop", "Weekly workshop", "Weekly workshop"]
+    assert [e["occurrence_at"] for e in events] == [occurrences[0], occurrences[1], occurrences[3]]
+
+    # Stopping the series keeps the materialized occurrence only
+    assert client.delete(f"/api/series/{series['id']}", headers=admin).status_code == 204
+    assert [e["title"] for e in calendar(client, first)] == ["Kick-off workshop"]
+
+
+def test_bulk_create_events_in_one_transaction(client, db, create_user, bearer, count_queries):
+    create_user("admin@example.com", is_admin=True)
+    admin = bearer("admin@example.com")
+    first = next_monday()
+    events = [
+        {
+            "title": f"Workshop {i}", "description": "Hands-on", "location": "Lab 1", "capacity": 20,
+            "event_date": (first + timedelta(days=i)).isoformat(),
+            "registration_deadline": (first + timedelta(days=i, hours=-2)).isoformat(),
+        }
+        for i in range(5)
+    ]
+
+    commits = []
+    on_commit = commits.append
+    sa_event.listen(db.get_bind(), "commit", on_commit)
+    try:
+        with count_queries() as counter:
+            response = client.post("/api/events/bulk", json={"events": events}, headers=admin)
+    finally:
+        sa_event.remove(db.get_bind(), "commit", on_commit)
+    assert response.status_code == 201
+    assert [event["title"] for event in response.json()] == [f"Workshop {i}" for i in range(5)]
+    assert len(commits) == 1
+    # The response is loaded back with one query, not a refresh per event
+    assert len([s for s in counter.statements if s.lstrip().upper().startswith("SELECT EVENTS")]) == 1
+    assert client.get("/api/search/", params={"q": "workshop"}).json()["results"]
+
+    # One invalid event rejects the whole request
+    events[0]["registration_deadline"] = events[0]["event_date"]
+    assert client.post("/api/events/bulk", json={"events": events}, headers=admin).status_code == 422
+    assert db.query(Event).count() == 5
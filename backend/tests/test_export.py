@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+
+from app.models.registration import Registration
+from app.models.user import User
+from app.utils import export
+from app.utils.export import iter_csv, iter_ndjson
+
+
+def add_members(db, count=3):
+    users = [
+        User(email=f"member{i}@example.com", full_name=f"Member {i}", hashed_password="x",
+             student_id=f"2000{i}", is_active=i != 1)
+        for i in range(count)
+    ]
+    db.add_all(users)
+    db.commit()
+    return users
+
+
+def test_user_export_csv_with_column_selection(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    add_members(db)
+    headers = bearer("admin@example.com")
+
+    response = client.get(
+        "/api/admin/users/export",
+        params={"columns": "email,student_id,is_active", "is_admin": "false"},
+        headers=headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="members.csv"' in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["email", "student_id", "is_active"]
+    assert rows[1:] == [
+        ["member0@example.com", "20000", "true"],
+        ["member1@example.com", "20001", "false"],
+        ["member2@example.com", "20002", "true"],
+    ]
+    assert "hashed_password" not in response.text
+
+
+def test_user_export_rejects_unknown_columns(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    headers = bearer("admin@example.com")
+    response = client.get("/api/admin/users/export", params={"columns": "email,hashed_password"}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_registrant_export_ndjson(client, db, create_user, bearer, make_events):
+    create_user("admin@example.com", is_admin=True)
+    members = add_members(db)
+    event_id = make_events(1)[0]
+    db.add_all([
+        Registration(user_id=members[0].id, event_id=event_id),
+        Registration(user_id=members[2].id, event_id=event_id),
+        Registration(user_id=members[1].id, event_id=event_id, is_cancelled=True),
+    ])
+    db.commit()
+    headers = bearer("admin@example.com")
+
+    response = client.get(
+        f"/api/registrations/event/{event_id}/registrants/export",
+        params={"format": "ndjson", "columns": "full_name,email,registered_at"},
+        headers=headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["email"] for line in lines] == ["member0@example.com", "member2@example.com"]
+    assert list(lines[0]) == ["full_name", "email", "registered_at"]
+
+    missing = client.get("/api/registrations/event/999/registrants/export", headers=headers)
+    assert missing.status_code == 404
+
+
+def test_csv_is_streamed_in_chunks(monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_CHUNK_BYTES", 100)
+    consumed = []
+
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield (i, f"name-{i}")
+
+    chunks = iter_csv(rows(), ["id", "name"])
+    first = next(chunks)
+    assert first.startswith("id,name")
+    # Only enough rows for the first chunk have been pulled from the cursor
+    assert len(consumed) < 20
+    assert sum(1 for _ in chunks) > 50
+
+
+def test_csv_neutralizes_formulas_but_ndjson_stays_raw():
+    values = ["=HYPERLINK(\"http://x\")", "+1", "-2", "@SUM(A1)", "\tx", "\rx", "Ann", -3]
+    rows = [(value,) for value in values]
+
+    parsed = list(csv.reader(io.StringIO("".join(iter_csv(rows, ["name"])), newline="")))
+    assert [row[0] for row in parsed[1:]] == ["'" + value for value in values[:6]] + ["Ann", "-3"]
+
+    lines = "".join(iter_ndjson(rows, ["name"])).splitlines()
+    assert [json.loads(line)["name"] for line in lines] == values
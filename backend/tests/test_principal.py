@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from sqlalchemy import event, func, select
+
+from app.models.user import User
+from app.utils.token_versions import TokenVersionMap, token_versions
+
+
+def test_read_routes_make_no_auth_queries(client, db, create_user, bearer):
+    create_user("reader@example.com")
+    headers = bearer("reader@example.com")
+    token_versions.sync(db)
+
+    statements = []
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = client.get("/api/registrations/my-registrations", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert response.status_code == 200
+    # Only the registrations query itself, nothing against users
+    assert len(statements) == 1
+    assert "users" not in statements[0]
+
+
+def test_deactivation_revokes_tokens(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    member = create_user("member@example.com")
+    admin_headers = bearer("admin@example.com")
+    member_headers = bearer("member@example.com")
+
+    assert client.get("/api/registrations/my-registrations", headers=member_headers).status_code == 200
+
+    response = client.patch(
+        f"/api/admin/users/{member.id}/active",
+        json={"is_active": False},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/registrations/my-registrations", headers=member_headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+def test_revoked_admin_loses_access(client, db, create_user, bearer):
+    create_user("root@example.com", is_admin=True)
+    other = create_user("other@example.com", is_admin=True)
+    root_headers = bearer("root@example.com")
+    other_headers = bearer("other@example.com")
+
+    assert client.get("/api/admin/users/", headers=other_headers).status_code == 200
+
+    response = client.patch(
+        f"/api/admin/users/{other.id}/role",
+        json={"is_admin": False},
+        headers=root_headers,
+    )
+    assert response.status_code == 200
+    assert client.get("/api/admin/users/", headers=other_headers).status_code == 401
+
+    # A fresh login carries the new role
+    assert client.get("/api/admin/users/", headers=bearer("other@example.com")).status_code == 403
+
+
+def test_sync_sees_bumps_committed_behind_the_watermark(db, create_user):
+    first = create_user("first@example.com")
+    late = create_user("late@example.com")
+    versions = TokenVersionMap(settle_seconds=30)
+    first.token_version = 1
+    db.commit()
+    versions.sync(db)
+    watermark = db.scalar(select(func.max(User.updated_at)))
+
+    # A long transaction commits a bump stamped with its start time, before the watermark
+    late.token_version = 1
+    late.updated_at = watermark - timedelta(seconds=10)
+    db.commit()
+    versions.sync(db)
+    assert versions.get(late.id) == 1
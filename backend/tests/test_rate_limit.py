@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from app.utils.auth import create_access_token
+from app.utils.rate_limit import (
+    MemoryBackend, SharedBackend, LocalCounterStore, get_rejection_counts
+)
+
+
+class FakeClock:
+    def __init__(self, now=960.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_memory_backend_sliding_window():
+    clock = FakeClock()
+    backend = MemoryBackend(clock=clock)
+
+    for _ in range(3):
+        assert backend.hit("60:test:ip:1", limit=3, window=60) is None
+
+    retry_after = backend.hit("60:test:ip:1", limit=3, window=60)
+    assert retry_after is not None and retry_after >= 1
+
+    # Half a window later the previous window still weighs 50%: 3 * 0.5 = 1.5
+    clock.now += 60 + 30
+    assert backend.hit("60:test:ip:1", limit=3, window=60) is None
+    assert backend.hit("60:test:ip:1", limit=3, window=60) is not None
+
+    # Keys are independent
+    assert backend.hit("60:test:ip:2", limit=3, window=60) is None
+
+
+def test_memory_backend_evicts_lru_keys():
+    backend = MemoryBackend(max_keys=2, clock=FakeClock())
+    for ident in ("a", "b", "c"):
+        backend.hit(f"60:test:ip:{ident}", limit=5, window=60)
+    assert len(backend) == 2
+
+
+def test_memory_backend_evicts_stale_keys_behind_longer_windows():
+    clock = FakeClock()
+    backend = MemoryBackend(clock=clock)
+    # An hour-long key, still live, ahead of minute keys that go stale
+    backend.hit("3600:change_email:user:1", limit=5, window=3600)
+    for ident in range(500):
+        backend.hit(f"60:login:ip:{ident}", limit=5, window=60)
+    clock.now += 600
+    for _ in range(1000):
+        backend.hit("60:login:ip:fresh", limit=10_000, window=60)
+    assert len(backend) == 2
+
+
+def test_shared_backend_with_local_store():
+    clock = FakeClock()
+    store = LocalCounterStore(clock=clock)
+    worker_a = SharedBackend(store, clock=clock)
+    worker_b = SharedBackend(store, clock=clock)
+
+    assert worker_a.hit("60:test:account:x", limit=2, window=60) is None
+    assert worker_b.hit("60:test:account:x", limit=2, window=60) is None
+    assert worker_a.hit("60:test:account:x", limit=2, window=60) is not None
+
+    # Rejected calls are not counted
+    assert store.get("rl:60:test:account:x:16") == 2
+
+
+def test_change_email_is_throttled(auth_client, test_user):
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(test_user.id)})}"}
+    with patch("app.services.profile_service.send_verification_email"):
+        statuses = [
+            auth_client.post(
+                "/api/profile/change-email",
+                json={"new_email": f"new{i}@test.com"},
+                headers=headers,
+            )
+            for i in range(6)
+        ]
+
+    assert [r.status_code for r in statuses[:5]] == [202] * 5
+    assert statuses[5].status_code == 429
+    assert int(statuses[5].headers["Retry-After"]) >= 1
+    assert get_rejection_counts().get("change_email:account") == 1
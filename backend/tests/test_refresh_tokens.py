@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.refresh_token import RefreshToken
+from app.services.token_service import TokenService
+from app.utils.auth import verify_token
+
+
+def login(client):
+    response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "Password123!"}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_login_returns_refresh_token(client, test_user, db):
+    data = login(client)
+
+    assert data["refresh_token"]
+    assert verify_token(data["access_token"])["sub"] == str(test_user.id)
+    # Only the hash is stored
+    stored = db.query(RefreshToken).one()
+    assert stored.token_hash != data["refresh_token"]
+    assert len(stored.token_hash) == 64
+
+
+def test_refresh_rotates_token(client, test_user, db):
+    first = login(client)["refresh_token"]
+
+    response = client.post("/api/auth/refresh", json={"refresh_token": first})
+    assert response.status_code == 200
+    second = response.json()["refresh_token"]
+    assert second != first
+    assert verify_token(response.json()["access_token"])["sub"] == str(test_user.id)
+
+    # The old token cannot be replayed
+    response = client.post("/api/auth/refresh", json={"refresh_token": first})
+    assert response.status_code == 401
+    assert db.query(RefreshToken).count() == 1
+
+
+def test_refresh_rejected_for_inactive_user(client, test_user, db):
+    token = login(client)["refresh_token"]
+    test_user.is_active = False
+    db.commit()
+
+    response = client.post("/api/auth/refresh", json={"refresh_token": token})
+    assert response.status_code == 403
+
+
+def test_logout_revokes_token(client, test_user):
+    token = login(client)["refresh_token"]
+
+    assert client.post("/api/auth/logout", json={"refresh_token": token}).status_code == 200
+    assert client.post("/api/auth/refresh", json={"refresh_token": token}).status_code == 401
+
+
+def test_purge_expired_in_batches(db, test_user):
+    expired = datetime.utcnow() - timedelta(minutes=1)
+    for i in range(5):
+        db.add(RefreshToken(user_id=test_user.id, token_hash=f"{i:064d}", expires_at=expired))
+    TokenService.issue_refresh_token(db, test_user.id)
+
+    assert TokenService.purge_expired(db, batch_size=2) == 5
+    assert db.query(RefreshToken).count() == 1
+
+
+def test_concurrent_refresh_with_same_token(client, test_user, db, monkeypatch):
+    token = login(client)["refresh_token"]
+    other = sessionmaker(bind=db.get_bind())()
+    raced = []
+    execute = db.execute
+
+    def execute_then_race(statement, *args, **kwargs):
+        # The other request rotates the token right after this one looked it up
+        result = execute(statement, *args, **kwargs)
+        if statement.is_select and not raced:
+            # Read the lookup out first so SQLite lets the other session write
+            result = result.freeze()
+            raced.append(TokenService.rotate_refresh_token(other, token))
+            return result()
+        return result
+
+    monkeypatch.setattr(db, "execute", execute_then_race)
+    try:
+        response = client.post("/api/auth/refresh", json={"refresh_token": token})
+    finally:
+        other.close()
+    assert response.status_code == 401
+    assert len(raced) == 1
+    # Only the winner's new token exists
+    assert db.query(RefreshToken).count() == 1
+
+
+@pytest.mark.parametrize("method, url, expected", [
+    ("put", "/api/profile/change-password", 204),
+    ("post", "/api/auth/change-password", 200),
+])
+def test_password_change_revokes_refresh_tokens(client, test_user, db, method, url, expected):
+    data = login(client)
+    response = getattr(client, method)(
+        url,
+        json={"current_password": "Password123!", "new_password": "NewPassword123!"},
+        headers={"Authorization": f"Bearer {data['access_token']}"}
+    )
+    assert response.status_code == expected
+    assert client.post("/api/auth/refresh", json={"refresh_token": data["refresh_token"]}).status_code == 401
+    assert db.query(RefreshToken).count() == 0
@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from app.models.user import User
+from app.routes.auth import _integrity_error_message
+
+
+def signup(client, **overrides):
+    payload = {
+        "email": "student@example.com",
+        "full_name": "Student One",
+        "password": "Password123!",
+        "is_university_student": True,
+        "student_id": "12345",
+    }
+    payload.update(overrides)
+    with patch("app.routes.auth.send_registration_confirmation"):
+        return client.post("/api/auth/register", json=payload)
+
+
+def test_register_checks_uniqueness_in_one_query(client, db):
+    statements = []
+    def count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "users" in statement:
+            statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = signup(client)
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert response.status_code == 201
+    # One uniqueness check, plus the refresh after the insert
+    assert len(statements) == 2
+
+
+def test_register_reports_each_conflict(client):
+    assert signup(client).status_code == 201
+
+    response = signup(client, student_id="54321")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+    response = signup(client, email="other@example.com")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Student ID already registered"
+
+
+def test_non_students_do_not_collide(client):
+    for email in ("guest1@example.com", "guest2@example.com"):
+        response = signup(
+            client,
+            email=email,
+            is_university_student=False,
+            student_id=None,
+            national_id="AB12345" if email.startswith("guest1") else "CD67890",
+        )
+        assert response.status_code == 201
+
+    response = signup(
+        client,
+        email="guest3@example.com",
+        is_university_student=False,
+        student_id=None,
+        national_id="AB12345",
+    )
+    assert response.json()["detail"] == "National ID already registered"
+
+
+def test_integrity_error_is_mapped(db, test_user):
+    db.add(User(email=test_user.email, hashed_password="x", full_name="Dup"))
+    with pytest.raises(IntegrityError) as exc_info:
+        db.commit()
+    db.rollback()
+
+    assert _integrity_error_message(exc_info.value) == "Email already registered"
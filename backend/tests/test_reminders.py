@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from app.models.event import Event
+from app.models.registration import Registration
+from app.models.reminder import ReminderDispatch
+from app.models.user import User
+from app.services.reminder_service import ReminderScheduler, event_start
+from app.utils.send_budget import SendBudget
+
+
+NOW = datetime(2027, 3, 1, 12, 0)
+
+
+class Outbox:
+    def __init__(self, fail_after=None):
+        self.sent = []
+        self.fail_after = fail_after
+
+    def __call__(self, to_email, subject, html, text):
+        if self.fail_after is not None and len(self.sent) >= self.fail_after:
+            raise RuntimeError("transport down")
+        self.sent.append((to_email, subject))
+
+
+def add_event(db, starts_at, registrants=5, cancelled=(1,)):
+    creator = User(email=f"creator{starts_at:%H%M}@example.com", full_name="Creator", hashed_password="x")
+    db.add(creator)
+    db.flush()
+    event = Event(
+        title="Workshop", description="Hands-on", location="Lab 1", capacity=100,
+        event_date=datetime.combine(starts_at.date(), datetime.min.time()),
+        event_time=starts_at.strftime("%H:%M:%S"),
+        registration_deadline=starts_at - timedelta(hours=2), creator_id=creator.id,
+    )
+    db.add(event)
+    db.flush()
+    for i in range(registrants):
+        user = User(email=f"r{i}-{event.id}@example.com", full_name=f"Member {i}", hashed_password="x")
+        db.add(user)
+        db.flush()
+        db.add(Registration(user_id=user.id, event_id=event.id, is_cancelled=i in cancelled))
+    db.commit()
+    return event
+
+
+def scheduler(db, outbox, **options):
+    return ReminderScheduler(sessionmaker(bind=db.get_bind()), transport=outbox, budget=SendBudget(0), **options)
+
+
+def test_event_start_combines_date_and_time(db):
+    event = add_event(db, NOW + timedelta(hours=3), registrants=0)
+    assert event_start(event) == NOW + timedelta(hours=3)
+
+
+def test_due_waves_are_sent_once_in_chunks(db, count_queries):
+    event = add_event(db, NOW + timedelta(hours=3))
+    outbox = Outbox()
+
+    with count_queries() as counter:
+        assert scheduler(db, outbox, chunk_size=2).run_once(NOW) == 4
+    assert [to for to, _ in outbox.sent] == [f"r{i}-{event.id}@example.com" for i in (0, 2, 3, 4)]
+    assert outbox.sent[0][1] == "Reminder: Workshop starts in 24 hours"
+    # Two full chunks and the empty one that ends the walk
+    registrant_reads = [s for s in counter.statements if "registrations.id >" in s]
+    assert len(registrant_reads) == 3
+    # Progress is saved once per chunk, not once per message
+    checkpoints = [s for s in counter.statements if s.startswith("UPDATE") and "last_registration_id" in s]
+    assert len(checkpoints) == 2
+
+    # Nothing new until the 1-hour wave is due
+    assert scheduler(db, outbox).run_once(NOW + timedelta(minutes=30)) == 0
+    assert scheduler(db, outbox).run_once(NOW + timedelta(hours=2, minutes=5)) == 4
+    assert outbox.sent[-1][1] == "Reminder: Workshop starts in 1 hour"
+    assert scheduler(db, outbox).run_once(NOW + timedelta(hours=2, minutes=10)) == 0
+
+
+def test_late_events_only_get_the_latest_wave(db):
+    add_event(db, NOW + timedelta(minutes=30), registrants=2, cancelled=())
+    add_event(db, NOW + timedelta(days=3), registrants=2, cancelled=())
+    outbox = Outbox()
+    assert scheduler(db, outbox).run_once(NOW) == 2
+    assert {subject for _, subject in outbox.sent} == {"Reminder: Workshop starts in 1 hour"}
+
+
+def test_restart_resumes_without_resending(db):
+    event = add_event(db, NOW + timedelta(hours=3), registrants=6, cancelled=())
+    outbox = Outbox(fail_after=2)
+    assert scheduler(db, outbox).run_once(NOW) == 2
+
+    progress = db.query(ReminderDispatch).one()
+    assert (progress.sent_count, progress.completed_at, progress.lease_expires_at) == (2, None, None)
+
+    outbox.fail_after = None
+    assert scheduler(db, outbox).run_once(NOW) == 4
+    recipients = [to for to, _ in outbox.sent]
+    assert recipients == [f"r{i}-{event.id}@example.com" for i in range(6)]
+
+
+def test_wave_held_by_another_worker_is_skipped(db):
+    add_event(db, NOW + timedelta(hours=3), registrants=2, cancelled=())
+    outbox = Outbox()
+    busy = scheduler(db, outbox)
+    event_id = db.query(Event.id).scalar()
+    assert busy._claim(db, event_id, "24h") is not None
+
+    assert scheduler(db, outbox).run_once(NOW) == 0
+    assert outbox.sent == []
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+from app.schemas.content import AnnouncementCreate, AnnouncementUpdate
+from app.schemas.event import EventCreate, EventUpdate
+from app.services.content_service import ContentService
+from app.services.event_service import EventService
+from app.services.search_service import SearchService
+
+
+def create_event(db, title, description):
+    return EventService.create_event(db, EventCreate(
+        title=title, description=description, location="Main hall", capacity=20,
+        event_date=datetime.utcnow() + timedelta(days=10),
+        registration_deadline=datetime.utcnow() + timedelta(days=5),
+    ), admin_id=1)
+
+
+def search(client, q, **params):
+    response = client.get("/api/search/", params={"q": q, **params})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_search_ranks_title_above_description(client, db):
+    body_match = create_event(db, "Networking night", "Bring questions about dropshipping")
+    title_match = create_event(db, "Dropshipping workshop", "Hands-on session")
+    create_event(db, "Career fair", "Meet employers")
+
+    results = search(client, "dropshipping")["results"]
+    assert [(r["kind"], r["id"]) for r in results] == [("event", title_match.id), ("event", body_match.id)]
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_search_matches_prefixes_and_stems(client, db):
+    event = create_event(db, "Marketing masterclass", "Learn how funnels convert visitors")
+    assert [r["id"] for r in search(client, "market")["results"]] == [event.id]
+    assert [r["id"] for r in search(client, "funnel")["results"]] == [event.id]
+    assert search(client, "!!!")["results"] == []
+
+
+def test_index_follows_writes(client, db):
+    event = create_event(db, "Pitch competition", "Startups meet judges")
+    announcement = ContentService.create_announcement(
+        db, AnnouncementCreate(title="Pitch results", content="Winners announced"), author_id=1
+    )
+    assert {r["kind"] for r in search(client, "pitch")["results"]} == {"event", "announcement"}
+    assert [r["kind"] for r in search(client, "pitch", kind="announcement")["results"]] == ["announcement"]
+
+    EventService.update_event(db, event.id, EventUpdate(title="Demo day"))
+    assert [r["kind"] for r in search(client, "pitch")["results"]] == ["announcement"]
+    assert [r["id"] for r in search(client, "demo")["results"]] == [event.id]
+
+    EventService.delete_event(db, event.id)
+    assert search(client, "demo")["results"] == []
+
+    ContentService.update_announcement(db, announcement.id, AnnouncementUpdate(is_published=False))
+    assert search(client, "pitch")["results"] == []
+    ContentService.update_announcement(db, announcement.id, AnnouncementUpdate(is_published=True))
+    assert len(search(client, "winners")["results"]) == 1
+    ContentService.delete_announcement(db, announcement.id)
+    assert search(client, "winners")["results"] == []
+
+
+def test_search_pagination_and_rebuild(client, db, make_events):
+    make_events(5)  # inserted directly, so not indexed yet
+    assert search(client, "event")["results"] == []
+
+    assert SearchService.rebuild(db) == 5
+    first = search(client, "event", page_size=2)
+    assert len(first["results"]) == 2 and first["has_more"] is True
+    last = search(client, "event", page_size=2, page=3)
+    assert len(last["results"]) == 1 and last["has_more"] is False
+
+
+def test_search_falls_back_to_like_on_other_databases(client, db, monkeypatch):
+    body_match = create_event(db, "Networking night", "Bring questions about Dropshipping")
+    title_match = create_event(db, "Dropshipping 101 workshop", "Hands-on session")
+    create_event(db, "Career fair", "Meet employers")
+    hidden = create_event(db, "Dropshipping archive", "Old session")
+    EventService.update_event(db, hidden.id, EventUpdate(is_active=False))
+    monkeypatch.setattr(db.get_bind().dialect, "name", "mysql")
+
+    body = search(client, "dropshipping")
+    assert [r["id"] for r in body["results"]] == [title_match.id, body_match.id]
+    assert body["results"][0]["score"] > body["results"][1]["score"]
+    assert [r["id"] for r in search(client, "101 workshop")["results"]] == [title_match.id]
+    assert search(client, "!!!")["results"] == []
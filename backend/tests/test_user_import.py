@@ -0,0 +1,81 @@
+import bcrypt
+
+from app.models.user import User
+from app.utils.auth import get_bcrypt_rounds, set_bcrypt_rounds, hash_passwords, HASH_PARALLEL_MIN
+
+
+ROSTER = """email,full_name,is_university_student,student_id,national_id,password
+ada@example.com,Ada Lovelace,true,10001,,Password123!
+taken@example.com,Already There,true,10002,,Password123!
+grace@example.com,Grace Hopper,false,,AB12345,Password123!
+bad-id@example.com,Bad Student Id,true,12,,Password123!
+ada@example.com,Ada Again,true,10004,,Password123!
+alan@example.com,Alan Turing,true,10001,,Password123!
+weak@example.com,Weak Password,true,10005,,password
+"""
+
+
+def upload(client, headers, text, **params):
+    return client.post(
+        "/api/admin/users/import",
+        params=params,
+        files={"file": ("roster.csv", text.encode("utf-8"), "text/csv")},
+        headers=headers
+    )
+
+
+def test_import_creates_valid_rows_and_reports_the_rest(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    create_user("taken@example.com")
+    headers = bearer("admin@example.com")
+    original = get_bcrypt_rounds()
+    try:
+        set_bcrypt_rounds(4)
+        response = upload(client, headers, ROSTER)
+    finally:
+        set_bcrypt_rounds(original)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_rows"] == 7
+    assert body["created"] == 2
+    errors = {error["row"]: error for error in body["errors"]}
+    assert sorted(errors) == [3, 5, 6, 7, 8]
+    assert errors[3]["errors"] == ["Email already registered"]
+    assert "student_id" in errors[5]["errors"][0]
+    assert errors[6]["errors"] == ["Email duplicates row 2"]
+    assert errors[7]["errors"] == ["Student ID duplicates row 2"]
+    assert errors[8]["email"] == "weak@example.com"
+
+    grace = db.query(User).filter(User.email == "grace@example.com").one()
+    assert grace.national_id == "AB12345" and grace.is_active
+    assert bcrypt.checkpw(b"Password123!", grace.hashed_password.encode())
+
+
+def test_import_dry_run_and_bad_files(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    create_user("member@example.com")
+    headers = bearer("admin@example.com")
+
+    response = upload(client, headers, ROSTER, dry_run="true")
+    assert response.status_code == 200
+    assert response.json()["created"] == 0
+    assert len(response.json()["errors"]) == 4
+    assert db.query(User).count() == 2
+
+    assert upload(client, headers, "email,full_name\nx@example.com,X\n").status_code == 400
+    assert upload(client, bearer("member@example.com"), ROSTER).status_code == 403
+
+
+def test_hash_passwords_in_worker_processes():
+    original = get_bcrypt_rounds()
+    try:
+        set_bcrypt_rounds(4)
+        passwords = [f"Password{i}!" for i in range(HASH_PARALLEL_MIN)]
+        hashes = hash_passwords(passwords, workers=2)
+    finally:
+        set_bcrypt_rounds(original)
+    assert len(hashes) == len(passwords)
+    for password, hashed in zip(passwords, hashes):
+        assert hashed.startswith("$2b$04$")
+        assert bcrypt.checkpw(password.encode(), hashed.encode())
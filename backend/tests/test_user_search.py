@@ -0,0 +1,81 @@
+from sqlalchemy import text
+
+from app.models.user import User
+from app.services.user_service import UserService
+
+
+def add_users(db):
+    db.add_all([
+        User(email="alice@example.com", full_name="Alice Smith", hashed_password="x", student_id="10001"),
+        User(email="bob@example.com", full_name="Bob Alison", hashed_password="x", student_id="10002", is_active=False),
+        User(email="carol@uni.edu", full_name="Carol Jones", hashed_password="x", national_id="AZE1234"),
+        User(email="dave@example.com", full_name="Dave Brown", hashed_password="x", is_admin=True),
+    ])
+    db.commit()
+
+
+def test_search_matches_each_field_by_prefix(db):
+    add_users(db)
+
+    def emails(**kwargs):
+        return [u.email for u in UserService.search_users(db, **kwargs)[0]]
+
+    assert emails(q="ALI") == ["alice@example.com"]
+    assert emails(q="bob alis") == ["bob@example.com"]
+    assert emails(q="1000") == ["alice@example.com", "bob@example.com"]
+    assert emails(q="aze1") == ["carol@uni.edu"]
+    assert emails(q="1000", is_active=True) == ["alice@example.com"]
+    assert emails(is_admin=True) == ["dave@example.com"]
+    assert emails(q="%") == []
+
+
+def test_keyset_pagination(db):
+    add_users(db)
+    seen, cursor = [], None
+    while True:
+        users, cursor = UserService.search_users(db, after=cursor, limit=3)
+        seen += [u.email for u in users]
+        if cursor is None:
+            break
+    assert len(seen) == 4 and len(set(seen)) == 4
+
+
+def test_prefix_search_uses_the_lower_index(db):
+    add_users(db)
+    query = db.query(User).filter(UserService._match(db, "ali"))
+    compiled = query.statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+    assert "ix_users_email_lower" in plan
+    assert "ix_users_full_name_lower" in plan
+
+
+def test_search_route_is_admin_only(client, db, create_user, bearer):
+    add_users(db)
+    create_user("admin@example.com", is_admin=True)
+    create_user("member@example.com")
+
+    assert client.get("/api/admin/users/search", headers=bearer("member@example.com")).status_code == 403
+
+    headers = bearer("admin@example.com")
+    body = client.get("/api/admin/users/search", params={"q": "carol"}, headers=headers).json()
+    assert [u["email"] for u in body["users"]] == ["carol@uni.edu"]
+    assert body["next_cursor"] is None
+
+    page = client.get("/api/admin/users/search", params={"limit": 2}, headers=headers).json()
+    assert len(page["users"]) == 2 and page["next_cursor"] == page["users"][-1]["id"]
+
+
+def test_user_list_is_paginated(client, db, create_user, bearer):
+    create_user("admin@example.com", is_admin=True)
+    add_users(db)
+    headers = bearer("admin@example.com")
+
+    first = client.get("/api/admin/users/", params={"limit": 3}, headers=headers)
+    assert first.status_code == 200
+    assert len(first.json()) == 3
+    rest = client.get(
+        "/api/admin/users/", params={"limit": 3, "after": first.headers["x-next-cursor"]}, headers=headers
+    )
+    assert [u["email"] for u in rest.json()] == ["carol@uni.edu", "dave@example.com"]
+    assert "x-next-cursor" not in rest.headers
+    assert client.get("/api/admin/users/", params={"limit": 1000}, headers=headers).status_code == 422
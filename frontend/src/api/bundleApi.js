@@ -0,0 +1,15 @@
+// frontend/src/api/bundleApi.js
+
+import axiosInstance from '../utils/axiosInstance';
+
+/**
+ * Fetches everything the home page needs in a single request.
+ * @param {string[]} pages - Names of page content blocks to include (e.g. ['about_us']).
+ * @returns {Promise<object>} { upcoming_events, announcements, pages }
+ */
+export const fetchHomeBundle = async (pages = []) => {
+    const response = await axiosInstance.get('/api/bundle/home', {
+        params: pages.length ? { pages: pages.join(',') } : {},
+    });
+    return response.data;
+};
@@ -55,6 +55,45 @@ export const fetchEventById = async (eventId) => {
     return response.data;
 };
 
+/**
+ * Fetch several events in one request.
+ * @param {Array<number|string>} eventIds - At most 100 ids.
+ * @returns {Promise<object>} { events: { [id]: event }, missing: [ids] }
+ */
+export const fetchEventsByIds = async (eventIds) => {
+    const response = await axiosInstance.get('/api/events/batch', {
+        params: { ids: eventIds.join(',') },
+    });
+    return response.data;
+};
+
+/**
+ * Fetch everything scheduled on the days [start, end), recurring series included.
+ * Occurrences of a series that nobody has registered for yet have `id: null`.
+ * @param {string} start - First day, YYYY-MM-DD.
+ * @param {string} end - Day after the last one, YYYY-MM-DD (at most 200 days later).
+ * @returns {Promise<object>} { start, end, events: [occurrence] }
+ */
+export const fetchCalendar = async (start, end) => {
+    const response = await axiosInstance.get('/api/events/calendar', {
+        params: { start, end },
+    });
+    return response.data;
+};
+
+/**
+ * Register the current user for one occurrence of a recurring series.
+ * @param {number} seriesId
+ * @param {string} occurrenceAt - The occurrence's `occurrence_at` from the calendar.
+ * @returns {Promise<object>} The registration.
+ */
+export const registerForOccurrence = async (seriesId, occurrenceAt) => {
+    const response = await axiosInstance.post(
+        `/api/registrations/series/${seriesId}/occurrences/${encodeURIComponent(occurrenceAt)}`
+    );
+    return response.data;
+};
+
 /**
  * Delete an event by ID (admin only).
  * @param {number|string} eventId
@@ -140,7 +140,8 @@ export const AuthProvider = ({ children }) => {
                 });
                 
                 // If the call succeeds, the token is valid. Update state.
-                setToken(storedToken);
+                // The interceptor may have refreshed the token during the call above
+                setToken(localStorage.getItem('jwt_token'));
                 setUser(response.data); // This data will contain the fresh 'is_admin' status
                 localStorage.setItem('user', JSON.stringify(response.data)); // Optional: Update stored user data
                 
@@ -148,6 +149,7 @@ export const AuthProvider = ({ children }) => {
                 // Token is expired or invalid (API returned 401/403)
                 console.error("Token validation failed. Logging out.", error);
                 localStorage.removeItem('jwt_token');
+                localStorage.removeItem('refresh_token');
                 localStorage.removeItem('user');
                 setToken(null);
                 setUser(null);
@@ -178,7 +180,13 @@ export const AuthProvider = ({ children }) => {
 
     // Logout Function (remains the same)
     const logout = () => {
+        const refreshToken = localStorage.getItem('refresh_token');
+        if (refreshToken) {
+            // Revoke server-side; failures don't block logging out locally
+            axiosInstance.post('/api/auth/logout', { refresh_token: refreshToken }).catch(() => {});
+        }
         localStorage.removeItem('jwt_token');
+        localStorage.removeItem('refresh_token');
         localStorage.removeItem('user');
         setToken(null);
         setUser(null);
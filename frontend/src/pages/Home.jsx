@@ -5,7 +5,7 @@
 import React, { useState, useEffect } from 'react';
 import Slider from "react-slick";
 import { Link } from "react-router-dom";
-import { fetchEvents } from '../api/eventApi'; 
+import { fetchHomeBundle } from '../api/bundleApi';
 
 // Slider Arrows (Kept exactly as in your original file)
 function SampleNextArrow(props) {
@@ -65,11 +65,11 @@ function Home() {
     useEffect(() => {
         const loadEvents = async () => {
             try {
-                // Fetch all events (we rely on the API to sort them by date ascending)
-                const data = await fetchEvents(true, false); 
+                // One request for the whole home page; events come sorted by date ascending
+                const data = await fetchHomeBundle();
                 
                 // 1. Map and format the data
-                const formattedEvents = data.events.map(formatEventData);
+                const formattedEvents = data.upcoming_events.map(formatEventData);
                 
                 // 2. Filter to only show the next 2 upcoming events
                 // Since the API typically returns events ordered by date ascending, 
@@ -77,6 +77,8 @@ const LoginPage = () => {
       );
       
       const jwtToken = tokenResponse.data.access_token; 
+      // Used by the axios interceptor to renew the short-lived access token
+      localStorage.setItem('refresh_token', tokenResponse.data.refresh_token);
       
       // 💥 CRITICAL CHANGE: 
       // Call login() first to store the token, which activates the interceptor.
@@ -39,6 +39,49 @@ axiosInstance.interceptors.request.use(
     }
 );
 
+// Access tokens are short-lived: on a 401, trade the refresh token for a new pair
+// once and replay the original request. Concurrent 401s share one refresh call.
+let refreshPromise = null;
+
+const refreshAccessToken = async () => {
+    const refreshToken = localStorage.getItem('refresh_token');
+    if (!refreshToken) {
+        throw new Error('No refresh token');
+    }
+    const response = await axios.post(`${API_BASE_URL}/api/auth/refresh`, {
+        refresh_token: refreshToken,
+    });
+    localStorage.setItem('jwt_token', response.data.access_token);
+    localStorage.setItem('refresh_token', response.data.refresh_token);
+    return response.data.access_token;
+};
+
+axiosInstance.interceptors.response.use(
+    (response) => response,
+    async (error) => {
+        const original = error.config;
+        const isAuthCall = original?.url?.startsWith('/api/auth/');
+
+        if (error.response?.status !== 401 || !original || original._retried || isAuthCall) {
+            return Promise.reject(error);
+        }
+
+        original._retried = true;
+        try {
+            refreshPromise = refreshPromise || refreshAccessToken();
+            await refreshPromise;
+        } catch (refreshError) {
+            localStorage.removeItem('jwt_token');
+            localStorage.removeItem('refresh_token');
+            return Promise.reject(error);
+        } finally {
+            refreshPromise = null;
+        }
+        // The request interceptor picks up the new token from Local Storage
+        return axiosInstance(original);
+    }
+);
+
 
 export default axiosInstance;
 